@@ -7,4 +7,4 @@ set -e
 
 # mitmdump
 . /venv/bin/activate
-mitmdump -s load_mitm.py --ssl-insecure --set hardump=true
\ No newline at end of file
+mitmdump -s load_mitm.py --ssl-insecure --set hardump=true --set har_stream=true
\ No newline at end of file
@@ -4,12 +4,14 @@ from mitmproxy import ctx
 
 from sw_injector import SWInjector
 from save_har import SaveHAR
+from metrics import Metrics
 
 addons = []
 
 MODULE_MAPPING = {
     "LMS_PROXY_SW_INJECTOR": SWInjector,
     "LMS_PROXY_SAVEHAR": SaveHAR,
+    "LMS_PROXY_METRICS": Metrics,
 }
 
 
@@ -0,0 +1,174 @@
+"""Live metrics of the proxy addons, in the Prometheus text format.
+
+The addons record what they do in the counters and histograms of this
+module; the Metrics addon serves them, with the state of the HAR sessions
+read from the SaveHAR addon at the time of the scrape, on
+{TEST_DOMAIN}/metrics.
+"""
+
+import threading
+
+from mitmproxy import ctx
+from mitmproxy import http
+
+TEST_DOMAIN = "<PLACEHOLDER>"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = tuple(1024 * 4**i for i in range(10))
+
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Monotonic count, optionally by the value of one label."""
+
+    def __init__(self, name: str, help: str, label: str | None = None) -> None:
+        self.name = name
+        self.help = help
+        self.label = label
+        self.values: dict[str | None, float] = {}
+        self.lock = threading.Lock()
+
+    def inc(self, amount: float = 1, label: str | None = None) -> None:
+        with self.lock:
+            self.values[label] = self.values.get(label, 0) + amount
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self.lock:
+            values = dict(self.values) or {None: 0}
+        for label, value in values.items():
+            labels = {} if self.label is None else {self.label: label}
+            lines.append(f"{self.name}{_labels(labels)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    """Distribution of observed values over fixed buckets."""
+
+    def __init__(self, name: str, help: str, buckets: tuple) -> None:
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets) + (float("inf"),)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self.lock:
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self.counts[i] += 1
+                    break
+            self.sum += value
+            self.count += 1
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self.lock:
+            cumulative = 0
+            for bound, count in zip(self.buckets, self.counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{le="{_number(bound)}"}} {cumulative}')
+            lines.append(f"{self.name}_sum {_number(self.sum)}")
+            lines.append(f"{self.name}_count {self.count}")
+        return lines
+
+
+def _gauge(name: str, help: str, samples: list[tuple[dict, float]]) -> list[str]:
+    lines = [f"# HELP {name} {help}", f"# TYPE {name} gauge"]
+    for labels, value in samples:
+        lines.append(f"{name}{_labels(labels)} {_number(value)}")
+    return lines
+
+
+HAR_EXPORT_SECONDS = Histogram(
+    "savehar_export_seconds", "Time to write a HAR file.", LATENCY_BUCKETS
+)
+HAR_EXPORT_BYTES = Histogram(
+    "savehar_export_bytes", "Size of the HAR files written, compressed.", SIZE_BUCKETS
+)
+HAR_EXPORT_ERRORS = Counter("savehar_export_errors_total", "HAR saves that failed.")
+SCRIPT_ATTRS_SECONDS = Histogram(
+    "savehar_script_attrs_seconds",
+    "Time from submitting a script for attribute extraction to its result, queueing included.",
+    LATENCY_BUCKETS,
+)
+INJECTIONS = Counter(
+    "swinjector_injections_total", "HTML responses the service worker was injected in."
+)
+INJECTION_SECONDS = Histogram(
+    "swinjector_injection_seconds", "Time to parse and rewrite an HTML response.", LATENCY_BUCKETS
+)
+INJECTION_NO_HEAD = Counter(
+    "swinjector_no_head_total", "HTML responses without a head tag to inject in."
+)
+INSTRUMENTS = (
+    HAR_EXPORT_SECONDS,
+    HAR_EXPORT_BYTES,
+    HAR_EXPORT_ERRORS,
+    SCRIPT_ATTRS_SECONDS,
+    INJECTIONS,
+    INJECTION_SECONDS,
+    INJECTION_NO_HEAD,
+)
+
+
+def _savehar_lines(savehar) -> list[str]:
+    # state of the sessions, as the addon holds it now
+    sessions = []
+    flows = []
+    num_bytes = []
+    for worker_key, buffer in savehar.flows.items():
+        flows.append((dict(worker=worker_key, mode="memory"), len(buffer.flows)))
+        num_bytes.append((dict(worker=worker_key), buffer.bytes))
+    for worker_key, writer in savehar.writers.items():
+        flows.append((dict(worker=worker_key, mode="disk"), writer.num_entries))
+    sessions.append((dict(mode="memory"), len(savehar.flows)))
+    sessions.append((dict(mode="disk"), len(savehar.writers)))
+    lines = _gauge("savehar_sessions", "HAR sessions started and not saved yet.", sessions)
+    lines += _gauge("savehar_buffered_flows", "Flows of the HAR session of a worker.", flows)
+    lines += _gauge(
+        "savehar_buffered_bytes", "Bytes a worker's session holds in memory.", num_bytes
+    )
+    evictions = Counter("savehar_evictions_total", "HAR sessions evicted, by reason.", "reason")
+    evictions.values = dict(savehar.evictions)
+    return lines + evictions.render()
+
+
+def render(savehar=None) -> str:
+    """All metrics, in the Prometheus text format."""
+    lines = []
+    if savehar is not None:
+        lines += _savehar_lines(savehar)
+    for instrument in INSTRUMENTS:
+        lines += instrument.render()
+    return "\n".join(lines) + "\n"
+
+
+class Metrics:
+    """mitmproxy addon serving the metrics of the other addons"""
+
+    def __init__(self) -> None:
+        self.metrics_req_url: str = f"{TEST_DOMAIN}/metrics"
+
+    def request(self, flow: http.HTTPFlow) -> None:
+        if self.metrics_req_url not in flow.request.url:
+            return
+        body = render(ctx.master.addons.get("savehar"))
+        flow.response = http.Response.make(200, body, {"Content-Type": CONTENT_TYPE})
@@ -3,11 +3,24 @@ source: https://github.com/mitmproxy/mitmproxy/blob/main/mitmproxy/addons/saveha
 """
 
 
+import asyncio
 import base64
+import collections
+import hashlib
 import json
 import logging
-import zlib
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
 from collections.abc import Sequence
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from datetime import timezone
 from typing import Any
@@ -22,22 +35,272 @@ from mitmproxy import flowfilter
 from mitmproxy import http
 from mitmproxy import types
 from mitmproxy import version
-from mitmproxy.connection import Server
 from mitmproxy.coretypes.multidict import _MultiDict
 from mitmproxy.log import ALERT
 from mitmproxy.utils import human
 from mitmproxy.utils import strutils
 
 from utils.script_attributes import attributes
+import metrics
+import sig_har
+from sig_blobs import BlobStore
+from sig_cache import SigCache
+from sig_libdb import LibraryDB
 
 logger = logging.getLogger(__name__)
 
 
 TEST_DOMAIN = "<PLACEHOLDER>"
+# bump whenever utils.script_attributes changes the signatures it produces
+SCRIPT_ATTRS_VERSION = "script-attributes-1"
+# signature version of the sicilian_sig of utils.script_attributes, see sicilian.HASH_SCHEMES
+SIG_VERSION = "sicilian-1"
+# bytes read at a time when compressing a streamed HAR file
+COMPRESS_CHUNK = sig_har.BLOCK_SIZE
+# script attribute extractions kept, by hash of the script
+SCRIPT_ATTRS_MEMO_SIZE = 4096
+# seconds between two looks for sessions past har_session_ttl
+SWEEP_INTERVAL = 10.0
+EVICTIONS = ("expired", "replaced", "spilled_worker", "spilled_global")
+# threads writing response bodies to the blob store, apart from the export
+# threads which wait for the writes of the entries they save
+BLOB_WRITERS = 4
+# threads looking up the signature cache and handing scripts to the extraction
+# pool (extracting them, without one), apart from the export threads which
+# wait for the attributes of the entries they save
+ATTRS_THREADS = 2
+
+
+def extract_script_attrs(script: str, ast_attrs: dict | None = None) -> dict:
+    """Attributes of a script, in the extraction pool.
+
+    Args:
+        script: JavaScript source
+        ast_attrs: its signatures, when already known from the signature cache
+    """
+    static_attrs = attributes.extract_static_attrs(script)
+    if ast_attrs is None:
+        ast_attrs = attributes.extract_ast_attrs(script)
+    return dict(
+        sicilian_sig=ast_attrs["sicilian_sig"],
+        sicilian_sig_noliteral=ast_attrs["sicilian_sig_noliteral"],
+        keywords=static_attrs["keywords"],
+        struct_raw=static_attrs["struct_raw"],
+    )
+
+
+def _attrs_future(entry: dict) -> Future | None:
+    # script attributes of an entry still to be resolved, see SaveHAR.flow_record
+    attrs = entry["response"].get("content", {}).get("script_attrs")
+    return attrs if isinstance(attrs, Future) else None
+
+
+def _is_ready(entry: dict) -> bool:
+    # whether the work flow_record started for an entry is done
+    content = entry["response"].get("content", {})
+    for value in (content.get("script_attrs"), content.get("_blob")):
+        if isinstance(value, Future) and not value.done():
+            return False
+    return True
+
+
+def _chain(source: Future, target: Future) -> None:
+    # the outcome of a done future into another one
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
+
+
+def har_log(entries: list[dict]) -> dict:
+    return {
+        "log": {
+            "version": "1.2",
+            "creator": {
+                "name": "mitmproxy",
+                "version": version.VERSION,
+                "comment": "",
+            },
+            "pages": [],
+            "entries": entries,
+        }
+    }
+
+
+class FlowRecord:
+    """The parts of the HAR entry of a completed flow, without the flow.
+
+    Made by SaveHAR.flow_record as soon as a flow completes, so that the
+    flow and the bodies it holds are freed: the request and response
+    parts of the entry are kept as they go in the HAR (headers, cookies,
+    sizes, form data), a script response only keeps the extraction of
+    its attributes and a body stored in the blob store only its write.
+    Connect and TLS times are kept apart, as whether they count depends
+    on the entries before (see SaveHAR.record_entry).
+    """
+
+    __slots__ = (
+        "server_id",
+        "connect",
+        "ssl",
+        "send",
+        "wait",
+        "receive",
+        "started",
+        "request",
+        "response",
+        "server_ip",
+        "websocket_messages",
+        "size",
+    )
+
+    def __init__(self, **fields: Any) -> None:
+        for name, value in fields.items():
+            setattr(self, name, value)
+
+
+class FlowBuffer:
+    """Flows of a worker kept in memory, as FlowRecords, until its HAR is saved."""
+
+    def __init__(self) -> None:
+        self.flows: list[FlowRecord] = []
+        self.bytes = 0
+        self.last_seen = time.monotonic()
+
+    def add(self, record: FlowRecord) -> None:
+        self.flows.append(record)
+        self.bytes += record.size
+        self.last_seen = time.monotonic()
+
+
+class HarWriter:
+    """HAR file written entry by entry, as the flows of a worker complete.
+
+    Entries are appended to a temporary file next to the HAR files, so
+    that no flow is kept in memory until the HAR is saved. An entry whose
+    script attributes are still being extracted, or whose body is still
+    being written to the blob store, waits with the entries after it
+    until they are done. `finish` writes the entries left,
+    closes the document and moves the file into place, compressing it
+    first if asked to.
+
+    Args:
+        tmp_path: where the entries are written
+        resolve: SaveHAR.resolve_entry
+        fmt: one of sig_har.FORMATS
+        index: also write a sidecar index of the entries, see sig_har.HarIndex
+    """
+
+    def __init__(
+        self,
+        tmp_path: Path,
+        resolve: Callable[[dict, float | None], None],
+        fmt: str = "pretty",
+        index: bool = False,
+    ) -> None:
+        self.tmp_path = tmp_path
+        self.resolve = resolve
+        self.fmt = fmt
+        self.index = sig_har.HarIndex(fmt) if index else None
+        # see make_har
+        self.servers_seen: set[str] = set()
+        self.num_entries = 0
+        # see SaveHAR.sweep
+        self.last_seen = time.monotonic()
+        self.pending: collections.deque[dict] = collections.deque()
+        self.file = open(tmp_path, "wb")
+        if fmt == "ndjson":
+            self.offset = self.file.write(sig_har.ndjson_header(har_log([])["log"]))
+            self.indent = self.suffix = b""
+            return
+        # laid out as export_har lays out the same entries
+        prefix, self.indent, self.suffix = sig_har.har_frame(har_log([]), fmt)
+        self.offset = self.file.write(prefix)
+
+    def add(self, entry: dict) -> None:
+        self.last_seen = time.monotonic()
+        self.pending.append(entry)
+        while self.pending and _is_ready(self.pending[0]):
+            self._write(self.pending.popleft(), None)
+
+    def _write(self, entry: dict, deadline: float | None) -> None:
+        self.resolve(entry, deadline)
+        if self.fmt == "ndjson":
+            data = sig_har.ndjson_line(entry)
+        else:
+            if self.num_entries:
+                self.offset += self.file.write(b"," + self.indent)
+            data = sig_har.encode_entry(entry, self.fmt, self.indent)
+        if self.index is not None:
+            self.index.add(self.offset, len(data), entry)
+        self.offset += self.file.write(data)
+        self.num_entries += 1
+
+    def finish(self, path: str, output: dict, deadline: float | None = None) -> dict:
+        """Writes the HAR file to path, durably.
+
+        Args:
+            path: HAR file
+            output: compression, level, threads and index, see SaveHAR._har_output
+            deadline: time.monotonic() until which to wait for script attributes
+
+        Returns:
+            dict: what sig_har.write_har returns
+        """
+        started = time.monotonic()
+        while self.pending:
+            self._write(self.pending.popleft(), deadline)
+        if self.fmt != "ndjson":
+            if self.num_entries:
+                self.file.write(self.suffix)
+            else:
+                # as the document without entries is encoded
+                self.file.seek(0)
+                self.file.truncate()
+                self.file.write(sig_har.encode_json(har_log([]), self.fmt))
+        self._close(self.file)
+        if output["compression"] == "none":
+            os.replace(self.tmp_path, path)
+            sig_har.fsync_dir(path)
+            size = os.path.getsize(path)
+            if self.index is not None:
+                self.index.save(path, size, "none", sig_har.BLOCK_SIZE, [])
+            stats = dict(bytes=size, raw_bytes=size, compression="none")
+        else:
+            with open(self.tmp_path, "rb") as src:
+                stats = sig_har.write_har(
+                    path,
+                    iter(lambda: src.read(COMPRESS_CHUNK), b""),
+                    output["compression"],
+                    output["level"],
+                    output["threads"],
+                    index=self.index,
+                )
+            os.unlink(self.tmp_path)
+        stats["seconds"] = round(time.monotonic() - started, 4)
+        return stats
+
+    def discard(self) -> None:
+        self.file.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _close(f) -> None:
+        f.flush()
+        os.fsync(f.fileno())
+        f.close()
+
 
 class SaveHAR:
     def __init__(self) -> None:
-        self.flows: dict[str, list[flow.Flow]] = {}
+        self.flows: dict[str, FlowBuffer] = {}
+        # with har_stream, or once a buffer went over its cap, instead of flows
+        self.writers: dict[str, HarWriter] = {}
+        # sessions evicted, by reason (see EVICTIONS)
+        self.evictions: collections.Counter[str] = collections.Counter(dict.fromkeys(EVICTIONS, 0))
+        self.last_sweep = time.monotonic()
         self.filt: flowfilter.TFilter | None = None
         self.worker_key_ua_ptrn: re.Pattern = re.compile("worker-lms\/([0-9]{1,2})$")
         # don't think it is possible to add an extra header on every request
@@ -47,29 +310,90 @@ class SaveHAR:
         self.save_har_req_url: str = f"{TEST_DOMAIN}/save-har"
         self.base_har_dir: Path = Path("/root/.mitmproxy/hars")
         self.base_har_dir.mkdir(exist_ok=True)
+        self.sig_cache: SigCache | None = None
+        # the cache is shared by the attrs threads and the export threads
+        self.sig_cache_lock = threading.Lock()
+        self.known_libs: LibraryDB | None = None
+        # response bodies, with har_blobs
+        self.blobs: BlobStore | None = None
+        self.blob_executor: ThreadPoolExecutor | None = None
+        # exports run here, off the event loop, see _export
+        self.executor: ThreadPoolExecutor | None = None
+        # script attributes are extracted here, as soon as a script is seen
+        self.attrs_executor: ProcessPoolExecutor | None = None
+        # and submitted from here, off the event loop, see _extract_attrs
+        self.attrs_threads = ThreadPoolExecutor(
+            max_workers=ATTRS_THREADS, thread_name_prefix="script-attrs"
+        )
+        self.attrs_executor_lock = threading.Lock()
+        # extractions by hash of the script, shared by the event loop and the exports
+        self.attrs_memo: collections.OrderedDict[str, Future] = collections.OrderedDict()
+        self.attrs_lock = threading.Lock()
 
-    def export_har(self, flows: Sequence[flow.Flow], path: types.Path) -> None:
-        """Export flows to an HAR (HTTP Archive) file."""
+    def export_har(
+        self, flows: Sequence[flow.Flow], path: types.Path, output: dict | None = None
+    ) -> dict:
+        """Export flows to an HAR (HTTP Archive) file.
 
-        har = json.dumps(self.make_har(flows), indent=4).encode()
+        Args:
+            flows: flows to export
+            path: HAR file
+            output: format, compression, level, threads and index, see _har_output.
+                Defaults to the options.
 
-        if path.endswith(".zhar"):
-            har = zlib.compress(har, 9)
+        Returns:
+            dict: what sig_har.write_har returns
+        """
+        if output is None:
+            output = self._har_output(path)
+        started = time.monotonic()
+        har = self.make_har(flows)
+        index = sig_har.HarIndex(output["fmt"]) if output["index"] else None
+        # written aside and renamed, so that the file is whole once it exists
+        stats = sig_har.write_har(
+            path,
+            sig_har.encode_har(har, output["fmt"], index),
+            output["compression"],
+            output["level"],
+            output["threads"],
+            index=index,
+        )
+        stats["seconds"] = round(time.monotonic() - started, 4)
+        return stats
 
-        with open(path, "wb") as f:
-            f.write(har)
+    def _har_output(self, path: types.Path) -> dict:
+        level = ctx.options.har_compression_level
+        return dict(
+            fmt=ctx.options.har_format,
+            compression=sig_har.compression_for(path, ctx.options.har_compression),
+            level=None if level < 0 else level,
+            threads=ctx.options.har_compress_threads or None,
+            index=ctx.options.har_index,
+        )
 
-        logging.log(ALERT, f"HAR file saved ({human.pretty_size(len(har))} bytes).")
+    def _log_export(self, path: Path, stats: dict) -> None:
+        metrics.HAR_EXPORT_SECONDS.observe(stats["seconds"])
+        metrics.HAR_EXPORT_BYTES.observe(stats["bytes"])
+        logging.log(
+            ALERT,
+            f"HAR file saved ({human.pretty_size(stats['bytes'])} bytes, "
+            f"{human.pretty_size(stats['raw_bytes'])} before {stats['compression']} "
+            f"compression, in {stats['seconds']:.2f}s).",
+        )
+        logger.info(json.dumps(dict(event="har_export", path=str(path), **stats)))
 
-    def make_har(self, flows: Sequence[flow.Flow]) -> dict:
+    def make_har(self, flows: Sequence[flow.Flow | FlowRecord]) -> dict:
         entries = []
         skipped = 0
         # A list of server seen till now is maintained so we can avoid
         # using 'connect' time for entries that use an existing connection.
-        servers_seen: set[Server] = set()
+        servers_seen: set[str] = set()
+        deadline = time.monotonic() + ctx.options.script_attrs_wait
 
         for f in flows:
-            if isinstance(f, http.HTTPFlow):
+            if isinstance(f, FlowRecord):
+                entries.append(self.record_entry(f, servers_seen))
+            elif isinstance(f, http.HTTPFlow):
                 entries.append(self.flow_entry(f, servers_seen))
             else:
                 skipped += 1
@@ -77,18 +401,9 @@ class SaveHAR:
         if skipped > 0:
             logger.info(f"Skipped {skipped} flows that weren't HTTP flows.")
 
-        return {
-            "log": {
-                "version": "1.2",
-                "creator": {
-                    "name": "mitmproxy",
-                    "version": version.VERSION,
-                    "comment": "",
-                },
-                "pages": [],
-                "entries": entries,
-            }
-        }
+        for entry in entries:
+            self.resolve_entry(entry, deadline)
+        return har_log(entries)
 
     def load(self, l):
         l.add_option(
@@ -101,6 +416,222 @@ class SaveHAR:
             For mitmdump, enabling this option will mean that flows are kept in memory.
             """,
         )
+        l.add_option(
+            "har_stream",
+            bool,
+            False,
+            """
+            Write the HAR entry of every flow to a temporary file as soon as it completes,
+            instead of keeping the flows in memory until the HAR is saved.
+            """,
+        )
+        l.add_option(
+            "har_session_ttl",
+            float,
+            1800.0,
+            """
+            Seconds without a flow after which the session of a worker that never asked
+            for its HAR (e.g. a crawler that crashed) is dropped. 0 to keep sessions forever.
+            """,
+        )
+        l.add_option(
+            "har_worker_max_flows",
+            int,
+            5000,
+            """
+            Flows kept in memory per worker, the session is then written to disk as with
+            har_stream. 0 for no limit.
+            """,
+        )
+        l.add_option(
+            "har_worker_max_bytes",
+            str,
+            "256m",
+            """
+            Bytes of flow records kept in memory per worker (e.g. 256m), the session is then
+            written to disk as with har_stream. 0 for no limit.
+            """,
+        )
+        l.add_option(
+            "har_max_flows",
+            int,
+            50000,
+            """
+            Flows kept in memory for all workers, the largest sessions are then written
+            to disk. 0 for no limit.
+            """,
+        )
+        l.add_option(
+            "har_max_bytes",
+            str,
+            "1g",
+            """
+            Bytes of flow records kept in memory for all workers (e.g. 1g), the largest sessions
+            are then written to disk. 0 for no limit.
+            """,
+        )
+        l.add_option(
+            "har_format",
+            str,
+            "pretty",
+            """
+            Format of the HAR files: indented JSON, JSON on one line, or NDJSON with
+            the log on the first line and one entry per line.
+            """,
+            choices=sig_har.FORMATS,
+        )
+        l.add_option(
+            "har_compression",
+            str,
+            "auto",
+            """
+            Compression of the HAR files, auto for zlib when the name ends with .zhar.
+            """,
+            choices=("auto",) + sig_har.COMPRESSIONS,
+        )
+        l.add_option(
+            "har_compression_level",
+            int,
+            -1,
+            """
+            Compression level (lzma preset), -1 for 9 with zlib and gzip, 6 with lzma.
+            """,
+        )
+        l.add_option(
+            "har_compress_threads",
+            int,
+            0,
+            """
+            Threads compressing the blocks of a HAR file, 0 for the number of CPUs.
+            """,
+        )
+        l.add_option(
+            "har_index",
+            bool,
+            False,
+            """
+            Write a sidecar index next to every HAR file (name.idx) with the byte offsets,
+            URL, MIME type and signature of its entries, for sig_har.HarReader to read
+            single entries without loading the file. Compressed files are then written
+            in blocks that decompress independently.
+            """,
+        )
+        l.add_option(
+            "har_export_workers",
+            int,
+            4,
+            """
+            Threads exporting HAR files, so that saves of different workers run
+            concurrently and do not hold up the traffic of the proxy.
+            """,
+        )
+        l.add_option(
+            "script_attrs_workers",
+            int,
+            2,
+            """
+            Processes extracting the attributes of scripts as soon as they are seen.
+            0 to extract them in threads of the proxy process instead, which compete
+            with the traffic for the interpreter.
+            """,
+        )
+        l.add_option(
+            "script_attrs_wait",
+            float,
+            30.0,
+            """
+            Seconds a HAR save waits for the script attributes still being extracted,
+            scripts not done by then are marked as pending.
+            """,
+        )
+        l.add_option(
+            "har_blobs",
+            str,
+            "",
+            """
+            Directory of a content-addressed store shared by all HAR files, where the
+            response bodies are written once each. Entries then carry the SHA-256 of
+            their body as content._blob (see sig_blobs.py). Empty to leave bodies out.
+            """,
+        )
+        l.add_option(
+            "sig_cache",
+            str,
+            "/root/.mitmproxy/sig_cache.sqlite",
+            """
+            Cache of script signatures keyed by script content, shared with other processes.
+            Set to an empty string to disable.
+            """,
+        )
+        l.add_option(
+            "known_libs",
+            str,
+            "",
+            """
+            Database of the signatures of known library releases (see sig_libdb.py),
+            scripts found in it are tagged with their releases. Empty to disable.
+            """,
+        )
+
+    def configure(self, updated):
+        if "sig_cache" in updated:
+            if self.sig_cache is not None:
+                self.sig_cache.close()
+                self.sig_cache = None
+            if ctx.options.sig_cache:
+                self.sig_cache = SigCache(
+                    ctx.options.sig_cache, SCRIPT_ATTRS_VERSION, check_same_thread=False
+                )
+        if "known_libs" in updated:
+            if self.known_libs is not None:
+                self.known_libs.close()
+                self.known_libs = None
+            if ctx.options.known_libs:
+                try:
+                    known_libs = LibraryDB(ctx.options.known_libs)
+                except (OSError, ValueError) as e:
+                    raise exceptions.OptionsError(str(e)) from e
+                if known_libs.version != SIG_VERSION:
+                    known_libs.close()
+                    raise exceptions.OptionsError(
+                        f"{ctx.options.known_libs} holds {known_libs.version} signatures, "
+                        f"not {SIG_VERSION}"
+                    )
+                self.known_libs = known_libs
+        for name in ("har_worker_max_bytes", "har_max_bytes"):
+            if name in updated:
+                try:
+                    human.parse_size(getattr(ctx.options, name))
+                except ValueError as e:
+                    raise exceptions.OptionsError(f"{name}: {e}") from e
+        if "har_blobs" in updated:
+            self.blobs = None
+            if self.blob_executor is not None:
+                # writes already submitted still complete
+                self.blob_executor.shutdown(wait=False)
+                self.blob_executor = None
+            if ctx.options.har_blobs:
+                try:
+                    self.blobs = BlobStore(ctx.options.har_blobs)
+                except OSError as e:
+                    raise exceptions.OptionsError(str(e)) from e
+                self.blob_executor = ThreadPoolExecutor(
+                    max_workers=BLOB_WRITERS, thread_name_prefix="har-blobs"
+                )
+        if "har_export_workers" in updated:
+            if ctx.options.har_export_workers < 1:
+                raise exceptions.OptionsError("har_export_workers must be at least 1")
+            if self.executor is not None:
+                # exports already submitted still complete
+                self.executor.shutdown(wait=False)
+            self.executor = ThreadPoolExecutor(
+                max_workers=ctx.options.har_export_workers, thread_name_prefix="har-export"
+            )
+        if "script_attrs_workers" in updated:
+            if ctx.options.script_attrs_workers < 0:
+                raise exceptions.OptionsError("script_attrs_workers must not be negative")
+            with self.attrs_executor_lock:
+                self._start_attrs_executor()
 
     # def configure(self, updated):
     #     if "save_stream_filter" in updated:
@@ -116,35 +647,162 @@ class SaveHAR:
     #         if not ctx.options.hardump:
     #             self.flows = {}
 
-    def _get_worker_key(self, flow: http.HTTPFlow) -> None:
-        # determine the worker key from a header
+    def _get_worker_key(self, flow: http.HTTPFlow) -> str | None:
+        # determine the worker key from a header, None for clients that are not workers
         ua = flow.request.headers.get("User-Agent", "lms-00")
-        worker = self.worker_key_ua_ptrn.search(ua).groups()[0]
-        return worker
+        match = self.worker_key_ua_ptrn.search(ua)
+        return match.groups()[0] if match else None
+
+    async def _export(self, func, *args):
+        # the flow of the control request waits, the other flows go on
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
 
-    def request(self, flow: http.HTTPFlow) -> None:
+    async def request(self, flow: http.HTTPFlow) -> None:
         print(f"request url {flow.request.url}")
+        self.sweep()
         if self.start_har_req_url in flow.request.url:
             worker_key = self._get_worker_key(flow)
-            self.flows[worker_key] = []
+            if worker_key is None:
+                self._reject_control(flow)
+                return
+            if worker_key in self.writers or worker_key in self.flows:
+                # the worker restarted without saving
+                self._evict(worker_key, "replaced")
+            if ctx.options.har_stream:
+                self.writers[worker_key] = self._new_writer(worker_key)
+            else:
+                self.flows[worker_key] = FlowBuffer()
             flow.response = http.Response.make(200, "OK")
         if self.save_har_req_url in flow.request.url:
             worker_key = self._get_worker_key(flow)
+            if worker_key is None:
+                self._reject_control(flow)
+                return
             fname = f"{worker_key}-{flow.request.query['fname']}"
             path = self.base_har_dir / fname
-            flows = self.flows.get(worker_key, [])
+            if worker_key in self.writers:
+                await self._finish_writer(worker_key, path, flow)
+                return
+            # taken before exporting, flows completing meanwhile are not saved
+            buffer = self.flows.pop(worker_key, None)
+            flows = buffer.flows if buffer is not None else []
             print(f"----HAR SAVE REQUESTED")
             print(f"----  FOR worker={worker_key}")
             print(f"----  num_flows={len(flows)}")
             print(f"----  path={path}")
             try:
-                self.export_har(flows, str(path))
-                if worker_key in self.flows:
-                    del self.flows[worker_key]
+                output = self._har_output(str(path))
+                stats = await self._export(self.export_har, flows, str(path), output)
+                self._log_export(path, stats)
                 flow.response = http.Response.make(200, "OK")
             except Exception as exc:
+                metrics.HAR_EXPORT_ERRORS.inc()
                 flow.response = http.Response.make(500, f"Err: {exc}")
 
+    def _reject_control(self, flow: http.HTTPFlow) -> None:
+        # only workers have sessions, see _get_worker_key
+        logger.warning(f"Rejected {flow.request.path} from a client that is not a worker.")
+        flow.response = http.Response.make(400, "Not a worker")
+
+    async def _finish_writer(self, worker_key: str, path: Path, flow: http.HTTPFlow) -> None:
+        writer = self.writers.pop(worker_key)
+        print(f"----HAR SAVE REQUESTED")
+        print(f"----  FOR worker={worker_key}")
+        print(f"----  num_entries={writer.num_entries}")
+        print(f"----  path={path}")
+        try:
+            output = self._har_output(str(path))
+            deadline = time.monotonic() + ctx.options.script_attrs_wait
+            stats = await self._export(writer.finish, str(path), output, deadline)
+            self._log_export(path, stats)
+            flow.response = http.Response.make(200, "OK")
+        except Exception as exc:
+            metrics.HAR_EXPORT_ERRORS.inc()
+            writer.discard()
+            flow.response = http.Response.make(500, f"Err: {exc}")
+
+    def _discard_writer(self, worker_key: str) -> None:
+        writer = self.writers.pop(worker_key, None)
+        if writer is not None:
+            writer.discard()
+
+    def _new_writer(self, worker_key: str) -> HarWriter:
+        # unique, a session started while the previous one is being saved
+        # must not write to (or discard) the file of the one being saved
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.base_har_dir, prefix=f".{worker_key}-", suffix=".har.part"
+        )
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        return HarWriter(
+            tmp_path, self.resolve_entry, ctx.options.har_format, ctx.options.har_index
+        )
+
+    def _evict(self, worker_key: str, reason: str) -> None:
+        """Drops the session of a worker, counting why."""
+        buffer = self.flows.pop(worker_key, None)
+        writer = self.writers.get(worker_key)
+        self._discard_writer(worker_key)
+        self.evictions[reason] += 1
+        if buffer is not None:
+            num_flows = len(buffer.flows)
+        else:
+            num_flows = writer.num_entries if writer is not None else 0
+        rec = dict(event="har_eviction", worker=worker_key, reason=reason, flows=num_flows)
+        logger.warning(json.dumps(rec))
+
+    def _spill(self, worker_key: str, reason: str) -> None:
+        """Moves the buffered flows of a worker to a HarWriter, which takes its next flows."""
+        buffer = self.flows.pop(worker_key)
+        writer = self._new_writer(worker_key)
+        self.writers[worker_key] = writer
+        for record in buffer.flows:
+            self._write_entry(writer, record)
+        self.evictions[reason] += 1
+        logger.info(
+            json.dumps(
+                dict(
+                    event="har_eviction",
+                    worker=worker_key,
+                    reason=reason,
+                    flows=len(buffer.flows),
+                    bytes=buffer.bytes,
+                )
+            )
+        )
+
+    def _enforce_caps(self, worker_key: str) -> None:
+        buffer = self.flows[worker_key]
+        max_flows = ctx.options.har_worker_max_flows
+        max_bytes = human.parse_size(ctx.options.har_worker_max_bytes)
+        over_flows = max_flows and len(buffer.flows) > max_flows
+        if over_flows or (max_bytes and buffer.bytes > max_bytes):
+            self._spill(worker_key, "spilled_worker")
+        max_flows = ctx.options.har_max_flows
+        max_bytes = human.parse_size(ctx.options.har_max_bytes)
+        while self.flows:
+            total_flows = sum(len(b.flows) for b in self.flows.values())
+            total_bytes = sum(b.bytes for b in self.flows.values())
+            if not (max_flows and total_flows > max_flows) and not (
+                max_bytes and total_bytes > max_bytes
+            ):
+                break
+            largest = max(self.flows, key=lambda k: (self.flows[k].bytes, len(self.flows[k].flows)))
+            self._spill(largest, "spilled_global")
+
+    def sweep(self) -> None:
+        """Evicts the sessions idle for longer than har_session_ttl, every SWEEP_INTERVAL."""
+        now = time.monotonic()
+        ttl = ctx.options.har_session_ttl
+        if not ttl or now - self.last_sweep < SWEEP_INTERVAL:
+            return
+        self.last_sweep = now
+        sessions = list(self.flows.items()) + list(self.writers.items())
+        for worker_key, session in sessions:
+            if now - session.last_seen > ttl:
+                self._evict(worker_key, "expired")
+
     def response(self, flow: http.HTTPFlow) -> None:
         # websocket flows will receive a websocket_end,
         # we don't want to persist them here already
@@ -158,14 +816,47 @@ class SaveHAR:
         self._save_flow(flow)
 
     def _save_flow(self, flow: http.HTTPFlow) -> None:
+        self.sweep()
         if ctx.options.hardump:
             flow_matches = self.filt is None or self.filt(flow)
             if flow_matches:
                 worker_key = self._get_worker_key(flow)
+                if worker_key is None:
+                    # e.g. a metrics scrape
+                    return
+                writer = self.writers.get(worker_key)
+                buffer = self.flows.get(worker_key)
                 # only save flow if requested
-                if worker_key not in self.flows:
+                if writer is None and buffer is None:
+                    return
+                try:
+                    record = self.flow_record(flow)
+                except Exception:
+                    # the HAR goes on without the entry, as a failing export would lose them all
+                    logger.exception(f"Skipped flow {flow.request.url}, it could not be converted.")
+                    return
+                if writer is not None:
+                    self._write_entry(writer, record)
                     return
-                self.flows[worker_key].append(flow)
+                buffer.add(record)
+                self._enforce_caps(worker_key)
+
+    def _write_entry(self, writer: HarWriter, record: FlowRecord) -> None:
+        try:
+            writer.add(self.record_entry(record, writer.servers_seen))
+        except Exception:
+            logger.exception(f"Skipped flow {record.request['url']} that could not be written.")
+
+    def done(self) -> None:
+        for worker_key in list(self.writers):
+            self._discard_writer(worker_key)
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+        if self.blob_executor is not None:
+            self.blob_executor.shutdown(wait=True)
+        self.attrs_threads.shutdown(wait=False, cancel_futures=True)
+        if self.attrs_executor is not None:
+            self.attrs_executor.shutdown(wait=False, cancel_futures=True)
 
     # def done(self):
     #     if ctx.options.hardump:
@@ -175,13 +866,51 @@ class SaveHAR:
     #         else:
     #             self.export_har(self.flows, ctx.options.hardump)
 
-    def flow_entry(self, flow: http.HTTPFlow, servers_seen: set[Server]) -> dict:
+    def flow_entry(self, flow: http.HTTPFlow, servers_seen: set[str]) -> dict:
         """Creates HAR entry from flow"""
+        return self.record_entry(self.flow_record(flow), servers_seen)
 
-        if flow.server_conn in servers_seen:
+    def record_entry(self, record: FlowRecord, servers_seen: set[str]) -> dict:
+        """Creates the HAR entry of a FlowRecord, in place of the flow."""
+        if record.server_id in servers_seen:
             connect_time = -1.0
             ssl_time = -1.0
-        elif flow.server_conn.timestamp_tcp_setup:
+        elif record.connect is not None:
+            connect_time = record.connect
+            ssl_time = record.ssl
+            servers_seen.add(record.server_id)
+        else:
+            connect_time = None
+            ssl_time = None
+
+        timings: dict[str, float | None] = {
+            "connect": connect_time,
+            "ssl": ssl_time,
+            "send": record.send,
+            "receive": record.receive,
+            "wait": record.wait,
+        }
+
+        entry: dict[str, Any] = {
+            "startedDateTime": record.started,
+            "time": sum(v for v in timings.values() if v is not None and v >= 0),
+            "request": record.request,
+            "response": record.response,
+            "cache": {},
+            "timings": timings,
+        }
+
+        if record.server_ip is not None:
+            entry["serverIPAddress"] = record.server_ip
+
+        if record.websocket_messages is not None:
+            entry["_resourceType"] = "websocket"
+            entry["_webSocketMessages"] = record.websocket_messages
+        return entry
+
+    def flow_record(self, flow: http.HTTPFlow) -> FlowRecord:
+        """Keeps what the HAR entry of a completed flow needs, see FlowRecord."""
+        if flow.server_conn.timestamp_tcp_setup:
             assert flow.server_conn.timestamp_start
             connect_time = 1000 * (
                 flow.server_conn.timestamp_tcp_setup - flow.server_conn.timestamp_start
@@ -193,7 +922,6 @@ class SaveHAR:
                 )
             else:
                 ssl_time = None
-            servers_seen.add(flow.server_conn)
         else:
             connect_time = None
             ssl_time = None
@@ -214,17 +942,11 @@ class SaveHAR:
         else:
             receive = 0
 
-        timings: dict[str, float | None] = {
-            "connect": connect_time,
-            "ssl": ssl_time,
-            "send": send,
-            "receive": receive,
-            "wait": wait,
-        }
-
         if flow.response:
+            # decoded once, the flow is dropped afterwards
+            content = flow.response.content
             response_body_size = len(flow.response.raw_content) if flow.response.raw_content else 0
-            response_body_decoded_size = len(flow.response.content) if flow.response.content else 0
+            response_body_decoded_size = len(content) if content else 0
             response_body_compression = response_body_decoded_size - response_body_size
             response = {
                 "status": flow.response.status_code,
@@ -249,23 +971,14 @@ class SaveHAR:
             #     response["content"]["encoding"] = "base64"
             # else:
             #     response["content"]["text"] = flow.response.get_text(strict=False)
-            ends_with_js = flow.request.url.endswith(".js")
-            resp_content_type = ""
-            for k, v in flow.response.headers.items():
-                if k.lower() == "content-type":
-                    resp_content_type = v
-            resp_content_type_script = resp_content_type.find("javascript") > -1
-            is_script = ends_with_js or resp_content_type_script
-            if flow.response.content and is_script:
-                script = flow.response.get_text(strict=False)
-                static_attrs = attributes.extract_static_attrs(script)
-                ast_attrs = attributes.extract_ast_attrs(script)
-                response["content"]["script_attrs"] = dict(
-                    sicilian_sig=ast_attrs["sicilian_sig"],
-                    sicilian_sig_noliteral=ast_attrs["sicilian_sig_noliteral"],
-                    keywords=static_attrs["keywords"],
-                    struct_raw=static_attrs["struct_raw"],
-                )
+            if self.blobs is not None and content:
+                # written once for all HAR files (see sig_blobs), off the event
+                # loop, replaced by its digest in resolve_entry
+                response["content"]["_blob"] = self.blob_executor.submit(self.blobs.put, content)
+            script = self._script_text(flow)
+            if script is not None:
+                # replaced by resolve_script_attrs
+                response["content"]["script_attrs"] = self._script_attrs_future(script)
         else:
             response = {
                 "status": 0,
@@ -283,39 +996,31 @@ class SaveHAR:
             if flow.error:
                 response["_error"] = flow.error.msg
 
-        entry: dict[str, Any] = {
-            "startedDateTime": datetime.fromtimestamp(
-                flow.request.timestamp_start, timezone.utc
-            ).isoformat(),
-            "time": sum(v for v in timings.values() if v is not None and v >= 0),
-            "request": {
-                "method": flow.request.method,
-                "url": flow.request.pretty_url,
-                "httpVersion": flow.request.http_version,
-                "cookies": self.format_multidict(flow.request.cookies),
-                "headers": self.format_multidict(flow.request.headers),
-                "queryString": self.format_multidict(flow.request.query),
-                "headersSize": len(str(flow.request.headers)),
-                "bodySize": len(flow.request.content) if flow.request.content else 0,
-            },
-            "response": response,
-            "cache": {},
-            "timings": timings,
+        request = {
+            "method": flow.request.method,
+            "url": flow.request.pretty_url,
+            "httpVersion": flow.request.http_version,
+            "cookies": self.format_multidict(flow.request.cookies),
+            "headers": self.format_multidict(flow.request.headers),
+            "queryString": self.format_multidict(flow.request.query),
+            "headersSize": len(str(flow.request.headers)),
+            "bodySize": len(flow.request.content) if flow.request.content else 0,
         }
+        # what the record holds, roughly: its headers and the data of forms and websockets
+        size = request["headersSize"] + max(0, response["headersSize"])
 
         if flow.request.method in ["POST", "PUT", "PATCH"]:
             params = self.format_multidict(flow.request.urlencoded_form)
-            entry["request"]["postData"] = {
+            request["postData"] = {
                 "mimeType": flow.request.headers.get("Content-Type", ""),
                 "text": flow.request.get_text(strict=False),
                 "params": params,
             }
+            size += len(request["postData"]["text"])
 
-        if flow.server_conn.peername:
-            entry["serverIPAddress"] = str(flow.server_conn.peername[0])
-
-        websocket_messages = []
+        websocket_messages = None
         if flow.websocket:
+            websocket_messages = []
             for message in flow.websocket.messages:
                 if message.is_text:
                     data = message.text
@@ -328,10 +1033,180 @@ class SaveHAR:
                     "data": data,
                 }
                 websocket_messages.append(websocket_message)
+                size += len(data)
 
-            entry["_resourceType"] = "websocket"
-            entry["_webSocketMessages"] = websocket_messages
-        return entry
+        return FlowRecord(
+            server_id=flow.server_conn.id,
+            connect=connect_time,
+            ssl=ssl_time,
+            send=send,
+            wait=wait,
+            receive=receive,
+            started=datetime.fromtimestamp(flow.request.timestamp_start, timezone.utc).isoformat(),
+            request=request,
+            response=response,
+            server_ip=str(flow.server_conn.peername[0]) if flow.server_conn.peername else None,
+            websocket_messages=websocket_messages,
+            size=size,
+        )
+
+    def _script_text(self, flow: http.HTTPFlow) -> str | None:
+        """Source of the script a flow responded with, None if it is not a script."""
+        if not flow.response or not flow.response.content:
+            return None
+        ends_with_js = flow.request.url.endswith(".js")
+        resp_content_type = ""
+        for k, v in flow.response.headers.items():
+            if k.lower() == "content-type":
+                resp_content_type = v
+        resp_content_type_script = resp_content_type.find("javascript") > -1
+        if not (ends_with_js or resp_content_type_script):
+            return None
+        return flow.response.get_text(strict=False)
+
+    def _start_attrs_executor(self) -> None:
+        if self.attrs_executor is not None:
+            self.attrs_executor.shutdown(wait=False)
+            self.attrs_executor = None
+        if ctx.options.script_attrs_workers > 0:
+            # not forked from the threads of the proxy
+            self.attrs_executor = ProcessPoolExecutor(
+                max_workers=ctx.options.script_attrs_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+    def _script_attrs_future(self, script: str) -> Future:
+        """Extraction of the attributes of a script, started on first sight of it."""
+        key = hashlib.sha256(script.encode("utf-8", "surrogatepass")).hexdigest()
+        with self.attrs_lock:
+            future = self.attrs_memo.get(key)
+            if future is not None:
+                self.attrs_memo.move_to_end(key)
+                return future
+            future = self._submit_attrs(script)
+            self.attrs_memo[key] = future
+            while len(self.attrs_memo) > SCRIPT_ATTRS_MEMO_SIZE:
+                self.attrs_memo.popitem(last=False)
+        # outside of the lock, a future already done runs it right away
+        future.add_done_callback(lambda f: self._forget_attrs(key, f))
+        return future
+
+    def _forget_attrs(self, key: str, future: Future) -> None:
+        # failures of the pool rather than of the script are not memoized,
+        # the next sight of the script submits it again
+        if not future.cancelled() and not isinstance(future.exception(), BrokenProcessPool):
+            return
+        with self.attrs_lock:
+            if self.attrs_memo.get(key) is future:
+                del self.attrs_memo[key]
+
+    def _submit_attrs(self, script: str) -> Future:
+        future = Future()
+        submitted = time.monotonic()
+        future.add_done_callback(
+            lambda f: metrics.SCRIPT_ATTRS_SECONDS.observe(time.monotonic() - submitted)
+        )
+        self.attrs_threads.submit(self._extract_attrs, script, future)
+        return future
+
+    def _extract_attrs(self, script: str, future: Future) -> None:
+        """Looks up the signatures of a script in the cache and extracts its
+        attributes into `future`, in an attrs thread.
+
+        The extraction runs in the pool of script_attrs_workers, or in this
+        thread without one.
+        """
+        try:
+            cache_key = None
+            ast_attrs = None
+            sig_cache = self.sig_cache
+            if sig_cache is not None:
+                cache_key = sig_cache.key(script)
+                with self.sig_cache_lock:
+                    cached = sig_cache.get(cache_key)
+                if cached is not None and None not in cached.values():
+                    ast_attrs = cached
+            if cache_key is not None and ast_attrs is None:
+                future.add_done_callback(lambda f: self._cache_ast_attrs(cache_key, f))
+            executor = self.attrs_executor
+            if executor is None:
+                future.set_result(extract_script_attrs(script, ast_attrs))
+                return
+            try:
+                extraction = executor.submit(extract_script_attrs, script, ast_attrs)
+            except RuntimeError as exc:
+                # a worker died (e.g. OOM killed) and the pool is replaced once,
+                # or configure replaced it in the meantime
+                with self.attrs_executor_lock:
+                    if self.attrs_executor is executor:
+                        if not isinstance(exc, BrokenProcessPool):
+                            raise
+                        self._start_attrs_executor()
+                    executor = self.attrs_executor
+                if executor is None:
+                    future.set_result(extract_script_attrs(script, ast_attrs))
+                    return
+                extraction = executor.submit(extract_script_attrs, script, ast_attrs)
+        except Exception as exc:
+            future.set_exception(exc)
+            return
+        extraction.add_done_callback(lambda f: _chain(f, future))
+
+    def _cache_ast_attrs(self, cache_key: str, future: Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            return
+        attrs = future.result()
+        with self.sig_cache_lock:
+            self.sig_cache.put(
+                cache_key,
+                sicilian_sig=attrs["sicilian_sig"],
+                sicilian_sig_noliteral=attrs["sicilian_sig_noliteral"],
+            )
+
+    def resolve_entry(self, entry: dict, deadline: float | None) -> None:
+        """Puts the results of the work flow_record started in place in an entry.
+
+        The blob of the body is waited for whatever the deadline, the HAR
+        file must not refer to a blob that is not written. A body that
+        could not be stored is left out. The script attributes are
+        resolved by resolve_script_attrs.
+        """
+        content = entry["response"].get("content", {})
+        blob = content.get("_blob")
+        if isinstance(blob, Future):
+            try:
+                content["_blob"] = blob.result()
+            except Exception as exc:
+                logger.warning(f"Body of {entry['request']['url']} not stored: {exc!r}")
+                del content["_blob"]
+        self.resolve_script_attrs(entry, deadline)
+
+    def resolve_script_attrs(self, entry: dict, deadline: float | None) -> None:
+        """Puts the script attributes of an entry in place of their extraction.
+
+        Extractions not done by the deadline (time.monotonic()) give
+        {"pending": true}, failed ones {"error": ...}.
+        """
+        future = _attrs_future(entry)
+        if future is None:
+            return
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            attrs = dict(future.result(timeout=timeout))
+        except TimeoutError:
+            attrs = dict(pending=True)
+        except Exception as exc:
+            logger.warning(f"Script attributes of {entry['request']['url']} failed: {exc!r}")
+            attrs = dict(error=f"{type(exc).__name__}: {exc}")
+        else:
+            attrs["known_library"] = self._known_library(attrs["sicilian_sig"])
+        entry["response"]["content"]["script_attrs"] = attrs
+
+    def _known_library(self, sig: str | None) -> list[dict] | None:
+        """Releases of a known library the signature belongs to, None if unknown."""
+        if self.known_libs is None or not sig:
+            return None
+        return self.known_libs.lookup(sig) or None
 
     def format_response_cookies(self, response: http.Response) -> list[dict]:
         """Formats the response's cookie header to list of cookies"""
@@ -358,3 +1233,86 @@ class SaveHAR:
 
     def format_multidict(self, obj: _MultiDict[str, str]) -> list[dict]:
         return [{"name": k, "value": v} for k, v in obj.items(multi=True)]
+
+
+def _test_script_attrs() -> bool:
+    """Checks that without script_attrs_workers scripts are looked up in the
+    signature cache and extracted off the thread that saw them.
+
+    Returns:
+        bool: whether the extraction was off that thread, matched and was cached
+    """
+    from mitmproxy.test import taddons
+
+    print("CHECKING SCRIPT ATTRIBUTES...")
+    script = "var a = 1;\nfunction f(b) { return a + b; }\n"
+    expected = extract_script_attrs(script)
+    addon = SaveHAR()
+    with tempfile.TemporaryDirectory() as tmp, taddons.context(addon) as tctx:
+        tctx.configure(
+            addon, script_attrs_workers=0, sig_cache=os.path.join(tmp, "sig_cache.sqlite")
+        )
+        futures = []
+        # a lookup or an extraction on the calling thread waits for the cache
+        with addon.sig_cache_lock:
+            caller = threading.Thread(
+                target=lambda: futures.append(addon._script_attrs_future(script))
+            )
+            caller.start()
+            caller.join(timeout=5)
+            off_thread = not caller.is_alive() and not futures[0].done()
+        caller.join()
+        print(f"  off the calling thread...{'matched' if off_thread else 'MISMATCHED'}")
+        entry = dict(
+            request=dict(url="https://example.com/a.js"),
+            response=dict(content=dict(script_attrs=futures[0])),
+        )
+        addon.resolve_script_attrs(entry, time.monotonic() + 30)
+        attrs = entry["response"]["content"]["script_attrs"]
+        extracted = attrs == dict(expected, known_library=None)
+        print(f"  extraction...{'matched' if extracted else 'MISMATCHED'}")
+        addon.attrs_threads.shutdown(wait=True)
+        cached = addon.sig_cache.get(addon.sig_cache.key(script))
+        cached = cached is not None and cached["sicilian_sig"] == expected["sicilian_sig"]
+        print(f"  signature cache...{'matched' if cached else 'MISMATCHED'}")
+        addon.done()
+        addon.sig_cache.close()
+    return off_thread and extracted and cached
+
+
+def _test_har_writer() -> bool:
+    """Checks that streamed HAR files are byte for byte what export_har
+    writes for the same entries, in every format, and that their index reads.
+
+    Returns:
+        bool: whether every file matched
+    """
+    print("CHECKING STREAMED HAR FILES...")
+    entries = [
+        dict(request=dict(url=f"https://example.com/{i}.js"), response=dict(content=dict(size=i)))
+        for i in range(3)
+    ]
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in sig_har.FORMATS:
+            for some in (entries, []):
+                path = os.path.join(tmp, f"{fmt}-{len(some)}.har")
+                writer = HarWriter(Path(f"{path}.part"), lambda entry, deadline: None, fmt, True)
+                for entry in some:
+                    writer.add(json.loads(json.dumps(entry)))
+                writer.finish(path, dict(compression="none", level=None, threads=None))
+                with open(path, "rb") as f:
+                    matched = f.read() == b"".join(sig_har.encode_har(har_log(some), fmt))
+                if some:
+                    with sig_har.HarReader(path) as reader:
+                        matched = matched and list(reader.entries()) == some
+                ok = ok and matched
+                print(f"  {fmt} {len(some)} entries...{'matched' if matched else 'MISMATCHED'}")
+    return ok
+
+
+if __name__ == "__main__":
+    import sys
+
+    ok = _test_script_attrs()
+    sys.exit(0 if _test_har_writer() and ok else 1)
@@ -1,6 +1,10 @@
+import time
+
 from bs4 import BeautifulSoup
 from mitmproxy import http
 
+import metrics
+
 
 def is_html_response(flow):
     """Checks whether or not the response is an HTML response by examining
@@ -154,10 +158,14 @@ class SWInjector:
             return
 
         print(f"injecting register-sw to {flow.request.url}")
+        started = time.monotonic()
         try:
             soup = BeautifulSoup(flow.response.content, "html.parser")
             new_tag = soup.new_tag("script", src=PATH_REGISTER_SW)
             soup.head.append(new_tag)
             flow.response.content = str(soup).encode("utf8", "ignore")
+            metrics.INJECTIONS.inc()
         except AttributeError:
+            metrics.INJECTION_NO_HEAD.inc()
             print(f"NO HEAD TAG FOR request: {flow.request.url}")
+        metrics.INJECTION_SECONDS.observe(time.monotonic() - started)
@@ -52,26 +52,79 @@ function getScriptAST(script) {
 //     return "sicilianSig";
 // }
 
-async function getSicilianSig(script) {
-    const proc = spawn("python3", ["src/sicilian.py"]);
-    let stdout = "";
+const SICILIAN_TIMEOUT = 5000;
+// leaves time to queue and return a degraded signature before SICILIAN_TIMEOUT
+const SICILIAN_BUDGET = 3000;
+let sicilianServer = null;
+
+/**
+ * Returns the long-lived `sicilian.py --serve` process shared by every
+ * getSicilianSig call, spawning it on first use or after it exits.
+ * Requests and responses are JSON lines matched by id.
+ */
+function getSicilianServer() {
+    if (sicilianServer !== null) {
+        return sicilianServer;
+    }
+    const proc = spawn(
+        "python3",
+        [
+            "src/sicilian.py",
+            "--serve",
+            "--timeout",
+            `${SICILIAN_TIMEOUT / 1000}`,
+            "--max-seconds",
+            `${SICILIAN_BUDGET / 1000}`,
+        ],
+        { stdio: ["pipe", "pipe", "inherit"] }
+    );
+    const server = { proc: proc, pending: new Map(), nextId: 0, buffer: "" };
     proc.stdout.setEncoding("utf8");
     proc.stdout.on("data", (data) => {
-        stdout += data;
+        server.buffer += data;
+        let idx = server.buffer.indexOf("\n");
+        while (idx > -1) {
+            const line = server.buffer.slice(0, idx);
+            server.buffer = server.buffer.slice(idx + 1);
+            idx = server.buffer.indexOf("\n");
+            let resp = null;
+            try {
+                resp = JSON.parse(line);
+            } catch (err) {
+                continue;
+            }
+            const resolve = server.pending.get(resp.id);
+            if (resolve) {
+                server.pending.delete(resp.id);
+                resolve(resp.error ? "" : resp.sig);
+            }
+        }
     });
-    const promiseFinish = new Promise((resolve) => {
-        proc.on("close", (code) => {
-            resolve(code);
+    // a write after the process died surfaces here, pending calls are resolved on exit
+    proc.stdin.on("error", () => {});
+    proc.on("exit", () => {
+        for (const resolve of server.pending.values()) {
+            resolve("");
         }
-    )});
-    proc.stdin.end(script);
-    // const stdinStream = new stream.Readable();
-    // stdinStream.push(script);
-    // stdinStream.push(null); // send EOF
-    // stdinStream.pipe(proc.stdin);
-    await utils.promiseRaceAll([promiseFinish], 5000, null);
-    const ret = stdout.trim();
-    return ret;
+        server.pending.clear();
+        if (sicilianServer === server) {
+            sicilianServer = null;
+        }
+    });
+    sicilianServer = server;
+    return server;
+}
+
+async function getSicilianSig(script) {
+    const server = getSicilianServer();
+    const id = server.nextId++;
+    const promiseSig = new Promise((resolve) => {
+        server.pending.set(id, resolve);
+    });
+    server.proc.stdin.write(JSON.stringify({ id: id, script: script }) + "\n");
+    const [sig] = await utils.promiseRaceAll([promiseSig], SICILIAN_TIMEOUT, "");
+    server.pending.delete(id);
+    return sig.trim();
 }
 
 
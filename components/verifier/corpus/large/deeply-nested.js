@@ -0,0 +1,89 @@
+var nested = (function (a20) {
+var o20 = {x: a20, y: {z: [a20, {w: a20 + 20}]}};
+if (o20.x > 20) { a19 = o20.y.z[0]; } else if (o20.x < 0) { a19 = -o20.x; } else { a19 = o20.x * 2; }
+return (function (a19) {
+var o19 = {x: a19, y: {z: [a19, {w: a19 + 19}]}};
+if (o19.x > 19) { a18 = o19.y.z[0]; } else if (o19.x < 0) { a18 = -o19.x; } else { a18 = o19.x * 2; }
+return (function (a18) {
+var o18 = {x: a18, y: {z: [a18, {w: a18 + 18}]}};
+if (o18.x > 18) { a17 = o18.y.z[0]; } else if (o18.x < 0) { a17 = -o18.x; } else { a17 = o18.x * 2; }
+return (function (a17) {
+var o17 = {x: a17, y: {z: [a17, {w: a17 + 17}]}};
+if (o17.x > 17) { a16 = o17.y.z[0]; } else if (o17.x < 0) { a16 = -o17.x; } else { a16 = o17.x * 2; }
+return (function (a16) {
+var o16 = {x: a16, y: {z: [a16, {w: a16 + 16}]}};
+if (o16.x > 16) { a15 = o16.y.z[0]; } else if (o16.x < 0) { a15 = -o16.x; } else { a15 = o16.x * 2; }
+return (function (a15) {
+var o15 = {x: a15, y: {z: [a15, {w: a15 + 15}]}};
+if (o15.x > 15) { a14 = o15.y.z[0]; } else if (o15.x < 0) { a14 = -o15.x; } else { a14 = o15.x * 2; }
+return (function (a14) {
+var o14 = {x: a14, y: {z: [a14, {w: a14 + 14}]}};
+if (o14.x > 14) { a13 = o14.y.z[0]; } else if (o14.x < 0) { a13 = -o14.x; } else { a13 = o14.x * 2; }
+return (function (a13) {
+var o13 = {x: a13, y: {z: [a13, {w: a13 + 13}]}};
+if (o13.x > 13) { a12 = o13.y.z[0]; } else if (o13.x < 0) { a12 = -o13.x; } else { a12 = o13.x * 2; }
+return (function (a12) {
+var o12 = {x: a12, y: {z: [a12, {w: a12 + 12}]}};
+if (o12.x > 12) { a11 = o12.y.z[0]; } else if (o12.x < 0) { a11 = -o12.x; } else { a11 = o12.x * 2; }
+return (function (a11) {
+var o11 = {x: a11, y: {z: [a11, {w: a11 + 11}]}};
+if (o11.x > 11) { a10 = o11.y.z[0]; } else if (o11.x < 0) { a10 = -o11.x; } else { a10 = o11.x * 2; }
+return (function (a10) {
+var o10 = {x: a10, y: {z: [a10, {w: a10 + 10}]}};
+if (o10.x > 10) { a9 = o10.y.z[0]; } else if (o10.x < 0) { a9 = -o10.x; } else { a9 = o10.x * 2; }
+return (function (a9) {
+var o9 = {x: a9, y: {z: [a9, {w: a9 + 9}]}};
+if (o9.x > 9) { a8 = o9.y.z[0]; } else if (o9.x < 0) { a8 = -o9.x; } else { a8 = o9.x * 2; }
+return (function (a8) {
+var o8 = {x: a8, y: {z: [a8, {w: a8 + 8}]}};
+if (o8.x > 8) { a7 = o8.y.z[0]; } else if (o8.x < 0) { a7 = -o8.x; } else { a7 = o8.x * 2; }
+return (function (a7) {
+var o7 = {x: a7, y: {z: [a7, {w: a7 + 7}]}};
+if (o7.x > 7) { a6 = o7.y.z[0]; } else if (o7.x < 0) { a6 = -o7.x; } else { a6 = o7.x * 2; }
+return (function (a6) {
+var o6 = {x: a6, y: {z: [a6, {w: a6 + 6}]}};
+if (o6.x > 6) { a5 = o6.y.z[0]; } else if (o6.x < 0) { a5 = -o6.x; } else { a5 = o6.x * 2; }
+return (function (a5) {
+var o5 = {x: a5, y: {z: [a5, {w: a5 + 5}]}};
+if (o5.x > 5) { a4 = o5.y.z[0]; } else if (o5.x < 0) { a4 = -o5.x; } else { a4 = o5.x * 2; }
+return (function (a4) {
+var o4 = {x: a4, y: {z: [a4, {w: a4 + 4}]}};
+if (o4.x > 4) { a3 = o4.y.z[0]; } else if (o4.x < 0) { a3 = -o4.x; } else { a3 = o4.x * 2; }
+return (function (a3) {
+var o3 = {x: a3, y: {z: [a3, {w: a3 + 3}]}};
+if (o3.x > 3) { a2 = o3.y.z[0]; } else if (o3.x < 0) { a2 = -o3.x; } else { a2 = o3.x * 2; }
+return (function (a2) {
+var o2 = {x: a2, y: {z: [a2, {w: a2 + 2}]}};
+if (o2.x > 2) { a1 = o2.y.z[0]; } else if (o2.x < 0) { a1 = -o2.x; } else { a1 = o2.x * 2; }
+return (function (a1) {
+var o1 = {x: a1, y: {z: [a1, {w: a1 + 1}]}};
+if (o1.x > 1) { a0 = o1.y.z[0]; } else if (o1.x < 0) { a0 = -o1.x; } else { a0 = o1.x * 2; }
+return (function (a0) {
+return [a0, {k: a0, v: [1, [2, [3]]]}];
+})(a1 + 1);
+})(a2 + 1);
+})(a3 + 1);
+})(a4 + 1);
+})(a5 + 1);
+})(a6 + 1);
+})(a7 + 1);
+})(a8 + 1);
+})(a9 + 1);
+})(a10 + 1);
+})(a11 + 1);
+})(a12 + 1);
+})(a13 + 1);
+})(a14 + 1);
+})(a15 + 1);
+})(a16 + 1);
+})(a17 + 1);
+})(a18 + 1);
+})(a19 + 1);
+})(a20 + 1);
+})(0);
+function chain(n) {
+  var r;
+  if (n === 0) { r = 0 * n; } else if (n === 1) { r = 1 * n; } else if (n === 2) { r = 2 * n; } else if (n === 3) { r = 3 * n; } else if (n === 4) { r = 4 * n; } else if (n === 5) { r = 5 * n; } else if (n === 6) { r = 6 * n; } else if (n === 7) { r = 7 * n; } else if (n === 8) { r = 8 * n; } else if (n === 9) { r = 9 * n; } else if (n === 10) { r = 10 * n; } else if (n === 11) { r = 11 * n; } else if (n === 12) { r = 12 * n; } else if (n === 13) { r = 13 * n; } else if (n === 14) { r = 14 * n; } else if (n === 15) { r = 15 * n; } else if (n === 16) { r = 16 * n; } else if (n === 17) { r = 17 * n; } else if (n === 18) { r = 18 * n; } else if (n === 19) { r = 19 * n; } else if (n === 20) { r = 20 * n; } else if (n === 21) { r = 21 * n; } else if (n === 22) { r = 22 * n; } else if (n === 23) { r = 23 * n; } else if (n === 24) { r = 24 * n; } else if (n === 25) { r = 25 * n; } else if (n === 26) { r = 26 * n; } else if (n === 27) { r = 27 * n; } else if (n === 28) { r = 28 * n; } else if (n === 29) { r = 29 * n; } else if (n === 30) { r = 30 * n; } else if (n === 31) { r = 31 * n; } else if (n === 32) { r = 32 * n; } else if (n === 33) { r = 33 * n; } else if (n === 34) { r = 34 * n; } else if (n === 35) { r = 35 * n; } else if (n === 36) { r = 36 * n; } else if (n === 37) { r = 37 * n; } else if (n === 38) { r = 38 * n; } else if (n === 39) { r = 39 * n; } else if (n === 40) { r = 40 * n; } else if (n === 41) { r = 41 * n; } else if (n === 42) { r = 42 * n; } else if (n === 43) { r = 43 * n; } else if (n === 44) { r = 44 * n; } else if (n === 45) { r = 45 * n; } else if (n === 46) { r = 46 * n; } else if (n === 47) { r = 47 * n; } else if (n === 48) { r = 48 * n; } else if (n === 49) { r = 49 * n; } else if (n === 50) { r = 50 * n; } else if (n === 51) { r = 51 * n; } else if (n === 52) { r = 52 * n; } else if (n === 53) { r = 53 * n; } else if (n === 54) { r = 54 * n; } else if (n === 55) { r = 55 * n; } else if (n === 56) { r = 56 * n; } else if (n === 57) { r = 57 * n; } else if (n === 58) { r = 58 * n; } else if (n === 59) { r = 59 * n; } else if (n === 60) { r = 60 * n; } else if (n === 61) { r = 61 * n; } else if (n === 62) { r = 62 * n; } else if (n === 63) { r = 63 * n; } else if (n === 64) { r = 64 * n; } else if (n === 65) { r = 65 * n; } else if (n === 66) { r = 66 * n; } else if (n === 67) { r = 67 * n; } else if (n === 68) { r = 68 * n; } else if (n === 69) { r = 69 * n; } else if (n === 70) { r = 70 * n; } else if (n === 71) { r = 71 * n; } else if (n === 72) { r = 72 * n; } else if (n === 73) { r = 73 * n; } else if (n === 74) { r = 74 * n; } else if (n === 75) { r = 75 * n; } else if (n === 76) { r = 76 * n; } else if (n === 77) { r = 77 * n; } else if (n === 78) { r = 78 * n; } else if (n === 79) { r = 79 * n; } else if (n === 80) { r = 80 * n; } else if (n === 81) { r = 81 * n; } else if (n === 82) { r = 82 * n; } else if (n === 83) { r = 83 * n; } else if (n === 84) { r = 84 * n; } else if (n === 85) { r = 85 * n; } else if (n === 86) { r = 86 * n; } else if (n === 87) { r = 87 * n; } else if (n === 88) { r = 88 * n; } else if (n === 89) { r = 89 * n; } else if (n === 90) { r = 90 * n; } else if (n === 91) { r = 91 * n; } else if (n === 92) { r = 92 * n; } else if (n === 93) { r = 93 * n; } else if (n === 94) { r = 94 * n; } else if (n === 95) { r = 95 * n; } else if (n === 96) { r = 96 * n; } else if (n === 97) { r = 97 * n; } else if (n === 98) { r = 98 * n; } else if (n === 99) { r = 99 * n; } else { r = -1; }
+  return r;
+}
+var config = {level: 24, next: {level: 23, next: {level: 22, next: {level: 21, next: {level: 20, next: {level: 19, next: {level: 18, next: {level: 17, next: {level: 16, next: {level: 15, next: {level: 14, next: {level: 13, next: {level: 12, next: {level: 11, next: {level: 10, next: {level: 9, next: {level: 8, next: {level: 7, next: {level: 6, next: {level: 5, next: {level: 4, next: {level: 3, next: {level: 2, next: {level: 1, next: {level: 0, next: cfg, items: [0, '0']}, items: [1, '1']}, items: [2, '2']}, items: [3, '3']}, items: [4, '4']}, items: [5, '5']}, items: [6, '6']}, items: [7, '7']}, items: [8, '8']}, items: [9, '9']}, items: [10, '10']}, items: [11, '11']}, items: [12, '12']}, items: [13, '13']}, items: [14, '14']}, items: [15, '15']}, items: [16, '16']}, items: [17, '17']}, items: [18, '18']}, items: [19, '19']}, items: [20, '20']}, items: [21, '21']}, items: [22, '22']}, items: [23, '23']}, items: [24, '24']};
@@ -0,0 +1,66 @@
+// Constructs that exercise the identity bookkeeping of the signature engine:
+// use before declaration, shadowed parameters, repeated subtrees, patterns.
+var total = add(base, 2), base = 40, unused;
+
+function add(a, b) {
+    return a + b;
+}
+
+function shadow(a, base) {
+    var inner = function (a) {
+        return a * base;
+    };
+    function nested(base, c) {
+        return base - c + add(base, c);
+    }
+    return inner(a) + nested(a, base);
+}
+
+var same1 = { x: 1, y: [1, 2, 3], z: "s" };
+var same2 = { z: "s", y: [1, 2, 3], x: 1 };
+var same3 = { x: 1, y: [1, 2, 3], z: "s" };
+
+for (var i = 0; i < 10; i++) {
+    total += shadow(i, base);
+    total -= i % 2 ? add(i, 1) : add(i, -1);
+}
+
+var [first, , third = 3] = [1, 2];
+var { p, q: { r = 5 } = {} } = { p: 1 };
+
+total = total || (unused && base) || null;
+total = typeof total === "number" ? !!total : void 0;
+label: while (total) {
+    if (total > 1) {
+        break label;
+    }
+    total--;
+}
+
+try {
+    throw new Error("e" + total);
+} catch (err) {
+    total = err.message.length;
+} finally {
+    base = /ab+c/gi.test(String(total)) ? 1 : 0;
+}
+
+switch (base) {
+    case 0:
+        first = third;
+    case 1:
+        first = third;
+        break;
+    default:
+        first = -third;
+}
+
+(function (a, b) {
+    a = b;
+    return function () {
+        return add(a, b) + add(a, b);
+    };
+})(1, 2)();
+
+var arrow = (x, y = 2) => x + y;
+var tpl = `value ${arrow(first, 3)} and ${total}`;
@@ -1,5 +1,9 @@
 import argparse
+from array import array
+import contextlib
 import hashlib
+import json
+import os
 import pdb
 import secrets
 import sys
@@ -7,10 +11,25 @@ import traceback
 
 import esprima
 
+import sicilian_parse
+from sig_budget import Budget
+
 LEN_FN_NONCE = 16
+# signature versions and how they hash: (hashlib algorithm, whether digests
+# are chained as hex strings). sicilian-1 reproduces the original signatures.
+# Add a version whenever a change alters the signatures produced, cached
+# signatures are keyed by it.
+HASH_SCHEMES = {
+    "sicilian-1": ("sha256", True),
+    "sicilian-2-sha256": ("sha256", False),
+    "sicilian-2-blake2b": ("blake2b", False),
+}
+SIG_VERSION = "sicilian-1"
+# marks signatures computed over part of a script, see sig_budget.Budget
+DEGRADED_PREFIX = "degraded:"
 
 
-def annotate_fn_param_nonces(node, fn_data=dict(), curr_fn=None):
+def annotate_fn_param_nonces(node, fn_data=None, curr_fn=None):
     """Annotate Identifier nodes that represent function parameters with a
     nonce that is unique to the function.
 
@@ -19,6 +38,9 @@ def annotate_fn_param_nonces(node, fn_data=dict(), curr_fn=None):
         fn_data (dict, optional): associates FunctionDeclaration nodes to parameter names and unique nonce. Defaults to dict().
         curr_fn (esprima.nodes.FunctionDeclaration, optional): the current function. Defaults to None.
     """
+    if fn_data is None:
+        # a shared default would keep every AST alive in long-lived processes
+        fn_data = dict()
     if type(node) == esprima.nodes.FunctionDeclaration:
         curr_fn = node
         if curr_fn not in fn_data:
@@ -35,20 +57,21 @@ def annotate_fn_param_nonces(node, fn_data=dict(), curr_fn=None):
         annotate_fn_param_nonces(child, fn_data, curr_fn=curr_fn)
 
 
-def inject_nodes(node, struct_nodes):
+def inject_nodes(node, struct_nodes, node_key=None):
     """Injects several types of nodes to the esprima-parsed AST to make it
     more similar to the AST grammar presented in the Sicilian Defense paper.
 
     Args:
         node (esprima.nodes.Node): AST node
         struct_nodes (dict): associates (the hashes of) AST nodes to their Structure nodes
+        node_key (callable, optional): computes the struct_nodes key of a node. Defaults to _get_hash_of_node.
     """
     inject_operator_nodes(node)
-    inject_structure_nodes(node, struct_nodes)
+    inject_structure_nodes(node, struct_nodes, node_key)
     inject_left_right_nodes(node)
     children = get_children(node)
     for child in children:
-        inject_nodes(child, struct_nodes)
+        inject_nodes(child, struct_nodes, node_key)
 
 
 # def annotate_fn_param_nonce(node, param_names, nonce):
@@ -223,7 +246,7 @@ def inject_operator_nodes(node):
     node.operator = op_node_cls(node.operator)
 
 
-def inject_structure_nodes(node, struct_nodes):
+def inject_structure_nodes(node, struct_nodes, node_key=None):
     # injects at `a_structure` as an implementation detail
     #    so that the structure node is encountered in the postorder
     #    traversal before the identifier node is encountered
@@ -236,7 +259,9 @@ def inject_structure_nodes(node, struct_nodes):
     struct_node = struct_node_cls(node)
     if node.id is None:
         pdb.set_trace()
-    hash_node = _get_hash_of_node(node.id)
+    if node_key is None:
+        node_key = _get_hash_of_node
+    hash_node = node_key(node.id)
     struct_nodes[hash_node] = (node, struct_node)
     node.a_structure = struct_node
     try:
@@ -328,13 +353,14 @@ def _get_hash_of_node(node):
     return hash(tuple(flattened))
 
 
-def get_structure_node(n, struct_nodes):
+def get_structure_node(n, struct_nodes, hash_node=None):
     """Returns the Structure node of a
     FunctionDeclaration node or a VariableDeclaration node.
 
     Args:
         n (esprima.nodes.Node): AST node
         struct_nodes (dict): map of the (hash of the) nodes to their Structure node
+        hash_node (optional): key of `n` in struct_nodes. Defaults to its _get_hash_of_node.
 
     Returns:
         Structure: the associated Structure node, or None
@@ -342,7 +368,8 @@ def get_structure_node(n, struct_nodes):
     if n.a_structure is not None:
         return n.a_structure
     try:
-        hash_node = _get_hash_of_node(n)
+        if hash_node is None:
+            hash_node = _get_hash_of_node(n)
         return struct_nodes[hash_node][1]
     except KeyError:
         pass
@@ -410,29 +437,200 @@ def concat_strings(*args):
     return output
 
 
+class SigHasher:
+    """Hashing backend of the iterative engine.
+
+    Digests are fed to incremental hashlib objects as bytes, without
+    building intermediate strings. In hex mode every digest is the ASCII
+    hex string of the previous scheme, so that the chained hashes and the
+    final signature are exactly those of sig_hash over concat_strings.
+    Otherwise raw digests are chained and only the final one is hexed.
+
+    Args:
+        version (str, optional): key of HASH_SCHEMES. Defaults to SIG_VERSION.
+    """
+
+    def __init__(self, version=SIG_VERSION):
+        algorithm, hex_digests = HASH_SCHEMES[version]
+        self.version = version
+        self.hex_digests = hex_digests
+        if algorithm == "blake2b":
+            self._new = lambda: hashlib.blake2b(digest_size=32)
+        else:
+            self._new = getattr(hashlib, algorithm)
+
+    def _digest(self, m):
+        if self.hex_digests:
+            return m.hexdigest().encode("ascii")
+        return m.digest()
+
+    def text(self, *parts):
+        """Digest of the concatenation of strings."""
+        m = self._new()
+        for part in parts:
+            m.update(part.encode("utf-8", "ignore"))
+        return self._digest(m)
+
+    def combine(self, first, rest=()):
+        """Digest of the concatenation of digests."""
+        m = self._new()
+        m.update(first)
+        for digest in rest:
+            m.update(digest)
+        return self._digest(m)
+
+    def hexdigest(self, digest):
+        if self.hex_digests:
+            return digest.decode("ascii")
+        return digest.hex()
+
+    def extend(self, m, part):
+        """Hash object of the text hashed by `m` (None for none) followed by part."""
+        m = self._new() if m is None else m.copy()
+        m.update(part.encode("utf-8", "ignore"))
+        return m
+
+
+class _CountingHasher(SigHasher):
+    # counts the digests computed, for sig_profile
+    def __init__(self, version=SIG_VERSION):
+        super().__init__(version)
+        self.calls = 0
+
+    def _digest(self, m):
+        self.calls += 1
+        return super()._digest(m)
+
+
+class PathTrie:
+    """Interned node positions.
+
+    The position of a node is the concatenation of the types of its
+    ancestors. Positions are ids in a trie instead of strings: a child
+    position is the id of its parent position extended by one type, so
+    that building it costs a dict lookup and not a copy of the whole
+    string. Digests of positions are computed from the hash state of the
+    parent position, once per position and hasher.
+
+    Args:
+        root (str, optional): the root position, id 0. Defaults to "".
+    """
+
+    def __init__(self, root=""):
+        self.parents = [-1]
+        self.parts = [root]
+        self._ids = {}
+        # per hasher version: hash states and digests, by position
+        self._states = {}
+        self._digests = {}
+
+    def __len__(self):
+        return len(self.parts)
+
+    def child(self, path, part):
+        """Returns the id of position `path` followed by `part`."""
+        key = (path, part)
+        child = self._ids.get(key)
+        if child is None:
+            child = len(self.parts)
+            self._ids[key] = child
+            self.parents.append(path)
+            self.parts.append(part)
+        return child
+
+    def string(self, path):
+        """Returns a position as the string it stands for."""
+        parts = []
+        while path != -1:
+            parts.append(self.parts[path])
+            path = self.parents[path]
+        return concat_strings(*reversed(parts))
+
+    def digest(self, path, hasher):
+        """Digest of the string of a position, as hasher.text gives it."""
+        digests = self._digests.setdefault(hasher.version, {})
+        digest = digests.get(path)
+        if digest is None:
+            digest = hasher._digest(self._state(path, hasher))
+            digests[path] = digest
+        return digest
+
+    def _state(self, path, hasher):
+        states = self._states.setdefault(hasher.version, {})
+        # walk up to the closest position already hashed, then down again
+        missing = []
+        p = path
+        while p != -1 and p not in states:
+            missing.append(p)
+            p = self.parents[p]
+        m = states.get(p)
+        for p in reversed(missing):
+            m = hasher.extend(m, self.parts[p])
+            states[p] = m
+        return states[path]
+
+
+# sig_hash as a SigHasher, for the positions of the recursive engine
+_RECURS_HASHER = SigHasher("sicilian-1")
+
+
 def is_unordered(n):
     return type(n) in UNORDERED_NODE_TYPES
 
 
-def is_top_level(n, prog):
-    return n in get_children(prog)
-
+class StructIds:
+    """Structural identities of identifiers, refined lazily.
 
-def refine_structids(struct_id, identity_pos, s):
-    for _key in identity_pos.keys():
-        # _node = identity_pos[_key][0]
-        # init_struct_id = struct_id[_key][1]
-        pos_hash = ""
-        for p in identity_pos[_key][1]:
-            pos_hash = concat_strings(pos_hash, sig_hash(p))
-        t = concat_strings(s, pos_hash)
-        struct_id[_key][1] = sig_hash(concat_strings(struct_id[_key][1], t))
-        # print(
-        #     f"refined _key={_key} _node={_node.__dict__} id={init_struct_id} -> {struct_id[_key][1]}"
-        # )
+    Every top-level statement refines the identity of each identifier
+    already referred to, with the signature of the statement and the
+    positions of all the references so far (Section 3.5.3 of Sicilian).
+    Instead of rehashing every identity at every statement, `refine` only
+    records the signature, and an identity catches up with the signatures
+    it missed when it is read again. Positions are only added right after
+    a read, so the positions an identity is caught up with are the ones it
+    had at each missed statement and the digests are those of refining
+    eagerly. The cost follows the identities actually read.
 
+    Args:
+        hasher (SigHasher): hasher of the digests
+    """
 
-def _structural_signature_recurs(node, pos, prog, struct_id, struct_nodes, identity_pos):
+    def __init__(self, hasher):
+        self.hasher = hasher
+        # signatures of the top-level statements, in order
+        self.refinements = []
+        # key -> [node, digest, refinements applied, digests of the positions]
+        self._ids = {}
+
+    def __contains__(self, key):
+        return key in self._ids
+
+    def add(self, key, node, s):
+        """Sets the initial identity of an identifier."""
+        self._ids[key] = [node, s, len(self.refinements), bytearray()]
+
+    def get(self, key):
+        """Returns the current identity of an identifier."""
+        entry = self._ids[key]
+        s, applied, positions = entry[1], entry[2], entry[3]
+        # identities without references are not refined
+        if positions:
+            for r in self.refinements[applied:]:
+                s = self.hasher.combine(s, [r, positions])
+            entry[1] = s
+        entry[2] = len(self.refinements)
+        return s
+
+    def add_position(self, key, digest):
+        """Records a reference to an identifier, by the digest of its position."""
+        self._ids[key][3] += digest
+
+    def refine(self, s):
+        """Refines the identities referred to with the signature of a top-level statement."""
+        self.refinements.append(s)
+
+
+def _structural_signature_recurs(node, pos, top_level, struct_ids, struct_nodes, paths):
     # if node is None:
     #     pdb.set_trace()
     # inject_operator_nodes(node)
@@ -448,11 +646,11 @@ def _structural_signature_recurs(node, pos, prog, struct_id, struct_nodes, ident
         if is_non_identifier(node):
             s = sig_hash(concat_strings(_type, label))
         # identifier leaf, refer to Section 3.5.3 of Sicilian
-        elif hash_node in struct_id:
-            s = struct_id[hash_node][1]
-            if hash_node not in identity_pos:
-                identity_pos[hash_node] = [node, []]
-            identity_pos[hash_node][1].append(concat_strings(pos, "Identifier"))
+        elif hash_node in struct_ids:
+            s = struct_ids.get(hash_node).decode("ascii")
+            struct_ids.add_position(
+                hash_node, paths.digest(paths.child(pos, "Identifier"), _RECURS_HASHER)
+            )
         else:
             # try:
             #     n_struct = get_structure_node(node, struct_nodes)
@@ -467,7 +665,7 @@ def _structural_signature_recurs(node, pos, prog, struct_id, struct_nodes, ident
                     concat_strings(
                         sig_hash(_type),
                         _structural_signature_recurs(
-                            n_struct, pos, prog, struct_id, struct_nodes, identity_pos
+                            n_struct, pos, top_level, struct_ids, struct_nodes, paths
                         ),
                     )
                 )
@@ -476,149 +674,477 @@ def _structural_signature_recurs(node, pos, prog, struct_id, struct_nodes, ident
                 # fallback to default signature computation
                 # as specified in beginning of Section 3.5.3
                 s = sig_hash(sig_hash(label))
-            struct_id[hash_node] = [node, s]
+            struct_ids.add(hash_node, node, s.encode("ascii"))
     else:
         signature = []
         for child in children:
             signature.append(
                 _structural_signature_recurs(
                     child,
-                    concat_strings(pos, _type),
-                    prog,
-                    struct_id,
+                    paths.child(pos, _type),
+                    top_level,
+                    struct_ids,
                     struct_nodes,
-                    identity_pos,
+                    paths,
                 )
             )
         signature = sorted(signature) if is_unordered(node) else signature
         s = sig_hash(concat_strings(sig_hash(label), *signature))
-        if is_top_level(node, prog):
-            refine_structids(struct_id, identity_pos, s)
-            identity_pos = {}  # flush identity_pos
+        if id(node) in top_level:
+            struct_ids.refine(s.encode("ascii"))
     # print(node.__dict__, s)
     return s
 
 
 def structural_signature_recurs(node, pos, prog):
-    struct_id = {}
     struct_nodes = {}
-    identity_pos = {}
+    # positions are ids in this trie, its root is the initial position `pos`
+    paths = PathTrie(pos)
     annotate_fn_param_nonces(node)
     inject_nodes(node, struct_nodes)
-    return _structural_signature_recurs(node, pos, prog, struct_id, struct_nodes, identity_pos)
+    # the children of prog once injected, by identity
+    top_level = {id(n) for n in get_children(prog)}
+    struct_ids = StructIds(_RECURS_HASHER)
+    return _structural_signature_recurs(node, 0, top_level, struct_ids, struct_nodes, paths)
+
+
+# stands for a child node in the shape of a node
+_SLOT = object()
+
+KIND_OTHER = 0
+KIND_IDENTIFIER = 1
+KIND_UNORDERED = 2
+
+
+def _get_shape(node):
+    """Returns the contents of a node with its child nodes left out,
+    flattened the same way as in _get_hash_of_node.
+
+    Two nodes are equal if and only if they have the same shape and
+    equal children.
+    """
+    shape = []
+    for k, v in node.items():
+        shape.append(k)
+        if type(v) == list:
+            for e in v:
+                shape.append(_SLOT if is_node(e) else e)
+        elif is_node(v):
+            shape.append(_SLOT)
+        else:
+            shape.append(v)
+    return tuple(shape)
+
+
+class FlatAST:
+    """Array-backed form of an annotated and injected AST.
+
+    Node 0 is the Program. The children of node i are the consecutive
+    nodes first_child[i] .. first_child[i] + num_children[i] - 1, in
+    get_children order. Types, labels and shapes are codes into tables
+    shared by all nodes.
+
+    Args:
+        tables (FlatAST, optional): tree whose code tables are shared, so that
+            codes of both trees can be compared. Defaults to None.
+    """
+
+    def __init__(self, tables=None):
+        self.types = array("i")
+        self.labels = array("i")
+        self.shapes = array("i")
+        self.kinds = bytearray()
+        self.parents = array("i")
+        self.first_child = array("i")
+        self.num_children = array("i")
+        self.ids = None
+        if tables is None:
+            self.type_table = []
+            self.label_table = []
+            self._type_codes = {}
+            self._label_codes = {}
+            self._shape_codes = {}
+        else:
+            self.type_table = tables.type_table
+            self.label_table = tables.label_table
+            self._type_codes = tables._type_codes
+            self._label_codes = tables._label_codes
+            self._shape_codes = tables._shape_codes
+        # associates the ids of declared identifiers to their Structure node
+        self.struct_nodes = {}
+        # positions of nodes, see path
+        self.paths = None
+        self._node_paths = None
+
+    def __len__(self):
+        return len(self.parents)
+
+    def _code(self, codes, table, value):
+        code = codes.get(value)
+        if code is None:
+            code = len(codes)
+            codes[value] = code
+            if table is not None:
+                table.append(value)
+        return code
+
+    def alloc(self, parent, num):
+        """Allocates `num` consecutive nodes under `parent`.
+
+        Returns:
+            int: index of the first one
+        """
+        first = len(self.parents)
+        for _ in range(num):
+            self.types.append(0)
+            self.labels.append(0)
+            self.shapes.append(0)
+            self.kinds.append(KIND_OTHER)
+            self.parents.append(parent)
+            self.first_child.append(0)
+            self.num_children.append(0)
+        return first
+
+    def set_node(self, i, node, first, num):
+        self.types[i] = self._code(self._type_codes, self.type_table, f"{get_type(node)}")
+        self.labels[i] = self._code(self._label_codes, self.label_table, f"{get_label(node)}")
+        self.shapes[i] = self.shape_code(node)
+        if type(node) is esprima.nodes.Identifier:
+            self.kinds[i] = KIND_IDENTIFIER
+        elif is_unordered(node):
+            self.kinds[i] = KIND_UNORDERED
+        self.first_child[i] = first
+        self.num_children[i] = num
+
+    def shape_code(self, node):
+        return self._code(self._shape_codes, None, _get_shape(node))
+
+    def children(self, i):
+        first = self.first_child[i]
+        return range(first, first + self.num_children[i])
+
+    def max_depth(self):
+        """Returns the depth of the deepest node, 0 for the Program alone."""
+        depths = array("i", bytes(4 * len(self)))
+        # parents are allocated before their children
+        for i in range(1, len(self)):
+            depths[i] = depths[self.parents[i]] + 1
+        return max(depths, default=0)
+
+    def path(self, i):
+        """Returns the position of a node, the concatenated types of its
+        ancestors, as an id in `paths`. Positions are only interned for the
+        nodes asked for and their ancestors."""
+        if self.paths is None:
+            self.paths = PathTrie()
+            self._node_paths = {0: 0}
+        node_paths = self._node_paths
+        missing = []
+        while i not in node_paths:
+            missing.append(i)
+            i = self.parents[i]
+        path = node_paths[i]
+        for i in reversed(missing):
+            parent = self.parents[i]
+            path = self.paths.child(node_paths[parent], self.type_table[self.types[parent]])
+            node_paths[i] = path
+        return path
+
+
+def _annotate_fn_param_nonce(node, curr_fn, fn_data):
+    # same rule as annotate_fn_param_nonces, for a single node
+    if curr_fn is None or type(node) is not esprima.nodes.Identifier:
+        return
+    if node.name in fn_data[curr_fn]["param_names"]:
+        node.nonce = fn_data[curr_fn]["nonce"]
+
 
+def flatten_ast(ast, interned, tables=None, budget=None):
+    """Annotates, injects and converts an esprima AST into a FlatAST in a
+    single preorder pass. The esprima tree is modified in the same way as
+    by annotate_fn_param_nonces and inject_nodes.
+
+    Args:
+        ast (esprima.nodes.Node): Program node, or a top-level statement
+        interned (dict): associates (shape, children ids) to node ids
+        tables (FlatAST, optional): tree whose code tables to share. Defaults to None.
+        budget (Budget, optional): checked for every node. Defaults to None.
+
+    Raises:
+        BudgetExceeded: if the budget runs out
 
-def _traverse(_node, struct_nodes):
-    stack = [_node]
-    order = []
-    node_pos = {}
+    Returns:
+        FlatAST: the converted tree, without ids yet
+    """
+    tree = FlatAST(tables)
+    fn_data = {}
+
+    def id_key(n):
+        # ids of declared identifiers are needed before they are visited,
+        # identifiers are leaves so their id is already final
+        if type(n) is not esprima.nodes.Identifier:
+            return None
+        return interned.setdefault((tree.shape_code(n), ()), len(interned))
+
+    tree.alloc(-1, 1)
+    stack = [(ast, 0, None)]
     while len(stack) > 0:
-        node = stack.pop()
-        # inject_operator_nodes(node)
-        # inject_structure_nodes(node, struct_nodes)
-        # inject_left_right_nodes(node)
-        order.append(node)
+        node, i, curr_fn = stack.pop()
+        if budget is not None:
+            budget.tick()
+        if type(node) == esprima.nodes.FunctionDeclaration:
+            curr_fn = node
+            if curr_fn not in fn_data:
+                param_names = [param.name for param in node.params]
+                nonce = secrets.token_hex(LEN_FN_NONCE)
+                fn_data[node] = dict(param_names=param_names, nonce=nonce)
+        _annotate_fn_param_nonce(node, curr_fn, fn_data)
+        if type(node) in EXPECTED_STRUCTURE_NODES:
+            # the id is keyed by inject_structure_nodes before it is visited
+            _annotate_fn_param_nonce(node.id, curr_fn, fn_data)
+
+        declared = {}
+        inject_operator_nodes(node)
+        inject_structure_nodes(node, declared, id_key)
+        inject_left_right_nodes(node)
 
-        _type = get_type(node)
         children = get_children(node)
-        pos = None
-        if node not in node_pos:
-            node_pos[node] = ""
-        pos = node_pos[node]
-        for child in children:
-            child_pos = concat_strings(pos, _type)
-            node_pos[child] = child_pos
-            stack.append(child)
-        if len(children) == 0 and not is_non_identifier(node):
-            node_pos[node] = concat_strings(pos, "Identifier")
-    traversal = list(reversed(order))
-    return traversal, node_pos
-
+        first = tree.alloc(i, len(children))
+        tree.set_node(i, node, first, len(children))
+        for j in range(len(children) - 1, -1, -1):
+            child = children[j]
+            if len(declared) > 0 and child is node.a_structure:
+                struct_key = next(iter(declared))
+                if struct_key is not None:
+                    tree.struct_nodes[struct_key] = first + j
+            stack.append((child, first + j, curr_fn))
+    return tree
+
+
+def _traverse(tree):
+    """Returns the nodes of a FlatAST in postorder."""
+    stack = [0]
+    order = array("i")
+    while len(stack) > 0:
+        i = stack.pop()
+        order.append(i)
+        stack.extend(tree.children(i))
+    order.reverse()
+    return order
 
-def traverse(ast):
-    struct_nodes = {}
-    nodes, node_pos = _traverse(ast, struct_nodes)
-    return nodes, node_pos
 
+def assign_node_ids(tree, nodes, interned):
+    """Gives every node an id, equal for two nodes if and only if their
+    subtrees are equal (the equality _get_hash_of_node approximates).
 
-def _structural_signature_of_later_struct_node(node, signatures):
-    label = get_label(node)
-    children = get_children(node)
-    hash_node = _get_hash_of_node(node)
+    Args:
+        tree (FlatAST): tree
+        nodes (array): nodes in postorder, as returned by _traverse
+        interned (dict): associates (shape, children ids) to node ids
+    """
+    ids = array("i", bytes(4 * len(tree)))
+    shapes = tree.shapes
+    first_child = tree.first_child
+    num_children = tree.num_children
+    for i in nodes:
+        first = first_child[i]
+        key = (shapes[i], tuple(ids[first : first + num_children[i]]))
+        ids[i] = interned.setdefault(key, len(interned))
+    tree.ids = ids
+
+
+def _structural_signature_of_later_struct_node(tree, i, signatures, hasher, label_digests):
+    label = tree.labels[i]
+    hash_node = tree.ids[i]
     signature = []
-    for child in children:
-        _type_child = get_type(child)
-        label_child = get_label(child)
-        hash_child = _get_hash_of_node(child)
-        signature_child = sig_hash(concat_strings(_type_child, label_child))
+    for child in tree.children(i):
+        _type_child = tree.type_table[tree.types[child]]
+        label_child = tree.label_table[tree.labels[child]]
+        hash_child = tree.ids[child]
+        signature_child = hasher.text(_type_child, label_child)
         signature.append(signature_child)
         signatures[hash_child] = signature_child
-    signature = sorted(signature) if is_unordered(node) else signature
-    s = sig_hash(concat_strings(sig_hash(label), *signature))
+    signature = sorted(signature) if tree.kinds[i] == KIND_UNORDERED else signature
+    s = hasher.combine(label_digests[label], signature)
     signatures[hash_node] = s
 
 
-def _structural_signature_iter(nodes, node_pos, identity_pos, struct_id, struct_nodes):
+class _LabelDigests(dict):
+    # digest of each label code of a tree, computed on first use
+    def __init__(self, tree, hasher):
+        self.table = tree.label_table
+        self.hasher = hasher
+
+    def __missing__(self, code):
+        digest = self.hasher.text(self.table[code])
+        self[code] = digest
+        return digest
+
+
+def _structural_signature_iter(tree, nodes, hasher):
     signatures = {}
-    prog = nodes[-1]
-    hash_prog = _get_hash_of_node(prog)
-    for node in nodes:
-        label = get_label(node)
-        _type = get_type(node)
-        children = get_children(node)
-        pos = node_pos[node]
-        hash_node = _get_hash_of_node(node)
+    struct_ids = StructIds(hasher)
+    label_digests = _LabelDigests(tree, hasher)
+    # digests of the (type, label) of non-identifier leaves
+    leaf_digests = {}
+    ids = tree.ids
+    types = tree.types
+    labels = tree.labels
+    kinds = tree.kinds
+    first_child = tree.first_child
+    num_children = tree.num_children
+    type_table = tree.type_table
+    label_table = tree.label_table
+    top_level = tree.children(0)
+    for i in nodes:
+        hash_node = ids[i]
         if hash_node in signatures:
             continue
-
-        if len(children) == 0:
-            if is_non_identifier(node):
-                s = sig_hash(concat_strings(_type, label))
+        label = labels[i]
+        num = num_children[i]
+
+        if num == 0:
+            if kinds[i] != KIND_IDENTIFIER:
+                key = (types[i], label)
+                s = leaf_digests.get(key)
+                if s is None:
+                    s = hasher.text(type_table[types[i]], label_table[label])
+                    leaf_digests[key] = s
             # identifier leaf, refer to Section 3.5.3 of Sicilian
-            elif hash_node in struct_id:
-                s = struct_id[hash_node][1]
-                if hash_node not in identity_pos:
-                    identity_pos[hash_node] = [node, []]
-                identity_pos[hash_node][1].append(concat_strings(pos, "Identifier"))
+            elif hash_node in struct_ids:
+                s = struct_ids.get(hash_node)
+                path = tree.paths.child(tree.path(i), "Identifier")
+                struct_ids.add_position(hash_node, tree.paths.digest(path, hasher))
             else:
-                n_struct = get_structure_node(node, struct_nodes)
+                n_struct = tree.struct_nodes.get(hash_node)
                 if n_struct is not None:
-                    hash_struct_node = _get_hash_of_node(n_struct)
+                    hash_struct_node = ids[n_struct]
                     if hash_struct_node not in signatures:
-                        _structural_signature_of_later_struct_node(n_struct, signatures)
-                    s = sig_hash(concat_strings(sig_hash(_type), signatures[hash_struct_node]))
+                        _structural_signature_of_later_struct_node(
+                            tree, n_struct, signatures, hasher, label_digests
+                        )
+                    type_digest = hasher.text(type_table[types[i]])
+                    s = hasher.combine(type_digest, [signatures[hash_struct_node]])
                 else:
                     # unable to compute structural identity,
                     # fallback to default signature computation
                     # as specified in beginning of Section 3.5.3
-                    s = sig_hash(sig_hash(label))
-                struct_id[hash_node] = [node, s]
+                    s = hasher.combine(label_digests[label])
+                struct_ids.add(hash_node, i, s)
         else:
-            signature = []
-            for child in children:
-                hash_child = _get_hash_of_node(child)
-                signature.append(signatures[hash_child])
-            signature = sorted(signature) if is_unordered(node) else signature
-            s = sig_hash(concat_strings(sig_hash(label), *signature))
-            if is_top_level(node, prog):
-                refine_structids(struct_id, identity_pos, s)
+            first = first_child[i]
+            signature = [signatures[h] for h in ids[first : first + num]]
+            signature = sorted(signature) if kinds[i] == KIND_UNORDERED else signature
+            s = hasher.combine(label_digests[label], signature)
+            if i in top_level:
+                struct_ids.refine(s)
         signatures[hash_node] = s
         # print(node.__dict__, s)
-    return signatures[hash_prog], signatures
+    return signatures[ids[0]], signatures
 
 
-def structural_signature_iter(ast):
-    struct_id = {}
-    struct_nodes = {}
-    identity_pos = {}
-    annotate_fn_param_nonces(ast)
-    inject_nodes(ast, struct_nodes)
-    nodes, node_pos = _traverse(ast, struct_nodes)
-    script_sig, all_sigs = _structural_signature_iter(
-        nodes, node_pos, identity_pos, struct_id, struct_nodes
-    )
-    # return script_sig, all_sigs, nodes, node_pos, identity_pos
-    return script_sig
+def structural_signature_iter(ast, version=SIG_VERSION):
+    """Computes the structural signature of a script with the iterative engine.
+
+    Args:
+        ast (esprima.nodes.Node): Program node, modified in place
+        version (str, optional): signature version, see HASH_SCHEMES. Defaults to SIG_VERSION.
+
+    Returns:
+        str: hex signature
+    """
+    hasher, script_sig, _ = _sign_ast(ast, version)
+    return hasher.hexdigest(script_sig)
+
+
+def subtree_signatures(ast, version=SIG_VERSION):
+    """Computes the structural signature of a script and of all its subtrees.
+
+    Args:
+        ast (esprima.nodes.Node): Program node, modified in place
+        version (str, optional): signature version, see HASH_SCHEMES. Defaults to SIG_VERSION.
+
+    Returns:
+        tuple: hex signature of the script, and the set of the digests (bytes)
+            of its distinct subtrees, in the format of the version's hasher
+    """
+    hasher, script_sig, all_sigs = _sign_ast(ast, version)
+    return hasher.hexdigest(script_sig), set(all_sigs.values())
+
+
+def _sign_ast(ast, version, profile=None):
+    hasher = SigHasher(version) if profile is None else _CountingHasher(version)
+    interned = {}
+    with _phase(profile, "preprocess") as record:
+        tree = flatten_ast(ast, interned)
+    if profile is not None:
+        # outside of the phase, which would otherwise time it
+        record["nodes"] = len(tree)
+        record["max_depth"] = tree.max_depth()
+    with _phase(profile, "traverse") as record:
+        nodes = _traverse(tree)
+        assign_node_ids(tree, nodes, interned)
+        record["nodes"] = len(nodes)
+    with _phase(profile, "hash") as record:
+        script_sig, all_sigs = _structural_signature_iter(tree, nodes, hasher)
+        record["nodes"] = len(all_sigs)
+        record["hash_calls"] = getattr(hasher, "calls", None)
+    return hasher, script_sig, all_sigs
+
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "corpus")
+
+
+def _corpus_scripts(corpus_dir=CORPUS_DIR):
+    """Returns the corpus scripts, by path relative to the corpus."""
+    path_sigs = os.path.join(corpus_dir, "signatures.json")
+    if not os.path.exists(path_sigs):
+        return {}
+    with open(path_sigs) as f:
+        names = json.load(f)["signatures"]
+    scripts = {}
+    for name in names:
+        with open(os.path.join(corpus_dir, name)) as f:
+            scripts[name] = f.read()
+    return scripts
+
+
+def _test_corpus(corpus_dir=CORPUS_DIR):
+    """Checks that the signatures of the corpus scripts match the ones
+    recorded in corpus/signatures.json.
+
+    Returns:
+        bool: whether every recorded signature matched
+    """
+    path_sigs = os.path.join(corpus_dir, "signatures.json")
+    if not os.path.exists(path_sigs):
+        print(f"NO CORPUS AT {corpus_dir}, SKIPPING")
+        return True
+    with open(path_sigs) as f:
+        expected = json.load(f)
+    if expected["sig_version"] != SIG_VERSION:
+        print(f"CORPUS RECORDED FOR {expected['sig_version']}, EXPECTED {SIG_VERSION}")
+        return False
+    ok = True
+    print(f"CHECKING CORPUS SIGNATURES...")
+    for name, sigs in expected["signatures"].items():
+        with open(os.path.join(corpus_dir, name)) as f:
+            script = f.read()
+        out = f"  {name}..."
+        if sign_script(script) == sigs["iter"]:
+            out += "matched"
+        else:
+            out += "MISMATCHED"
+            ok = False
+        if sigs["recurs"] is not None:
+            ast = esprima.parseScript(script)
+            if structural_signature_recurs(ast, "", ast) == sigs["recurs"]:
+                out += " recursive...matched"
+            else:
+                out += " recursive...MISMATCHED"
+                ok = False
+        print(out)
+    return ok
 
 
 def _test():
@@ -680,14 +1206,311 @@ def _test():
             out += f"matched"
         else:
             out += f"MISMATCHED"
+        for version in HASH_SCHEMES:
+            if version == SIG_VERSION:
+                continue
+            out += f"\n  {version.upper()}..."
+            sig0 = structural_signature_iter(esprima.parseScript(scripts[0]), version)
+            sig1 = structural_signature_iter(esprima.parseScript(scripts[1]), version)
+            if sig0 == sig1:
+                out += f"matched"
+            else:
+                out += f"MISMATCHED"
         out += "\n"
         print(out)
+    if not _test_corpus():
+        sys.exit(1)
+    import sicilian_incremental
+
+    # the large scripts are left to the benchmark, see sicilian_bench
+    scripts = {
+        name: script for name, script in _corpus_scripts().items() if not name.startswith("large/")
+    }
+    if not sicilian_incremental._test_incremental(scripts):
+        sys.exit(1)
+    if not sicilian_parse._test_backends(scripts):
+        sys.exit(1)
+    import sig_index
+
+    if not sig_index._test_index(scripts):
+        sys.exit(1)
+    import sig_libdb
+
+    with open(os.path.join(CORPUS_DIR, "signatures.json")) as f:
+        sigs = {name: sig["iter"] for name, sig in json.load(f)["signatures"].items()}
+    if not sig_libdb._test_libdb(sigs, SIG_VERSION):
+        sys.exit(1)
+    import sig_profile
+
+    if not sig_profile._test_profile(scripts, sigs):
+        sys.exit(1)
+    import sig_har
+
+    if not sig_har._test_har():
+        sys.exit(1)
+    import sig_blobs
+
+    if not sig_blobs._test_blobs():
+        sys.exit(1)
+    try:
+        import sig_compare
+    except ImportError:
+        print("NUMPY NOT INSTALLED, SKIPPING CRAWL COMPARISON")
+    else:
+        if not sig_compare._test_compare():
+            sys.exit(1)
+
+
+def sign_script(
+    script,
+    cache=None,
+    version=SIG_VERSION,
+    incremental=None,
+    url=None,
+    budget=None,
+    parser=sicilian_parse.DEFAULT_BACKEND,
+    profile=None,
+):
+    """Parses a script and returns its structural signature.
+
+    Args:
+        script (str): JavaScript source
+        cache (sig_cache.SigCache, optional): signature cache consulted before
+            parsing and filled afterwards, opened for the same version. Defaults to None.
+        version (str, optional): signature version, see HASH_SCHEMES. Defaults to SIG_VERSION.
+        incremental (sicilian_incremental.IncrementalSigner, optional): signer
+            reusing the previous version of the script at `url`. Defaults to None.
+        url (str, optional): where the script comes from. Defaults to None.
+        budget (Budget, optional): limits on the work spent, the signature is
+            degraded (and not cached) if they are reached. Defaults to None.
+        parser (str, optional): parser backend, see sicilian_parse.get_backend,
+            `incremental` has its own. Defaults to sicilian_parse.DEFAULT_BACKEND.
+        profile (sig_profile.Profile, optional): filled with the metrics of
+            every phase. Defaults to None.
+
+    Returns:
+        str: hex structural signature of the script
+    """
+    if profile is not None:
+        profile.start()
+    key = None
+    if cache is not None:
+        with _phase(profile, "cache"):
+            key = cache.key(script)
+            entry = cache.get(key)
+        if entry is not None and entry["sicilian_sig"] is not None:
+            return entry["sicilian_sig"]
+    if budget is not None and (incremental is None or url is None):
+        import sicilian_incremental
+
+        # signs statement by statement, so that the work done is kept if the budget runs out
+        incremental = sicilian_incremental.IncrementalSigner(version, max_urls=0, parser=parser)
+    if incremental is not None and (url is not None or budget is not None):
+        sig, _ = incremental.sign(url, script, budget, profile)
+    else:
+        with _phase(profile, "parse"):
+            ast = sicilian_parse.get_backend(parser).parse(script)
+        hasher, script_sig, _ = _sign_ast(ast, version, profile)
+        sig = hasher.hexdigest(script_sig)
+    if cache is not None and not sig.startswith(DEGRADED_PREFIX):
+        cache.put(key, sicilian_sig=sig)
+    return sig
+
+
+def _phase(profile, name):
+    if profile is None:
+        return contextlib.nullcontext({})
+    return profile.phase(name)
+
+
+def open_cache(path, version=SIG_VERSION):
+    if path is None:
+        return None
+    import sig_cache
+
+    return sig_cache.SigCache(path, version)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Compute the Sicilian structural signature of scripts."
+    )
+    parser.add_argument("--test", action="store_true", help="run the self-test and exit")
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="run as a persistent signature server instead of signing stdin once",
+    )
+    parser.add_argument(
+        "--batch",
+        default=None,
+        metavar="SOURCE",
+        help="sign many scripts over a process pool: an NDJSON file of "
+        '{"id", "script"} records ("-" for stdin), a directory of .js files or a .har/.zhar file',
+    )
+    parser.add_argument(
+        "--blobs",
+        default=None,
+        metavar="STORE",
+        help="with --batch of a HAR file, blob store its response bodies are in (see sig_blobs.py)",
+    )
+    parser.add_argument(
+        "--bench",
+        default=None,
+        metavar="OUT",
+        help='benchmark the engine over the corpus and write JSON results to OUT ("-" for stdout)',
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="with --bench, runs per script (best is kept)"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="with --bench, earlier results to compare with, slower phases are reported",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="log the metrics of every phase as JSON lines to stderr "
+        "(with --serve, add them to the responses as `profile`)",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="with --profile, also measure the peak memory of every phase (slower)",
+    )
+    parser.add_argument(
+        "--scaling",
+        action="store_true",
+        help="with --bench, also time both engines on generated scripts of growing length",
+    )
+    parser.add_argument(
+        "--socket",
+        default=None,
+        help="with --serve, listen on this Unix socket instead of stdin/stdout",
+    )
+    parser.add_argument(
+        "--framing",
+        choices=["jsonl", "length"],
+        default="jsonl",
+        help="with --serve, JSON-lines or 4-byte length-prefixed JSON requests",
+    )
+    parser.add_argument(
+        "--hash",
+        choices=sorted(HASH_SCHEMES),
+        default=SIG_VERSION,
+        help=f"signature version and hash function (default: {SIG_VERSION}, "
+        "sicilian-2-* hash raw digests and give different signatures)",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=["auto"] + sorted(sicilian_parse.BACKENDS),
+        default=sicilian_parse.DEFAULT_BACKEND,
+        help="parser backend, auto picks tree-sitter where installed and esprima otherwise "
+        "(default: auto, signatures do not depend on it)",
+    )
+    parser.add_argument(
+        "--max-nodes", type=int, default=None, help="budget of AST nodes parsed per script"
+    )
+    parser.add_argument(
+        "--max-seconds", type=float, default=None, help="budget of time per script (s)"
+    )
+    parser.add_argument(
+        "--max-memory",
+        type=float,
+        default=None,
+        help="budget of memory growth per script (MiB)",
+    )
+    parser.add_argument(
+        "--cache",
+        default=os.getenv("SICILIAN_CACHE"),
+        help="signature cache database (default: $SICILIAN_CACHE, disabled if unset)",
+    )
+    parser.add_argument(
+        "--known-libs",
+        default=os.getenv("SICILIAN_KNOWN_LIBS"),
+        help="with --serve, known library database (see sig_libdb.py) whose releases are "
+        "reported for matching scripts (default: $SICILIAN_KNOWN_LIBS)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None, help="with --serve or --batch, worker processes"
+    )
+    parser.add_argument(
+        "--chunksize", type=int, default=16, help="with --batch, scripts sent to a worker at once"
+    )
+    parser.add_argument(
+        "--unordered",
+        action="store_true",
+        help="with --batch, write results as they complete instead of in input order",
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=5.0, help="with --serve, default per-request timeout (s)"
+    )
+    parser.add_argument(
+        "--max-pending",
+        type=int,
+        default=64,
+        help="with --serve, requests accepted before reading is paused",
+    )
+    return parser.parse_args()
+
+
+def budget_from_args(args):
+    """Returns the Budget set on the command line, or None."""
+    if args.max_nodes is None and args.max_seconds is None and args.max_memory is None:
+        return None
+    max_memory = None if args.max_memory is None else int(args.max_memory * 1024 * 1024)
+    return Budget(args.max_nodes, args.max_seconds, max_memory)
+
+
+def profile_from_args(args):
+    """Returns the Profile asked for on the command line, or None."""
+    if not args.profile:
+        return None
+    import sig_profile
+
+    return sig_profile.Profile(trace_memory=args.profile_memory)
 
 
 def main():
+    args = parse_args()
+    try:
+        sicilian_parse.get_backend(args.parser)
+    except ImportError as exc:
+        sys.exit(f"parser {args.parser} is not available: {exc}")
+    if args.test:
+        _test()
+        return
+    if args.serve:
+        import sicilian_server
+
+        sicilian_server.serve(args)
+        return
+    if args.batch:
+        import sicilian_batch
+
+        sicilian_batch.batch(args)
+        return
+    if args.bench:
+        import sicilian_bench
+
+        if not sicilian_bench.bench(args):
+            sys.exit(1)
+        return
     script = sys.stdin.read()
-    ast = esprima.parseScript(script)
-    sig = structural_signature_iter(ast)
+    cache = open_cache(args.cache, args.hash)
+    budget = budget_from_args(args)
+    profile = profile_from_args(args)
+    sig = sign_script(script, cache, args.hash, budget=budget, parser=args.parser, profile=profile)
+    if profile is not None:
+        profile.log(sig=sig, bytes=len(script.encode("utf-8", "surrogatepass")))
+    if budget is not None and budget.exceeded is not None:
+        print(
+            f"{budget.exceeded} budget exceeded, signed the first {budget.statements} statements",
+            file=sys.stderr,
+        )
+    if cache is not None:
+        cache.close()
     print(sig)
 
 if __name__ == "__main__":
@@ -0,0 +1,284 @@
+"""Offline batch signing over a process pool.
+
+Inputs are NDJSON records `{"id": ..., "script": "..."}` (a file or `-` for
+stdin), a directory searched recursively for `.js` files, or a HAR file
+(`.har` or `.zhar`, in any format of sig_har) whose script responses carry their
+text, or a reference to it in a blob store (see sig_blobs). Results are written to stdout as JSON lines
+`{"id": ..., "sig": "...", "error": null, "elapsed": ...}`, in input order
+or as they complete. A script that fails to parse or sign only produces an
+error record, and a worker that dies takes down nothing but its chunk,
+which is retried one script at a time to find the culprit.
+"""
+
+import json
+import multiprocessing.util
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import sicilian
+import sicilian_parse
+import sig_blobs
+import sig_har
+
+DEFAULT_CHUNKSIZE = 16
+# chunks in flight per worker, bounds memory when inputs are large
+CHUNKS_PER_WORKER = 2
+
+_cache = None
+_version = sicilian.SIG_VERSION
+_parser = sicilian_parse.DEFAULT_BACKEND
+
+
+def _init_worker(cache_path, version, parser):
+    global _cache, _version, _parser
+    _version = version
+    _parser = parser
+    # opened after the fork, SQLite connections must not cross it
+    _cache = sicilian.open_cache(cache_path, version)
+    if _cache is not None:
+        # pool workers leave through os._exit, atexit handlers would not run
+        multiprocessing.util.Finalize(None, _cache.close, exitpriority=10)
+
+
+def _sign_item(item):
+    item_id, script, path = item
+    started = time.monotonic()
+    try:
+        if script is None:
+            with open(path, encoding="utf-8", errors="surrogateescape") as f:
+                script = f.read()
+        sig, error = sicilian.sign_script(script, _cache, _version, parser=_parser), None
+    except Exception as exc:
+        sig, error = "", f"{type(exc).__name__}: {exc}"
+    return dict(id=item_id, sig=sig, error=error, elapsed=round(time.monotonic() - started, 4))
+
+
+def _sign_chunk(chunk):
+    return [_sign_item(item) for item in chunk]
+
+
+def _is_script_entry(entry, blobs):
+    url = entry.get("request", {}).get("url", "")
+    content = entry.get("response", {}).get("content", {})
+    if "text" not in content and not (blobs is not None and sig_blobs.content_ref(content)):
+        return False
+    return url.split("?")[0].endswith(".js") or "javascript" in content.get("mimeType", "")
+
+
+def iter_har(path, blobs=None):
+    """Yields (id, script, None) for the script responses of a HAR file.
+
+    Args:
+        path (str): HAR file
+        blobs (sig_blobs.BlobStore, optional): store the bodies of the entries
+            are in. Defaults to None, for the bodies inline only.
+    """
+    for entry in sig_har.iter_entries(path):
+        if not _is_script_entry(entry, blobs):
+            continue
+        url = entry["request"]["url"]
+        try:
+            script = sig_blobs.content_text(entry["response"]["content"], blobs)
+        except KeyError as exc:
+            yield url, ValueError(f"body not in the blob store: {exc}"), None
+            continue
+        yield url, script, None
+
+
+def iter_dir(path):
+    """Yields (relative path, None, path) for the `.js` files under a directory."""
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith(".js"):
+                full = os.path.join(root, name)
+                yield os.path.relpath(full, path), None, full
+
+
+def iter_ndjson(f):
+    """Yields (id, script, None) for the records of an NDJSON stream.
+
+    Records without an id are identified by their line number. Malformed
+    records are yielded with the error in place of the script, as
+    ValueError instances, under their id if they have one.
+    """
+    for lineno, line in enumerate(f, 1):
+        if not line.strip():
+            continue
+        rec = None
+        try:
+            rec = json.loads(line)
+            yield rec.get("id", lineno), rec["script"], None
+        except (ValueError, KeyError, TypeError, AttributeError) as exc:
+            rec_id = rec.get("id", lineno) if isinstance(rec, dict) else lineno
+            yield rec_id, ValueError(f"bad record on line {lineno}: {exc}"), None
+
+
+def iter_items(source, blobs=None):
+    if source == "-":
+        return iter_ndjson(sys.stdin)
+    if os.path.isdir(source):
+        return iter_dir(source)
+    if source.endswith((".har", ".zhar")):
+        return iter_har(source, blobs)
+    return iter_ndjson(open(source, encoding="utf-8"))
+
+
+def _chunks(items, chunksize):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class BatchSigner:
+    """Signs chunks of items over a ProcessPoolExecutor.
+
+    The pool is rebuilt if a worker dies. Every chunk that was in flight in
+    the broken pool is then retried one item at a time, so that only the
+    item responsible ends up with an error.
+
+    Args:
+        num_workers (int): number of worker processes
+        cache_path (str, optional): signature cache shared by the workers. Defaults to None.
+        version (str, optional): signature version. Defaults to sicilian.SIG_VERSION.
+        parser (str, optional): parser backend. Defaults to sicilian_parse.DEFAULT_BACKEND.
+    """
+
+    def __init__(
+        self,
+        num_workers,
+        cache_path=None,
+        version=sicilian.SIG_VERSION,
+        parser=sicilian_parse.DEFAULT_BACKEND,
+    ):
+        self.num_workers = num_workers
+        self.cache_path = cache_path
+        self.version = version
+        self.parser = parser
+        self.executor = None
+        self._start()
+
+    def _start(self):
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            initializer=_init_worker,
+            initargs=(self.cache_path, self.version, self.parser),
+        )
+
+    def submit(self, chunk):
+        try:
+            return self.executor.submit(_sign_chunk, chunk)
+        except BrokenProcessPool:
+            self.executor.shutdown(wait=False)
+            self._start()
+            return self.executor.submit(_sign_chunk, chunk)
+
+    def result(self, future, chunk, retry=False):
+        """Results of a submitted chunk, retrying it if the pool broke.
+
+        Returns:
+            list: one result dict per item of the chunk
+        """
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            pass
+        if retry:
+            # signed alone and broke the pool again, this item is the culprit
+            return [dict(id=chunk[0][0], sig="", error="worker died", elapsed=None)]
+        results = []
+        for item in chunk:
+            results.extend(self.result(self.submit([item]), [item], retry=True))
+        return results
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+def _is_bad_record(item):
+    # the "script" of a malformed input record is its error
+    return isinstance(item[1], ValueError)
+
+
+def sign_batch(items, signer, chunksize=DEFAULT_CHUNKSIZE, ordered=True):
+    """Signs items, yielding result dicts.
+
+    Args:
+        items (iterable): (id, script, path) tuples, script None to read path
+        signer (BatchSigner): process pool
+        chunksize (int, optional): items per task. Defaults to DEFAULT_CHUNKSIZE.
+        ordered (bool, optional): yield in input order instead of as completed.
+            Defaults to True.
+    """
+    max_in_flight = signer.num_workers * CHUNKS_PER_WORKER
+    in_flight = deque()
+    chunks = _chunks(items, max(1, chunksize))
+
+    def submit_next():
+        for chunk in chunks:
+            good = [item for item in chunk if not _is_bad_record(item)]
+            future = signer.submit(good) if good else None
+            in_flight.append((future, chunk, good))
+            return True
+        return False
+
+    def collect(entry):
+        future, chunk, good = entry
+        results = iter(signer.result(future, good) if future is not None else ())
+        for item in chunk:
+            if _is_bad_record(item):
+                yield dict(id=item[0], sig="", error=str(item[1]), elapsed=0.0)
+            else:
+                yield next(results)
+
+    while len(in_flight) < max_in_flight and submit_next():
+        pass
+    while in_flight:
+        if ordered:
+            entry = in_flight.popleft()
+        else:
+            futures = [e[0] for e in in_flight if e[0] is not None]
+            if len(futures) == len(in_flight):
+                wait(futures, return_when=FIRST_COMPLETED)
+            entry = next(e for e in in_flight if e[0] is None or e[0].done())
+            in_flight.remove(entry)
+        yield from collect(entry)
+        while len(in_flight) < max_in_flight and submit_next():
+            pass
+
+
+def batch(args):
+    """Runs a batch with the options parsed by `sicilian.parse_args`."""
+    if args.blobs and not os.path.isdir(args.blobs):
+        # opening a store creates it, every body would be missing
+        sys.exit(f"no blob store at {args.blobs}")
+    num_workers = args.workers or os.cpu_count() or 1
+    signer = BatchSigner(num_workers, args.cache, args.hash, args.parser)
+    started = time.monotonic()
+    num_items = num_errors = 0
+    try:
+        blobs = sig_blobs.BlobStore(args.blobs) if args.blobs else None
+        items = iter_items(args.batch, blobs)
+        for result in sign_batch(items, signer, args.chunksize, ordered=not args.unordered):
+            num_items += 1
+            num_errors += result["error"] is not None
+            sys.stdout.write(json.dumps(result) + "\n")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sys.stdout.flush()
+        signer.close()
+    print(
+        f"signed {num_items} scripts ({num_errors} errors) with {num_workers} workers "
+        f"in {time.monotonic() - started:.2f}s",
+        file=sys.stderr,
+    )
@@ -0,0 +1,385 @@
+"""Benchmark of the signature engine over the corpus.
+
+Every corpus script is signed `repeat` times in a forked child process
+with sicilian.sign_script, which times each phase of the iterative engine
+in a sig_profile.Profile:
+
+  parse       source to esprima AST, with the selected parser backend
+  preprocess  flatten_ast (annotation, injection and flattening)
+  traverse    _traverse and assign_node_ids
+  hash        _structural_signature_iter
+
+Times are the best of the runs. Where the corpus records a recursive
+signature, the recursive engine is timed on the same script too. The
+child reports the growth of its peak resident set over the one it
+started with, so scripts do not inherit each other's peak, and is killed
+if it runs out of time.
+
+With `--scaling`, both engines are also timed on generated scripts of
+SCALING_SIZES top-level statements, declarations, functions and
+assignments referring to earlier ones, which shows how their cost grows
+with the length of a script.
+
+Results are written as JSON with sorted keys, so that the results of two
+commits can be diffed, or compared with `--baseline` which flags phases
+that got slower.
+"""
+
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+import sicilian
+import sicilian_parse
+from sig_budget import _rss
+from sig_profile import Profile
+
+PHASES = ("parse", "preprocess", "traverse", "hash")
+DEFAULT_REPEAT = 3
+# per script, for all runs of both engines
+TIMEOUT = 600
+# slowdown over the baseline reported as a regression
+REGRESSION_RATIO = 1.25
+# phases faster than this in the baseline are too noisy to compare
+MIN_COMPARED_SECONDS = 0.005
+# top-level statements of the generated scripts of --scaling
+SCALING_SIZES = (500, 1000, 2000, 4000)
+
+
+def _peak_rss():
+    # in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _run_iter(script, parser, version, profile):
+    sig = sicilian.sign_script(script, version=version, parser=parser, profile=profile)
+    times = {phase: profile.phases[phase]["seconds"] for phase in PHASES}
+    return sig, profile.phases["preprocess"]["nodes"], times
+
+
+def _run_recurs(script):
+    ast = sicilian_parse.parse_esprima(script)
+    started = time.perf_counter()
+    sig = sicilian.structural_signature_recurs(ast, "", ast)
+    return sig, time.perf_counter() - started
+
+
+def bench_script(script, expected, parser, version, repeat, recursive=None):
+    """Benchmarks the signing of one script in the current process.
+
+    Args:
+        script (str): JavaScript source
+        expected (dict): recorded signatures, {"iter": ..., "recurs": ...},
+            None where not recorded
+        parser (str): parser backend
+        version (str): signature version
+        repeat (int): runs of each engine
+        recursive (bool, optional): time the recursive engine too. Defaults
+            to whether its signature is recorded.
+
+    Returns:
+        dict: phase times and peak resident set growth, see the module docstring
+    """
+    profile = Profile()
+    base_rss = _rss()
+    best = dict.fromkeys(PHASES, float("inf"))
+    for _ in range(repeat):
+        gc.collect()
+        sig, num_nodes, times = _run_iter(script, parser, version, profile)
+        for phase, elapsed in times.items():
+            best[phase] = min(best[phase], elapsed)
+    result = dict(
+        bytes=len(script.encode("utf-8", "surrogatepass")),
+        nodes=num_nodes,
+        sig=sig,
+        peak_rss=max(0, _peak_rss() - base_rss),
+        recursive=None,
+        peak_rss_recursive=None,
+    )
+    result.update((phase, round(elapsed, 6)) for phase, elapsed in best.items())
+    result["iterative"] = round(sum(best.values()) - best["parse"], 6)
+    # signatures of other versions are not recorded
+    matched = version == sicilian.SIG_VERSION and expected["iter"] is not None
+    result["matched"] = sig == expected["iter"] if matched else None
+    if recursive is None:
+        recursive = expected["recurs"] is not None
+    if recursive:
+        recursive = float("inf")
+        for _ in range(repeat):
+            gc.collect()
+            sig_recurs, elapsed = _run_recurs(script)
+            recursive = min(recursive, elapsed)
+        result["recursive"] = round(recursive, 6)
+        result["peak_rss_recursive"] = max(0, _peak_rss() - base_rss)
+        if expected["recurs"] is not None:
+            result["matched"] = result["matched"] is not False and sig_recurs == expected["recurs"]
+    return result
+
+
+def _bench_child(conn, script, expected, parser, version, repeat, recursive):
+    try:
+        conn.send((bench_script(script, expected, parser, version, repeat, recursive), None))
+    except Exception as exc:
+        conn.send((None, f"{type(exc).__name__}: {exc}"))
+    finally:
+        conn.close()
+
+
+def _bench_forked(script, expected, parser, version, repeat, recursive=None, timeout=TIMEOUT):
+    ctx = multiprocessing.get_context("fork")
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(
+        target=_bench_child,
+        args=(send_conn, script, expected, parser, version, repeat, recursive),
+        daemon=True,
+    )
+    proc.start()
+    send_conn.close()
+    try:
+        if recv_conn.poll(timeout):
+            result, error = recv_conn.recv()
+        else:
+            result, error = None, f"timed out after {timeout}s"
+    except EOFError:
+        result, error = None, f"benchmark process died with exit code {proc.exitcode}"
+    finally:
+        recv_conn.close()
+        proc.kill()
+        proc.join()
+    return result, error
+
+
+def _totals(results):
+    totals = dict(scripts=0, bytes=0, nodes=0, recursive=0.0, errors=0)
+    totals.update(dict.fromkeys(PHASES + ("iterative",), 0.0))
+    for result in results:
+        totals["scripts"] += 1
+        if result.get("error") is not None:
+            totals["errors"] += 1
+            continue
+        for key in ("bytes", "nodes", "iterative", "recursive") + PHASES:
+            totals[key] += result[key] or 0
+    for key in PHASES + ("iterative", "recursive"):
+        totals[key] = round(totals[key], 6)
+    return totals
+
+
+def _git_commit():
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_bench(
+    corpus_dir=sicilian.CORPUS_DIR,
+    parser=sicilian_parse.DEFAULT_BACKEND,
+    version=sicilian.SIG_VERSION,
+    repeat=DEFAULT_REPEAT,
+):
+    """Benchmarks every script of the corpus.
+
+    Args:
+        corpus_dir (str, optional): corpus directory. Defaults to sicilian.CORPUS_DIR.
+        parser (str, optional): parser backend. Defaults to sicilian_parse.DEFAULT_BACKEND.
+        version (str, optional): signature version. Defaults to sicilian.SIG_VERSION.
+        repeat (int, optional): runs per script. Defaults to DEFAULT_REPEAT.
+
+    Returns:
+        dict: {"meta": ..., "scripts": {name: result}, "totals": {tier: totals}},
+            a result being {"error": ...} if the script could not be benchmarked
+    """
+    with open(os.path.join(corpus_dir, "signatures.json")) as f:
+        expected = json.load(f)["signatures"]
+    scripts = sicilian._corpus_scripts(corpus_dir)
+    # resolved once, so that children do not have to import the backend again
+    backend = sicilian_parse.get_backend(parser)
+    results = {}
+    for name, script in scripts.items():
+        started = time.monotonic()
+        result, error = _bench_forked(script, expected[name], parser, version, repeat)
+        if error is not None:
+            result = dict(error=error)
+        else:
+            result["error"] = None
+        results[name] = result
+        status = error or ("matched" if result["matched"] is not False else "MISMATCHED")
+        print(f"  {name}...{status} ({time.monotonic() - started:.2f}s)", file=sys.stderr)
+    tiers = {}
+    for name, result in results.items():
+        tiers.setdefault(name.split("/")[0], []).append(result)
+    totals = {tier: _totals(tier_results) for tier, tier_results in tiers.items()}
+    totals["all"] = _totals(results.values())
+    meta = dict(
+        sig_version=version,
+        parser=backend.name,
+        repeat=repeat,
+        python=platform.python_version(),
+        platform=platform.platform(),
+        commit=_git_commit(),
+    )
+    return dict(meta=meta, scripts=results, totals=totals)
+
+
+def scaling_script(num_statements):
+    """Generates a script of `num_statements` top-level statements (and one more).
+
+    Statements cycle through a variable declaration, a function declaration
+    and an assignment, each referring to identifiers declared before.
+    """
+    lines = ["var total = 0, config = {debug: false};"]
+    for i in range(num_statements):
+        if i % 3 == 0:
+            lines.append(f"var g{i} = total + {i};")
+        elif i % 3 == 1:
+            lines.append(f"function f{i}(a) {{ return a + g{i - 1} + total; }}")
+        else:
+            lines.append(f"total = f{i - 1}(g{i - 2}) + config.debug;")
+    return "\n".join(lines) + "\n"
+
+
+def run_scaling(
+    sizes=SCALING_SIZES,
+    parser=sicilian_parse.DEFAULT_BACKEND,
+    version=sicilian.SIG_VERSION,
+    repeat=DEFAULT_REPEAT,
+):
+    """Times both engines on generated scripts of growing length.
+
+    Returns:
+        list: per size, the results of bench_script without signature
+            checks, with the number of statements and the time per
+            statement of each engine in microseconds
+    """
+    expected = dict(iter=None, recurs=None)
+    results = []
+    for num_statements in sizes:
+        started = time.monotonic()
+        result, error = _bench_forked(
+            scaling_script(num_statements), expected, parser, version, repeat, recursive=True
+        )
+        if error is not None:
+            result = dict(error=error)
+        else:
+            result["error"] = None
+            for engine in ("iterative", "recursive"):
+                result[f"{engine}_per_statement_us"] = round(
+                    result[engine] / num_statements * 1e6, 3
+                )
+        result["statements"] = num_statements
+        results.append(result)
+        if error is None:
+            status = f"{result['iterative']:.3f}s iterative, {result['recursive']:.3f}s recursive"
+        else:
+            status = error
+        print(
+            f"  {num_statements} statements...{status} ({time.monotonic() - started:.2f}s)",
+            file=sys.stderr,
+        )
+    return results
+
+
+def _ratio(new, old):
+    return new / old if old else float("inf")
+
+
+def compare(results, baseline, out=sys.stdout):
+    """Prints how the phase times of `results` compare with a baseline.
+
+    Args:
+        results (dict): as returned by run_bench
+        baseline (dict): earlier results
+        out (file, optional): where to print. Defaults to sys.stdout.
+
+    Returns:
+        bool: whether no phase got slower by more than REGRESSION_RATIO
+    """
+    for key in ("sig_version", "parser", "repeat"):
+        if results["meta"][key] != baseline["meta"].get(key):
+            print(
+                f"WARNING: {key} differs, {baseline['meta'].get(key)} -> {results['meta'][key]}",
+                file=out,
+            )
+    ok = True
+    print(f"COMPARED WITH {baseline['meta'].get('commit')}...", file=out)
+    for name, result in results["scripts"].items():
+        old = baseline["scripts"].get(name)
+        if old is None or old.get("error") is not None or result["error"] is not None:
+            continue
+        parts = []
+        for phase in PHASES + ("iterative", "recursive", "peak_rss"):
+            if result[phase] is None or old.get(phase) is None:
+                continue
+            ratio = _ratio(result[phase], old[phase])
+            part = f"{phase} {ratio:.2f}x"
+            noisy = phase != "peak_rss" and old[phase] < MIN_COMPARED_SECONDS
+            if ratio > REGRESSION_RATIO and not noisy:
+                part += " REGRESSED"
+                ok = False
+            parts.append(part)
+        print(f"  {name}: {', '.join(parts)}", file=out)
+    new_all, old_all = results["totals"]["all"], baseline["totals"]["all"]
+    parts = [
+        f"{key} {_ratio(new_all[key], old_all.get(key)):.2f}x" for key in PHASES + ("iterative",)
+    ]
+    print(f"  total: {', '.join(parts)}", file=out)
+    old_scaling = {
+        result["statements"]: result
+        for result in baseline.get("scaling", [])
+        if result.get("error") is None
+    }
+    for result in results.get("scaling", []):
+        old = old_scaling.get(result["statements"])
+        if old is None or result["error"] is not None:
+            continue
+        parts = []
+        for engine in ("iterative", "recursive"):
+            ratio = _ratio(result[engine], old[engine])
+            part = f"{engine} {ratio:.2f}x"
+            if ratio > REGRESSION_RATIO and old[engine] >= MIN_COMPARED_SECONDS:
+                part += " REGRESSED"
+                ok = False
+            parts.append(part)
+        print(f"  {result['statements']} statements: {', '.join(parts)}", file=out)
+    return ok
+
+
+def bench(args):
+    """Runs the benchmark with the options parsed by `sicilian.parse_args`.
+
+    Returns:
+        bool: False if some script failed or regressed against `args.baseline`
+    """
+    print(f"BENCHMARKING CORPUS ({args.repeat} runs per script)...", file=sys.stderr)
+    results = run_bench(parser=args.parser, version=args.hash, repeat=args.repeat)
+    if args.scaling:
+        sizes = ", ".join(map(str, SCALING_SIZES))
+        print(f"BENCHMARKING SCALING ({sizes} statements)...", file=sys.stderr)
+        results["scaling"] = run_scaling(parser=args.parser, version=args.hash, repeat=args.repeat)
+    text = json.dumps(results, indent=2, sort_keys=True) + "\n"
+    if args.bench == "-":
+        sys.stdout.write(text)
+    else:
+        with open(args.bench, "w") as f:
+            f.write(text)
+    ok = results["totals"]["all"]["errors"] == 0
+    ok = ok and all(result.get("matched") is not False for result in results["scripts"].values())
+    ok = ok and all(result["error"] is None for result in results.get("scaling", []))
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        ok = compare(results, baseline, out=sys.stderr) and ok
+    return ok
@@ -0,0 +1,515 @@
+"""Incremental re-signing of scripts that change between crawls.
+
+For every URL we keep the previous version of the script as a list of
+top-level statements, each with the hash of its source slice and its
+flattened subtree (a FlatAST with node ids, see sicilian.flatten_ast). A
+new version is matched against it: statements whose slice is unchanged at
+the start and at the end of the script are reused, and only the region in
+between is parsed and flattened. The statements are then stitched back
+into one tree and signed.
+
+Parsing and flattening are where the time goes. The final signing pass
+still runs over the whole stitched tree: identifier signatures depend on
+declarations anywhere in the program and on the order in which they are
+first met, so the signature of a statement is not a function of the
+statement alone. That pass is cheap on the flat arrays, and it is what
+keeps the result identical to a full recompute.
+
+A statement is only reused where its boundary cannot move with the text
+around it: it must end with a semicolon or be a declaration/block that
+ends with a brace (not an if/loop body, which an `else` could extend).
+Anything else is parsed again together with the changed region.
+
+Statements come from the parser backend (see sicilian_parse) when it can
+give them with their offsets, i.e. tree-sitter, and otherwise from
+esprima's parser driven one statement at a time, which also keeps the
+statements parsed before a budget runs out. Scripts that do not parse as
+scripts are parsed again as ES modules, as by sicilian_parse.parse_esprima.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import esprima
+
+import sicilian
+import sicilian_parse
+from sicilian import FlatAST
+from sig_budget import Budget, BudgetExceeded
+
+DEFAULT_MAX_URLS = 32
+# start the record of a URL over once the ids interned for its past versions
+# outnumber the nodes of the current one this many times (and this many ids)
+MAX_INTERNED_RATIO = 4
+MIN_INTERNED_LIMIT = 8192
+
+# statements ending with "}" that cannot be continued by the text after them
+_BLOCK_ENDED = (
+    "FunctionDeclaration",
+    "ClassDeclaration",
+    "BlockStatement",
+    "SwitchStatement",
+)
+# statements ending with a nested statement, e.g. a dangling `if` an `else` would extend
+_OPEN_ENDED = (
+    "IfStatement",
+    "ForStatement",
+    "ForInStatement",
+    "ForOfStatement",
+    "WhileStatement",
+    "WithStatement",
+    "LabeledStatement",
+    "TryStatement",
+)
+
+
+def _slice_hash(text):
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).digest()
+
+
+class Fragment:
+    """A top-level statement of a recorded script.
+
+    Args:
+        tree (FlatAST): flattened statement, node 0 is the statement, with ids
+        slice_hash (bytes): hash of the source from the end of the previous
+            statement to the end of this one
+        length (int): length of that source
+        safe (bool): whether the statement ends where it ends whatever follows
+        directive (bool): whether it is a directive of the prologue
+    """
+
+    __slots__ = ("tree", "slice_hash", "length", "safe", "directive")
+
+    def __init__(self, tree, slice_hash, length, safe, directive):
+        self.tree = tree
+        self.slice_hash = slice_hash
+        self.length = length
+        self.safe = safe
+        self.directive = directive
+
+
+class ScriptRecord:
+    """Previous version of the script of a URL.
+
+    `tables` and `interned` are shared by all fragments so that their codes
+    and node ids stay comparable across versions.
+    """
+
+    def __init__(self):
+        self.tables = FlatAST()
+        self.interned = {}
+        self.fragments = []
+        self.tail_hash = _slice_hash("")
+        self.tail_length = 0
+        # parsed as an ES module, not a script
+        self.module = False
+
+
+def _iter_statements(source, budget=None, backend=None, module=False):
+    """Parses a script one top-level statement at a time, as
+    esprima.parseScript (or parseModule) would.
+
+    With a backend that rebuilds statements with their offsets, the
+    statements come from the backend, which charges them to the budget as
+    it rebuilds them. If it gives up on a statement, the statements before
+    it are parsed again by esprima, without being charged twice, and the
+    rest of the script comes from esprima. Ranges from esprima come from
+    the delegate of its parser, which unlike the `range` option does not
+    add attributes to the nodes (and so to their shape).
+
+    Args:
+        source (str): JavaScript source
+        budget (sig_budget.Budget, optional): charged for every node. Defaults to None.
+        backend (optional): parser backend, see sicilian_parse.get_backend. Defaults to None.
+        module (bool, optional): parse as an ES module. Defaults to False.
+
+    Yields:
+        tuple: (statement node, start offset, end offset)
+    """
+    # statements already given by the backend
+    skip = 0
+    rebuild = getattr(backend, "rebuild_statements", None)
+    if rebuild is not None and not module:
+        try:
+            for stmt, start, end in rebuild(source, budget):
+                yield stmt, start, end
+                skip += 1
+            return
+        except sicilian_parse.Unsupported:
+            pass
+    offsets = {}
+
+    def delegate(node, metadata):
+        offsets[id(node)] = (metadata.start.offset, metadata.end.offset)
+        if budget is not None:
+            if skip > 0:
+                budget.tick()
+            else:
+                budget.charge()
+
+    parser = esprima.parser.Parser(source, options={}, delegate=delegate)
+    if module:
+        # as Parser.parseModule
+        parser.context.strict = True
+        parser.context.isModule = True
+        parser.scanner.isModule = True
+    for stmt in parser.parseDirectivePrologues():
+        if skip > 0:
+            skip -= 1
+        else:
+            yield (stmt,) + offsets[id(stmt)]
+    offsets.clear()
+    while parser.lookahead.type is not esprima.parser.Token.EOF:
+        stmt = parser.parseStatementListItem()
+        if skip > 0:
+            skip -= 1
+        else:
+            yield (stmt,) + offsets[id(stmt)]
+        offsets.clear()
+
+
+def _is_safe(stmt, text):
+    _type = stmt.type
+    if _type in _BLOCK_ENDED:
+        return True
+    return _type not in _OPEN_ENDED and text.endswith(";")
+
+
+def _make_fragments(record, source, base, prev_end, budget=None, backend=None):
+    """Parses a region of a script as a sequence of top-level statements.
+
+    Args:
+        record (ScriptRecord): record the fragments will belong to
+        source (str): region of the script
+        base (int): offset of the region in the script
+        prev_end (int): end offset of the statement before the region
+        budget (sig_budget.Budget, optional): budget for parsing and flattening. Defaults to None.
+        backend (optional): parser backend, see _iter_statements. Defaults to None.
+
+    Raises:
+        BudgetExceeded: if the budget runs out, with the fragments
+            completed so far and the end offset of the last one as `partial`
+
+    Returns:
+        tuple: (list of Fragment, one per statement, end offset of the last one)
+    """
+    fragments = []
+    try:
+        for stmt, start, end in _iter_statements(source, budget, backend, record.module):
+            end += base
+            text = source[prev_end - base : end - base]
+            is_directive = type(stmt) is esprima.nodes.Directive
+            tree = sicilian.flatten_ast(stmt, record.interned, record.tables, budget)
+            sicilian.assign_node_ids(tree, sicilian._traverse(tree), record.interned)
+            safe = _is_safe(stmt, source[start : end - base])
+            fragments.append(Fragment(tree, _slice_hash(text), len(text), safe, is_directive))
+            prev_end = end
+    except BudgetExceeded as exc:
+        exc.partial = (fragments, prev_end)
+        raise
+    return fragments, prev_end
+
+
+def _stitch(record, fragments):
+    """Builds the FlatAST of the program made of `fragments`, with node ids
+    and the same struct_nodes a full flatten_ast would have produced."""
+    tree = FlatAST(record.tables)
+    num = len(fragments)
+    tree.alloc(-1, 1 + num)
+    # only the shape of the program matters, its statements are slots
+    program = esprima.nodes.Module if record.module else esprima.nodes.Script
+    tree.set_node(0, program([sicilian._SLOT] * num), 1, num)
+    ids = [0] * (1 + num)
+    for k, fragment in enumerate(fragments):
+        f = fragment.tree
+        root = 1 + k
+        offset = len(tree) - 1
+
+        def to_global(local):
+            return root if local == 0 else local + offset
+
+        tree.types[root] = f.types[0]
+        tree.labels[root] = f.labels[0]
+        tree.shapes[root] = f.shapes[0]
+        tree.kinds[root] = f.kinds[0]
+        tree.parents[root] = 0
+        tree.first_child[root] = to_global(f.first_child[0])
+        tree.num_children[root] = f.num_children[0]
+        ids[root] = f.ids[0]
+        tree.types.extend(f.types[1:])
+        tree.labels.extend(f.labels[1:])
+        tree.shapes.extend(f.shapes[1:])
+        tree.kinds.extend(f.kinds[1:])
+        tree.parents.extend([to_global(p) for p in f.parents[1:]])
+        tree.first_child.extend([c + offset for c in f.first_child[1:]])
+        tree.num_children.extend(f.num_children[1:])
+        ids.extend(f.ids[1:])
+        # last declaration wins, in preorder, as in flatten_ast
+        for key, local in f.struct_nodes.items():
+            tree.struct_nodes[key] = to_global(local)
+    root_ids = tuple(ids[1 : 1 + num])
+    ids[0] = record.interned.setdefault((tree.shapes[0], root_ids), len(record.interned))
+    tree.ids = sicilian.array("i", ids)
+    return tree
+
+
+def _prologue_ok(fragments):
+    # directives parsed out of place (a region parsed alone starts a new
+    # prologue, a reused directive may no longer be in one) change the AST
+    in_prologue = True
+    for fragment in fragments:
+        if not fragment.directive:
+            in_prologue = False
+        elif not in_prologue:
+            return False
+    return True
+
+
+class IncrementalSigner:
+    """Signs successive versions of the scripts of URLs, reusing the
+    unchanged top-level statements of the previous version.
+
+    Args:
+        version (str, optional): signature version. Defaults to sicilian.SIG_VERSION.
+        max_urls (int, optional): records kept, least recently used are
+            dropped. Defaults to DEFAULT_MAX_URLS.
+        parser (str, optional): parser backend, see sicilian_parse.get_backend.
+            Defaults to sicilian_parse.DEFAULT_BACKEND.
+    """
+
+    def __init__(
+        self,
+        version=sicilian.SIG_VERSION,
+        max_urls=DEFAULT_MAX_URLS,
+        parser=sicilian_parse.DEFAULT_BACKEND,
+    ):
+        self.version = version
+        self.max_urls = max_urls
+        self.backend = sicilian_parse.get_backend(parser)
+        self.records = OrderedDict()
+        self.totals = dict(scripts=0, statements=0, reused=0)
+        # stats of the last script signed
+        self.last = None
+
+    def _match(self, record, script):
+        """Returns the number of reused leading fragments, the offset where
+        they end, the number of reused trailing fragments and the offset
+        where they start."""
+        fragments = record.fragments
+        if len(fragments) == 0:
+            return 0, 0, 0, len(script)
+        num_prefix = 0
+        pos = 0
+        for fragment in fragments:
+            end = pos + fragment.length
+            if not fragment.safe or _slice_hash(script[pos:end]) != fragment.slice_hash:
+                break
+            num_prefix += 1
+            pos = end
+        num_suffix = 0
+        start = len(script) - record.tail_length
+        if start < pos or _slice_hash(script[start:]) != record.tail_hash:
+            return num_prefix, pos, 0, len(script)
+        # the statement before the first reused one needs a safe end, checked by the caller
+        for fragment in reversed(fragments[num_prefix:]):
+            begin = start - fragment.length
+            if begin < pos or _slice_hash(script[begin:start]) != fragment.slice_hash:
+                break
+            num_suffix += 1
+            start = begin
+        return num_prefix, pos, num_suffix, start
+
+    def _parse(self, record, script, budget=None):
+        """Parses a whole script into an empty record, as an ES module if
+        it is not a valid script."""
+        try:
+            return _make_fragments(record, script, 0, 0, budget, self.backend)
+        except esprima.Error as exc:
+            error = exc
+        # the ids and codes interned by the first attempt stay valid, unused
+        record.module = True
+        try:
+            return _make_fragments(record, script, 0, 0, budget, self.backend)
+        except esprima.Error:
+            raise error from None
+
+    def _resign(self, record, script, budget=None):
+        fragments = record.fragments
+        num_prefix, prefix_end, num_suffix, suffix_start = self._match(record, script)
+        prefix = fragments[:num_prefix]
+        suffix = fragments[len(fragments) - num_suffix :]
+        try:
+            middle, middle_end = _make_fragments(
+                record,
+                script[prefix_end:suffix_start],
+                prefix_end,
+                prefix_end,
+                budget,
+                self.backend,
+            )
+            last = middle[-1] if middle else (prefix[-1] if prefix else None)
+            if num_suffix > 0 and last is not None and not last.safe:
+                # the changed region may run into the first reused statement
+                num_suffix = 0
+                middle, middle_end = _make_fragments(
+                    record, script[prefix_end:], prefix_end, prefix_end, budget, self.backend
+                )
+        except BudgetExceeded as exc:
+            middle, middle_end = exc.partial
+            exc.partial = (prefix + middle, middle_end)
+            raise
+        end = middle_end
+        if num_suffix == 0:
+            suffix = []
+        else:
+            # the slice of the first reused statement now starts where the
+            # changed region's last statement ends
+            first = suffix[0]
+            text = script[middle_end : suffix_start + first.length]
+            suffix[0] = Fragment(first.tree, _slice_hash(text), len(text), first.safe, first.directive)
+            end = len(script) - record.tail_length
+        new_fragments = prefix + middle + suffix
+        if not _prologue_ok(new_fragments):
+            raise ValueError("prologue changed")
+        return new_fragments, end, len(prefix) + len(suffix)
+
+    def sign(self, url, script, budget=None, profile=None):
+        """Signs a script, as sicilian.sign_script would.
+
+        Args:
+            url (str): where the script comes from, the key of its record, or
+                None to keep no record
+            script (str): JavaScript source
+            budget (sig_budget.Budget, optional): limits for this script, the
+                signature is degraded if they are reached. Defaults to None.
+            profile (sig_profile.Profile, optional): filled with the metrics of
+                the preprocess (parsing included), traverse and hash phases. Defaults to None.
+
+        Returns:
+            tuple: (hex signature, dict with statements, reused and reuse_ratio)
+        """
+        if budget is not None:
+            budget.start()
+        record = self.records.pop(url, None)
+        reused = 0
+        degraded = None
+        with sicilian._phase(profile, "preprocess") as phase:
+            try:
+                if record is None:
+                    record = ScriptRecord()
+                    fragments, end = self._parse(record, script, budget)
+                else:
+                    try:
+                        fragments, end, reused = self._resign(record, script, budget)
+                    except BudgetExceeded:
+                        raise
+                    except Exception:
+                        # a region that does not parse alone or misplaced directives,
+                        # the whole script decides (and raises if it is invalid)
+                        record = ScriptRecord()
+                        reused = 0
+                        fragments, end = self._parse(record, script, budget)
+            except BudgetExceeded as exc:
+                degraded = exc.reason
+                fragments, end = exc.partial
+                reused = min(reused, len(fragments))
+            phase["nodes"] = sum(len(fragment.tree) for fragment in fragments)
+        with sicilian._phase(profile, "traverse") as phase:
+            tree = _stitch(record, fragments)
+            nodes = sicilian._traverse(tree)
+            phase["nodes"] = len(nodes)
+        if profile is None:
+            hasher = sicilian.SigHasher(self.version)
+        else:
+            hasher = sicilian._CountingHasher(self.version)
+        with sicilian._phase(profile, "hash") as phase:
+            sig, signatures = sicilian._structural_signature_iter(tree, nodes, hasher)
+            phase["nodes"] = len(signatures)
+            phase["hash_calls"] = getattr(hasher, "calls", None)
+        if degraded is not None:
+            # the statements signed and the rest of the source as it is
+            sig = hasher.combine(sig, [hasher.text(script[end:])])
+            budget.statements = len(fragments)
+        elif url is not None and self.max_urls > 0:
+            record.fragments = fragments
+            tail = script[end:]
+            record.tail_hash = _slice_hash(tail)
+            record.tail_length = len(tail)
+            if len(record.interned) <= max(MAX_INTERNED_RATIO * len(tree), MIN_INTERNED_LIMIT):
+                self.records[url] = record
+                while len(self.records) > self.max_urls:
+                    self.records.popitem(last=False)
+        self.totals["scripts"] += 1
+        self.totals["statements"] += len(fragments)
+        self.totals["reused"] += reused
+        stats = dict(
+            statements=len(fragments),
+            reused=reused,
+            reuse_ratio=reused / len(fragments) if fragments else 0.0,
+            degraded=degraded,
+        )
+        self.last = stats
+        if degraded is not None:
+            return sicilian.DEGRADED_PREFIX + hasher.hexdigest(sig), stats
+        return hasher.hexdigest(sig), stats
+
+    def stats(self):
+        """Returns the statements signed and reused since the start."""
+        statements = self.totals["statements"]
+        return dict(
+            self.totals,
+            reuse_ratio=self.totals["reused"] / statements if statements else 0.0,
+        )
+
+
+def _test_incremental(scripts):
+    """Checks that incremental signatures of edited scripts match full ones,
+    with every parser backend and with a budget that is not reached.
+
+    Args:
+        scripts (dict): associates names to sources
+
+    Returns:
+        bool: whether every signature matched
+    """
+    ok = True
+    print(f"CHECKING INCREMENTAL SIGNATURES...")
+    scripts = dict(scripts)
+    scripts["es-module"] = (
+        "import x from 'y';\nvar a = x(1);\nexport default function f(b) { return a + b; }\n"
+    )
+    # tree-sitter gives up on the `let` statement, esprima parses the rest
+    scripts["rebuild-fallback"] = '"use strict";\nvar a = 1;\nf(a);\nlet\nx = a;\ng(x);\n'
+    for parser in sicilian_parse.available_backends():
+        for name, script in scripts.items():
+            try:
+                ranges = [(start, end) for _, start, end in _iter_statements(script)]
+            except esprima.Error:
+                ranges = [(start, end) for _, start, end in _iter_statements(script, module=True)]
+            versions = [script, script]
+            if len(ranges) > 1:
+                mid = ranges[len(ranges) // 2]
+                # edit, insert before, delete a statement, then append one
+                versions.append(script[: mid[0]] + "x = 1;" + script[mid[1] :])
+                versions.append(script[: mid[0]] + "var __y = [1, 2];\n" + script[mid[0] :])
+                versions.append(script[: ranges[0][0]] + script[ranges[1][0] :])
+            versions.append(versions[-1] + "\nfunction __z(a) { return a; }\n")
+            signer = IncrementalSigner(parser=parser)
+            out = f"  {name} ({parser})..."
+            results = []
+            for version in versions:
+                sig, stats = signer.sign(name, version)
+                expected = sicilian.sign_script(version)
+                results.append(f"{stats['reused']}/{stats['statements']}")
+                if sig != expected:
+                    ok = False
+                    results[-1] += " MISMATCHED"
+            budget = Budget(max_nodes=10**9, max_seconds=3600)
+            full = sicilian.sign_script(script)
+            if sicilian.sign_script(script, budget=budget, parser=parser) != full:
+                ok = False
+                results.append("budget MISMATCHED")
+            out += "matched" if "MISMATCHED" not in " ".join(results) else "MISMATCHED"
+            print(f"{out} (reused {', '.join(results)})")
+    return ok
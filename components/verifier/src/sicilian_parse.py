@@ -0,0 +1,1062 @@
+"""Parser backends for sicilian.
+
+The signature passes work on esprima's ESTree nodes, down to the order of
+their attributes (part of the shape of a node) and the classes esprima
+picks for the same syntax in different places: an object pattern is an
+ObjectPattern in a declaration but an ObjectExpression retyped in place on
+the left of an assignment, and only the latter counts as unordered. A
+backend must produce exactly that tree.
+
+esprima is the reference backend. Scripts it rejects as scripts are tried
+again as ES modules. The tree-sitter backend parses with the
+tree-sitter-javascript grammar, several times faster, and rebuilds the
+esprima tree from the concrete syntax tree through the esprima.nodes
+constructors, the same cover grammar reinterpretation and esprima's own
+scanner for literal values. Whatever it cannot rebuild the way esprima
+would (syntax errors, modules, constructs esprima 4 does not parse such as
+optional chaining or class fields) is handed to esprima, so the signatures
+do not depend on the backend. The one difference left is that scripts
+esprima rejects for early errors tree-sitter does not check (e.g. strict
+mode restrictions) are signed rather than failing.
+"""
+
+import time
+
+import esprima
+from esprima.error_handler import ErrorHandler
+from esprima.scanner import Scanner
+from esprima.syntax import Syntax
+
+from sig_budget import BudgetExceeded
+
+N = esprima.nodes
+
+DEFAULT_BACKEND = "auto"
+# bytes handed to tree-sitter at a time, the budget is polled between them
+PARSE_CHUNK = 1 << 16
+
+
+def parse_esprima(script):
+    """Parses a script with esprima, as an ES module if it is not a valid script."""
+    try:
+        return esprima.parseScript(script)
+    except esprima.Error as exc:
+        try:
+            return esprima.parseModule(script)
+        except esprima.Error:
+            raise exc from None
+
+
+class EsprimaBackend:
+    """Reference backend."""
+
+    name = "esprima"
+
+    def __init__(self):
+        self.stats = dict(parsed=0, fallbacks=0)
+
+    def parse(self, script):
+        self.stats["parsed"] += 1
+        return parse_esprima(script)
+
+
+class Unsupported(Exception):
+    """The tree-sitter tree cannot be rebuilt the way esprima builds it."""
+
+
+# nodes tree-sitter places anywhere, ignored
+_EXTRAS = frozenset(["comment", "html_comment"])
+# logical assignment and nullish coalescing, not parsed by esprima 4
+_UNSUPPORTED_OPERATORS = frozenset(["&&=", "||=", "??=", "??"])
+
+
+def _reinterpret(expr):
+    # esprima's Parser.reinterpretExpressionAsPattern: expressions on the
+    # left of "=" and arrow parameters are retyped in place, keeping their class
+    typ = expr.type
+    if typ == Syntax.SpreadElement:
+        expr.type = Syntax.RestElement
+        _reinterpret(expr.argument)
+    elif typ == Syntax.ArrayExpression:
+        expr.type = Syntax.ArrayPattern
+        for elem in expr.elements:
+            if elem is not None:
+                _reinterpret(elem)
+    elif typ == Syntax.ObjectExpression:
+        expr.type = Syntax.ObjectPattern
+        for prop in expr.properties:
+            _reinterpret(prop if prop.type == Syntax.SpreadElement else prop.value)
+    elif typ == Syntax.AssignmentExpression:
+        expr.type = Syntax.AssignmentPattern
+        del expr.operator
+        _reinterpret(expr.left)
+    return expr
+
+
+def _named(node):
+    return [c for c in node.named_children if c.type not in _EXTRAS]
+
+
+def _first_named(node):
+    for c in node.named_children:
+        if c.type not in _EXTRAS:
+            return c
+    return None
+
+
+def _modifiers(node):
+    """Returns the keyword tokens before the first named child of a node."""
+    mods = set()
+    for c in node.children:
+        if c.is_named:
+            if c.type not in _EXTRAS:
+                break
+        else:
+            mods.add(c.type)
+    return mods
+
+
+class _Rebuilder:
+    """Rebuilds the esprima tree of a tree-sitter tree.
+
+    Args:
+        source (bytes): UTF-8 source the tree was parsed from
+        budget (sig_budget.Budget, optional): ticked for every statement and
+            expression rebuilt. Defaults to None.
+    """
+
+    def __init__(self, source, budget=None):
+        self.source = source
+        self.handler = ErrorHandler()
+        self.budget = budget
+        # statements and expressions rebuilt since the last reset, a lower
+        # bound on the nodes built (a parenthesized expression is its content)
+        self.built = 0
+        # function bodies entered, a return outside of one is an error for esprima
+        self.depth = 0
+        self.statements = {
+            "expression_statement": self.expression_statement,
+            "variable_declaration": self.variable_declaration,
+            "lexical_declaration": self.variable_declaration,
+            "function_declaration": self.function,
+            "generator_function_declaration": self.function,
+            "class_declaration": self.klass,
+            "statement_block": self.block,
+            "if_statement": self.if_statement,
+            "for_statement": self.for_statement,
+            "for_in_statement": self.for_in_statement,
+            "while_statement": self.while_statement,
+            "do_statement": self.do_statement,
+            "with_statement": self.with_statement,
+            "labeled_statement": self.labeled_statement,
+            "break_statement": self.jump,
+            "continue_statement": self.jump,
+            "return_statement": self.return_statement,
+            "throw_statement": self.throw_statement,
+            "try_statement": self.try_statement,
+            "switch_statement": self.switch_statement,
+            "empty_statement": lambda node: N.EmptyStatement(),
+            "debugger_statement": lambda node: N.DebuggerStatement(),
+        }
+        self.expressions = {
+            "identifier": self.identifier,
+            "undefined": self.identifier,
+            "this": lambda node: N.ThisExpression(),
+            "super": lambda node: N.Super(),
+            "import": lambda node: N.Import(),
+            "true": lambda node: N.Literal(True, "true"),
+            "false": lambda node: N.Literal(False, "false"),
+            "null": lambda node: N.Literal(None, "null"),
+            "number": self.number,
+            "string": self.string,
+            "regex": self.regex,
+            "template_string": self.template,
+            "parenthesized_expression": self.parenthesized,
+            "sequence_expression": self.sequence,
+            "assignment_expression": self.assignment,
+            "augmented_assignment_expression": self.augmented_assignment,
+            "binary_expression": self.binary,
+            "unary_expression": self.unary,
+            "update_expression": self.update,
+            "ternary_expression": self.ternary,
+            "call_expression": self.call,
+            "member_expression": self.member,
+            "subscript_expression": self.subscript,
+            "new_expression": self.new,
+            "meta_property": self.meta_property,
+            "array": self.array,
+            "object": self.object,
+            "function_expression": self.function,
+            "generator_function": self.function,
+            "arrow_function": self.arrow_function,
+            "class": self.klass,
+            "await_expression": self.await_expression,
+            "yield_expression": self.yield_expression,
+        }
+
+    def text(self, node):
+        return self.source[node.start_byte : node.end_byte].decode("utf-8", "surrogatepass")
+
+    def lex(self, raw):
+        # esprima's own scanner, for literal values exactly as it computes them
+        return Scanner(raw, self.handler).lex()
+
+    def program(self, root):
+        return N.Script(self.statement_list(self.top_level(root), prologue=True))
+
+    def top_level(self, root):
+        statements = _named(root)
+        for node in statements:
+            if node.type in ("import_statement", "export_statement"):
+                # an ES module, which esprima tells apart from a script
+                raise Unsupported(node.type)
+        return statements
+
+    def statement(self, node):
+        fn = self.statements.get(node.type)
+        if fn is None:
+            raise Unsupported(node.type)
+        if self.budget is not None:
+            self.built += 1
+            self.budget.check(self.built)
+        return fn(node)
+
+    def expression(self, node):
+        fn = self.expressions.get(node.type)
+        if fn is None:
+            raise Unsupported(node.type)
+        if self.budget is not None and node.type != "parenthesized_expression":
+            self.built += 1
+            self.budget.check(self.built)
+        return fn(node)
+
+    def statement_list(self, nodes, prologue=False):
+        return list(self.iter_statement_list(nodes, prologue))
+
+    def iter_statement_list(self, nodes, prologue=False):
+        """Rebuilds statements one at a time, as statement_list."""
+        for node in nodes:
+            if prologue:
+                # parseDirectivePrologues: leading string statements, up to an empty one
+                prologue = False
+                expr = _first_named(node) if node.type == "expression_statement" else None
+                if expr is not None and expr.type == "string":
+                    literal = self.string(expr)
+                    if len(literal.raw) > 2:
+                        yield N.Directive(literal, literal.raw[1:-1])
+                        prologue = True
+                    else:
+                        yield N.ExpressionStatement(literal)
+                    continue
+            yield self.statement(node)
+
+    # statements
+
+    def expression_statement(self, node):
+        expr = _first_named(node)
+        if expr.type == "identifier" and self.text(expr) == "let":
+            # `let` then a binding on the next line, a declaration for esprima
+            raise Unsupported("let")
+        return N.ExpressionStatement(self.expression(expr))
+
+    def variable_declaration(self, node):
+        if node.type == "variable_declaration":
+            kind = "var"
+        else:
+            kind = node.child_by_field_name("kind").type
+        declarations = []
+        for declarator in _named(node):
+            init = declarator.child_by_field_name("value")
+            declarations.append(
+                N.VariableDeclarator(
+                    self.pattern(declarator.child_by_field_name("name")),
+                    None if init is None else self.expression(init),
+                )
+            )
+        return N.VariableDeclaration(declarations, kind)
+
+    def block(self, node):
+        return N.BlockStatement(self.statement_list(_named(node)))
+
+    def function_body(self, node):
+        self.depth += 1
+        body = self.statement_list(_named(node), prologue=True)
+        self.depth -= 1
+        return N.BlockStatement(body)
+
+    def if_statement(self, node):
+        alternate = node.child_by_field_name("alternative")
+        if alternate is not None:
+            alternate = self.statement(_first_named(alternate))
+        return N.IfStatement(
+            self.expression(node.child_by_field_name("condition")),
+            self.statement(node.child_by_field_name("consequence")),
+            alternate,
+        )
+
+    def for_statement(self, node):
+        init = node.child_by_field_name("initializer")
+        if init.type == "empty_statement":
+            init = None
+        elif init.type in ("variable_declaration", "lexical_declaration"):
+            init = self.variable_declaration(init)
+        elif init.type == "expression_statement":
+            init = self.expression(_first_named(init))
+        else:
+            init = self.expression(init)
+        test = node.child_by_field_name("condition")
+        if test is None or not test.is_named or test.type == "empty_statement":
+            test = None
+        elif test.type == "expression_statement":
+            test = self.expression(_first_named(test))
+        else:
+            test = self.expression(test)
+        update = node.child_by_field_name("increment")
+        if update is not None:
+            update = self.expression(update)
+        body = self.statement(node.child_by_field_name("body"))
+        return N.ForStatement(init, test, update, body)
+
+    def for_in_statement(self, node):
+        if "await" in _modifiers(node) or node.child_by_field_name("value") is not None:
+            raise Unsupported("for_in_statement")
+        kind = node.child_by_field_name("kind")
+        left = node.child_by_field_name("left")
+        if kind is not None:
+            declarator = N.VariableDeclarator(self.pattern(left), None)
+            left = N.VariableDeclaration([declarator], kind.type)
+        else:
+            left = self.target(left)
+        right = self.expression(node.child_by_field_name("right"))
+        body = self.statement(node.child_by_field_name("body"))
+        if node.child_by_field_name("operator").type == "of":
+            return N.ForOfStatement(left, right, body)
+        return N.ForInStatement(left, right, body)
+
+    def while_statement(self, node):
+        return N.WhileStatement(
+            self.expression(node.child_by_field_name("condition")),
+            self.statement(node.child_by_field_name("body")),
+        )
+
+    def do_statement(self, node):
+        return N.DoWhileStatement(
+            self.statement(node.child_by_field_name("body")),
+            self.expression(node.child_by_field_name("condition")),
+        )
+
+    def with_statement(self, node):
+        return N.WithStatement(
+            self.expression(node.child_by_field_name("object")),
+            self.statement(node.child_by_field_name("body")),
+        )
+
+    def labeled_statement(self, node):
+        return N.LabeledStatement(
+            N.Identifier(self.text(node.child_by_field_name("label"))),
+            self.statement(node.child_by_field_name("body")),
+        )
+
+    def jump(self, node):
+        label = node.child_by_field_name("label")
+        if label is not None:
+            label = N.Identifier(self.text(label))
+        if node.type == "break_statement":
+            return N.BreakStatement(label)
+        return N.ContinueStatement(label)
+
+    def return_statement(self, node):
+        if self.depth == 0:
+            raise Unsupported("return")
+        argument = _first_named(node)
+        return N.ReturnStatement(None if argument is None else self.expression(argument))
+
+    def throw_statement(self, node):
+        return N.ThrowStatement(self.expression(_first_named(node)))
+
+    def try_statement(self, node):
+        handler = node.child_by_field_name("handler")
+        if handler is not None:
+            param = handler.child_by_field_name("parameter")
+            if param is None:
+                # optional catch binding
+                raise Unsupported("catch_clause")
+            handler = N.CatchClause(
+                self.pattern(param), self.block(handler.child_by_field_name("body"))
+            )
+        finalizer = node.child_by_field_name("finalizer")
+        if finalizer is not None:
+            finalizer = self.block(finalizer.child_by_field_name("body"))
+        return N.TryStatement(self.block(node.child_by_field_name("body")), handler, finalizer)
+
+    def switch_statement(self, node):
+        cases = []
+        for case in _named(node.child_by_field_name("body")):
+            test = case.child_by_field_name("value")
+            consequent = [c for c in _named(case) if c != test]
+            cases.append(
+                N.SwitchCase(
+                    None if test is None else self.expression(test),
+                    self.statement_list(consequent),
+                )
+            )
+        return N.SwitchStatement(self.expression(node.child_by_field_name("value")), cases)
+
+    # functions and classes
+
+    def params(self, node):
+        params = []
+        for param in _named(node):
+            if param.type == "rest_pattern":
+                params.append(N.RestElement(self.pattern(_first_named(param))))
+            else:
+                params.append(self.pattern(param))
+        return params
+
+    def function(self, node):
+        mods = _modifiers(node)
+        generator = node.type.startswith("generator_")
+        name = node.child_by_field_name("name")
+        if name is not None:
+            name = self.identifier(name)
+        params = self.params(node.child_by_field_name("parameters"))
+        body = self.function_body(node.child_by_field_name("body"))
+        declaration = node.type.endswith("_declaration")
+        if "async" in mods:
+            if generator:
+                raise Unsupported("async generator")
+            if declaration:
+                return N.AsyncFunctionDeclaration(name, params, body)
+            return N.AsyncFunctionExpression(name, params, body)
+        if declaration:
+            return N.FunctionDeclaration(name, params, body, generator)
+        return N.FunctionExpression(name, params, body, generator)
+
+    def arrow_function(self, node):
+        is_async = "async" in _modifiers(node)
+        param = node.child_by_field_name("parameter")
+        if param is not None:
+            params = [self.identifier(param)]
+        else:
+            # parsed as a parenthesized expression (or call arguments if async)
+            # and reinterpreted, but for a rest parameter of a plain arrow
+            params = []
+            for param in _named(node.child_by_field_name("parameters")):
+                if param.type == "rest_pattern" and not is_async:
+                    params.append(N.RestElement(self.pattern(_first_named(param))))
+                else:
+                    params.append(_reinterpret(self.cover(param)))
+        body = node.child_by_field_name("body")
+        if body.type == "statement_block":
+            body = self.function_body(body)
+        else:
+            body = self.expression(body)
+        expression = body.type != Syntax.BlockStatement
+        if is_async:
+            return N.AsyncArrowFunctionExpression(params, body, expression)
+        return N.ArrowFunctionExpression(params, body, expression)
+
+    def method(self, node, mods):
+        params = self.params(node.child_by_field_name("parameters"))
+        body = self.function_body(node.child_by_field_name("body"))
+        if "async" in mods:
+            if "*" in mods:
+                raise Unsupported("async generator")
+            return N.AsyncFunctionExpression(None, params, body)
+        return N.FunctionExpression(None, params, body, "*" in mods)
+
+    def klass(self, node):
+        name = node.child_by_field_name("name")
+        if name is not None:
+            name = self.identifier(name)
+        superclass = None
+        elements = []
+        for child in _named(node):
+            if child.type == "class_heritage":
+                superclass = self.expression(_first_named(child))
+            elif child.type == "class_body":
+                elements = [self.class_element(c) for c in _named(child)]
+            elif child.type == "decorator":
+                raise Unsupported(child.type)
+        body = N.ClassBody(elements)
+        if node.type == "class_declaration":
+            return N.ClassDeclaration(name, superclass, body)
+        return N.ClassExpression(name, superclass, body)
+
+    def class_element(self, node):
+        if node.type != "method_definition":
+            # fields and static blocks
+            raise Unsupported(node.type)
+        mods = _modifiers(node)
+        key, computed = self.property_key(node.child_by_field_name("name"))
+        value = self.method(node, mods)
+        is_static = "static" in mods
+        if "get" in mods or "set" in mods:
+            kind = "get" if "get" in mods else "set"
+        else:
+            kind = "method"
+        if not computed and not is_static and _is_key(key, "constructor"):
+            kind = "constructor"
+        return N.MethodDefinition(key, computed, value, kind, is_static)
+
+    # patterns
+
+    def pattern(self, node):
+        """Binding pattern, as in declarations and parameters."""
+        typ = node.type
+        if typ in ("identifier", "undefined"):
+            return self.identifier(node)
+        if typ == "assignment_pattern":
+            return N.AssignmentPattern(
+                self.pattern(node.child_by_field_name("left")),
+                self.expression(node.child_by_field_name("right")),
+            )
+        if typ == "array_pattern":
+            return N.ArrayPattern(self.elements(node, self.array_pattern_element))
+        if typ == "object_pattern":
+            return N.ObjectPattern([self.property_pattern(c) for c in _named(node)])
+        raise Unsupported(typ)
+
+    def array_pattern_element(self, node):
+        if node.type == "rest_pattern":
+            return N.RestElement(self.pattern(_first_named(node)))
+        return self.pattern(node)
+
+    def property_pattern(self, node):
+        typ = node.type
+        if typ == "shorthand_property_identifier_pattern":
+            name = self.identifier(node)
+            return N.Property("init", name, False, N.Identifier(name.name), False, True)
+        if typ == "object_assignment_pattern":
+            name = self.identifier(node.child_by_field_name("left"))
+            value = N.AssignmentPattern(
+                N.Identifier(name.name), self.expression(node.child_by_field_name("right"))
+            )
+            return N.Property("init", name, False, value, False, True)
+        if typ == "pair_pattern":
+            key, computed = self.property_key(node.child_by_field_name("key"))
+            value = self.pattern(node.child_by_field_name("value"))
+            return N.Property("init", key, computed, value, False, False)
+        if typ == "rest_pattern":
+            return N.RestElement(self.pattern(_first_named(node)))
+        raise Unsupported(typ)
+
+    def target(self, node):
+        """Assignment target, parsed as an expression and reinterpreted."""
+        return _reinterpret(self.cover(node))
+
+    def cover(self, node):
+        # a pattern as esprima first parses it, as an expression
+        typ = node.type
+        if typ == "array_pattern":
+            return N.ArrayExpression(self.elements(node, self.cover))
+        if typ == "object_pattern":
+            return N.ObjectExpression([self.cover_property(c) for c in _named(node)])
+        if typ == "assignment_pattern":
+            return N.AssignmentExpression(
+                "=",
+                self.cover(node.child_by_field_name("left")),
+                self.expression(node.child_by_field_name("right")),
+            )
+        if typ == "rest_pattern":
+            return N.SpreadElement(self.cover(_first_named(node)))
+        return self.expression(node)
+
+    def cover_property(self, node):
+        typ = node.type
+        if typ == "shorthand_property_identifier_pattern":
+            name = self.identifier(node)
+            return N.Property("init", name, False, N.Identifier(name.name), False, True)
+        if typ == "object_assignment_pattern":
+            name = self.identifier(node.child_by_field_name("left"))
+            value = N.AssignmentPattern(
+                N.Identifier(name.name), self.expression(node.child_by_field_name("right"))
+            )
+            return N.Property("init", name, False, value, False, True)
+        if typ == "pair_pattern":
+            key, computed = self.property_key(node.child_by_field_name("key"))
+            value = self.cover(node.child_by_field_name("value"))
+            return N.Property("init", key, computed, value, False, False)
+        if typ == "rest_pattern":
+            return N.SpreadElement(self.cover(_first_named(node)))
+        raise Unsupported(typ)
+
+    # expressions
+
+    def identifier(self, node):
+        name = self.text(node)
+        if "\\" in name:
+            name = self.lex(name).value
+        return N.Identifier(name)
+
+    def number(self, node):
+        raw = self.text(node)
+        # esprima goes through a float, exact below 2 ** 53
+        if raw.isascii() and raw.isdigit() and (raw[0] != "0" or len(raw) == 1) and len(raw) < 16:
+            return N.Literal(int(raw), raw)
+        if "_" in raw or raw[-1] in "nN":
+            # numeric separators and BigInt
+            raise Unsupported("number")
+        return N.Literal(self.lex(raw).value, raw)
+
+    def string(self, node):
+        raw = self.text(node)
+        if "\\" in raw:
+            return N.Literal(self.lex(raw).value, raw)
+        return N.Literal(raw[1:-1], raw)
+
+    def regex(self, node):
+        raw = self.text(node)
+        token = Scanner(raw, self.handler).scanRegExp()
+        return N.RegexLiteral(token.regex, raw, token.pattern, token.flags)
+
+    def template(self, node):
+        quasis = []
+        expressions = []
+        start = node.start_byte + 1
+        for child in _named(node):
+            if child.type != "template_substitution":
+                continue
+            quasis.append(self.template_element(start, child.start_byte, False))
+            expressions.append(self.expression(_first_named(child)))
+            start = child.end_byte
+        quasis.append(self.template_element(start, node.end_byte - 1, True))
+        return N.TemplateLiteral(quasis, expressions)
+
+    def template_element(self, start, end, tail):
+        raw = self.source[start:end].decode("utf-8", "surrogatepass")
+        cooked = self.lex("`" + raw + "`").cooked
+        return N.TemplateElement(raw, cooked, tail)
+
+    def parenthesized(self, node):
+        return self.expression(_first_named(node))
+
+    def sequence(self, node):
+        expressions = []
+        for child in _named(node):
+            if child.type == "sequence_expression":
+                expressions.extend(self.sequence(child).expressions)
+            else:
+                expressions.append(self.expression(child))
+        return N.SequenceExpression(expressions)
+
+    def assignment(self, node):
+        return N.AssignmentExpression(
+            "=",
+            self.target(node.child_by_field_name("left")),
+            self.expression(node.child_by_field_name("right")),
+        )
+
+    def augmented_assignment(self, node):
+        operator = node.child_by_field_name("operator").type
+        if operator in _UNSUPPORTED_OPERATORS:
+            raise Unsupported(operator)
+        return N.AssignmentExpression(
+            operator,
+            self.expression(node.child_by_field_name("left")),
+            self.expression(node.child_by_field_name("right")),
+        )
+
+    def binary(self, node):
+        operator = node.child_by_field_name("operator").type
+        if operator in _UNSUPPORTED_OPERATORS:
+            raise Unsupported(operator)
+        return N.BinaryExpression(
+            operator,
+            self.expression(node.child_by_field_name("left")),
+            self.expression(node.child_by_field_name("right")),
+        )
+
+    def unary(self, node):
+        return N.UnaryExpression(
+            node.child_by_field_name("operator").type,
+            self.expression(node.child_by_field_name("argument")),
+        )
+
+    def update(self, node):
+        operator = node.child_by_field_name("operator")
+        return N.UpdateExpression(
+            operator.type,
+            self.expression(node.child_by_field_name("argument")),
+            node.children[0] == operator,
+        )
+
+    def ternary(self, node):
+        return N.ConditionalExpression(
+            self.expression(node.child_by_field_name("condition")),
+            self.expression(node.child_by_field_name("consequence")),
+            self.expression(node.child_by_field_name("alternative")),
+        )
+
+    def arguments(self, node):
+        args = []
+        for arg in _named(node):
+            if arg.type == "spread_element":
+                args.append(N.SpreadElement(self.expression(_first_named(arg))))
+            else:
+                args.append(self.expression(arg))
+        return args
+
+    def call(self, node):
+        if node.child_by_field_name("optional_chain") is not None:
+            raise Unsupported("optional_chain")
+        callee = self.expression(node.child_by_field_name("function"))
+        args = node.child_by_field_name("arguments")
+        if args.type == "template_string":
+            return N.TaggedTemplateExpression(callee, self.template(args))
+        return N.CallExpression(callee, self.arguments(args))
+
+    def member(self, node):
+        prop = node.child_by_field_name("property")
+        if prop.type != "property_identifier" or node.child_by_field_name("optional_chain"):
+            raise Unsupported(prop.type)
+        return N.StaticMemberExpression(
+            self.expression(node.child_by_field_name("object")), self.identifier(prop)
+        )
+
+    def subscript(self, node):
+        if node.child_by_field_name("optional_chain") is not None:
+            raise Unsupported("optional_chain")
+        return N.ComputedMemberExpression(
+            self.expression(node.child_by_field_name("object")),
+            self.expression(node.child_by_field_name("index")),
+        )
+
+    def new(self, node):
+        args = node.child_by_field_name("arguments")
+        return N.NewExpression(
+            self.expression(node.child_by_field_name("constructor")),
+            [] if args is None else self.arguments(args),
+        )
+
+    def meta_property(self, node):
+        if self.text(node).replace(" ", "") != "new.target":
+            raise Unsupported("meta_property")
+        return N.MetaProperty(N.Identifier("new"), N.Identifier("target"))
+
+    def elements(self, node, convert):
+        # a comma with no element before it is a hole, a trailing comma is not
+        elements = []
+        hole = True
+        for child in node.children:
+            if child.type == ",":
+                if hole:
+                    elements.append(None)
+                hole = True
+            elif child.is_named and child.type not in _EXTRAS:
+                elements.append(convert(child))
+                hole = False
+        return elements
+
+    def array_element(self, node):
+        if node.type == "spread_element":
+            return N.SpreadElement(self.expression(_first_named(node)))
+        return self.expression(node)
+
+    def array(self, node):
+        return N.ArrayExpression(self.elements(node, self.array_element))
+
+    def property_key(self, node):
+        """Returns the key of a property and whether it is computed."""
+        typ = node.type
+        if typ == "property_identifier":
+            return self.identifier(node), False
+        if typ == "string":
+            return self.string(node), False
+        if typ == "number":
+            return self.number(node), False
+        if typ == "computed_property_name":
+            return self.expression(_first_named(node)), True
+        raise Unsupported(typ)
+
+    def object(self, node):
+        properties = []
+        for child in _named(node):
+            typ = child.type
+            if typ == "pair":
+                key, computed = self.property_key(child.child_by_field_name("key"))
+                value = self.expression(child.child_by_field_name("value"))
+                properties.append(N.Property("init", key, computed, value, False, False))
+            elif typ == "shorthand_property_identifier":
+                name = self.identifier(child)
+                properties.append(
+                    N.Property("init", name, False, N.Identifier(name.name), False, True)
+                )
+            elif typ == "method_definition":
+                mods = _modifiers(child)
+                key, computed = self.property_key(child.child_by_field_name("name"))
+                value = self.method(child, mods)
+                if "get" in mods or "set" in mods:
+                    kind = "get" if "get" in mods else "set"
+                    properties.append(N.Property(kind, key, computed, value, False, False))
+                else:
+                    properties.append(N.Property("init", key, computed, value, True, False))
+            elif typ == "spread_element":
+                properties.append(N.SpreadElement(self.expression(_first_named(child))))
+            else:
+                raise Unsupported(typ)
+        return N.ObjectExpression(properties)
+
+    def await_expression(self, node):
+        return N.AwaitExpression(self.expression(_first_named(node)))
+
+    def yield_expression(self, node):
+        argument = _first_named(node)
+        return N.YieldExpression(
+            None if argument is None else self.expression(argument), "*" in _modifiers(node)
+        )
+
+
+def _is_key(key, value):
+    # esprima's Parser.isPropertyKey
+    if key.type == Syntax.Identifier:
+        return key.name == value
+    return key.type == Syntax.Literal and key.value == value
+
+
+# nodes whose text is not tokenized further
+_INERT = frozenset(["comment", "string", "string_fragment", "template_string", "regex_pattern"])
+
+
+def _has_html_comment(source, root):
+    # HTML-like comments, which tree-sitter does not read as esprima does
+    for marker in (b"<!--", b"-->"):
+        i = source.find(marker)
+        while i != -1:
+            if root.descendant_for_byte_range(i, i + len(marker)).type not in _INERT:
+                return True
+            i = source.find(marker, i + 1)
+    return False
+
+
+class TreeSitterBackend:
+    """Parses with tree-sitter and rebuilds the esprima tree, falling back
+    to esprima for what it cannot rebuild.
+
+    Raises:
+        ImportError: if tree_sitter or tree_sitter_javascript is not installed
+    """
+
+    name = "tree-sitter"
+
+    def __init__(self):
+        import tree_sitter
+        import tree_sitter_javascript
+
+        self.parser = tree_sitter.Parser(tree_sitter.Language(tree_sitter_javascript.language()))
+        self.stats = dict(parsed=0, fallbacks=0)
+
+    def _tree(self, script, budget=None):
+        # the UTF-8 source and the root of its tree, if esprima would read it the same
+        try:
+            source = script.encode("utf-8", "surrogatepass")
+        except UnicodeEncodeError:
+            raise Unsupported("encoding") from None
+        if budget is None:
+            root = self.parser.parse(source).root_node
+        else:
+            exceeded = []
+
+            def read(offset, point):
+                # the input ends early once the budget runs out
+                if exceeded:
+                    return b""
+                try:
+                    budget.poll()
+                except BudgetExceeded as exc:
+                    exceeded.append(exc)
+                    return b""
+                return source[offset : offset + PARSE_CHUNK]
+
+            root = self.parser.parse(read).root_node
+            if exceeded:
+                raise exceeded[0]
+        if root.has_error:
+            raise Unsupported("syntax error")
+        if _has_html_comment(source, root):
+            raise Unsupported("html comment")
+        return source, root
+
+    def rebuild(self, script):
+        """Returns the esprima tree of a script.
+
+        Raises:
+            Unsupported: if it cannot be rebuilt the way esprima builds it
+        """
+        source, root = self._tree(script)
+        try:
+            return _Rebuilder(source).program(root)
+        except (RecursionError, esprima.Error) as exc:
+            raise Unsupported(type(exc).__name__) from None
+
+    def parse(self, script):
+        self.stats["parsed"] += 1
+        try:
+            return self.rebuild(script)
+        except Unsupported:
+            self.stats["fallbacks"] += 1
+        return parse_esprima(script)
+
+    def rebuild_statements(self, script, budget=None):
+        """Rebuilds the top-level statements of a script one at a time, with
+        their source offsets, as sicilian_incremental parses them.
+
+        Args:
+            script (str): JavaScript source
+            budget (sig_budget.Budget, optional): polled while parsing, ticked
+                while rebuilding and charged for the nodes of every statement.
+                Defaults to None.
+
+        Yields:
+            tuple: (esprima statement, start offset, end offset), the offsets
+                in characters of `script`
+
+        Raises:
+            Unsupported: if a statement cannot be rebuilt the way esprima
+                builds it, possibly after earlier ones were yielded
+            BudgetExceeded: if the budget runs out
+        """
+        source, root = self._tree(script, budget)
+        rebuilder = _Rebuilder(source, budget)
+        nodes = rebuilder.top_level(root)
+        statements = rebuilder.iter_statement_list(nodes, prologue=True)
+        # byte offsets to character offsets, decoding each gap once
+        pos = char_pos = 0
+        for node in nodes:
+            try:
+                stmt = next(statements)
+            except (RecursionError, esprima.Error) as exc:
+                raise Unsupported(type(exc).__name__) from None
+            if budget is not None and budget.max_nodes is not None:
+                budget.charge(_count_nodes(stmt))
+            rebuilder.built = 0
+            char_pos += len(source[pos : node.start_byte].decode("utf-8", "surrogatepass"))
+            start = char_pos
+            text = source[node.start_byte : node.end_byte]
+            char_pos += len(text.decode("utf-8", "surrogatepass"))
+            pos = node.end_byte
+            yield stmt, start, char_pos
+
+
+BACKENDS = {
+    "esprima": EsprimaBackend,
+    "tree-sitter": TreeSitterBackend,
+}
+
+_backends = {}
+
+
+def get_backend(name=DEFAULT_BACKEND):
+    """Returns the backend of a name, created once per process.
+
+    Args:
+        name (str, optional): a key of BACKENDS, or "auto" for tree-sitter
+            where it is installed and esprima otherwise. Defaults to DEFAULT_BACKEND.
+
+    Raises:
+        ImportError: if the backend asked for is not installed
+    """
+    if name not in _backends:
+        if name == "auto":
+            try:
+                _backends[name] = get_backend("tree-sitter")
+            except ImportError:
+                _backends[name] = get_backend("esprima")
+        else:
+            _backends[name] = BACKENDS[name]()
+    return _backends[name]
+
+
+def available_backends():
+    """Returns the names of the backends that are installed."""
+    names = []
+    for name in BACKENDS:
+        try:
+            get_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def _count_nodes(ast):
+    num = 0
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        num += 1
+        for value in node.__dict__.values():
+            if isinstance(value, N.Node):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(child for child in value if isinstance(child, N.Node))
+    return num
+
+
+def _test_backends(scripts):
+    """Checks that every installed backend gives the signatures esprima gives
+    on the scripts, and reports the parse throughput of each.
+
+    Args:
+        scripts (dict): scripts by name
+
+    Returns:
+        bool: whether all signatures matched
+    """
+    import sicilian
+
+    names = available_backends()
+    print(f"CHECKING PARSER BACKENDS ({', '.join(names)})...")
+    ok = True
+    expected = {}
+    for name, script in scripts.items():
+        expected[name] = sicilian.structural_signature_iter(parse_esprima(script))
+    for backend_name in names:
+        backend = get_backend(backend_name)
+        fallbacks = backend.stats["fallbacks"]
+        num_bytes = num_nodes = 0
+        elapsed = 0.0
+        mismatched = []
+        for name, script in scripts.items():
+            started = time.perf_counter()
+            ast = backend.parse(script)
+            elapsed += time.perf_counter() - started
+            num_bytes += len(script.encode("utf-8", "surrogatepass"))
+            num_nodes += _count_nodes(ast)
+            if sicilian.structural_signature_iter(ast) != expected[name]:
+                mismatched.append(name)
+        out = f"  {backend_name}..."
+        out += "matched" if not mismatched else f"MISMATCHED {', '.join(mismatched)}"
+        out += (
+            f" ({backend.stats['fallbacks'] - fallbacks} fallbacks,"
+            f" {num_bytes / elapsed / 1e6:.2f} MB/s, {num_nodes / elapsed / 1e3:.0f}k nodes/s)"
+        )
+        print(out)
+        ok = ok and not mismatched
+    if "tree-sitter" in names and scripts:
+        ok = _test_budget(scripts) and ok
+    return ok
+
+
+def _test_budget(scripts, max_seconds=0.25, size=1 << 21):
+    """Checks that a time budget stops the tree-sitter backend, parsing
+    included, on a script of `size` bytes made of the scripts.
+
+    Returns:
+        bool: whether it stopped within the budget, with a degraded signature
+    """
+    import sicilian
+    from sig_budget import Budget
+
+    script = "\n;\n".join(scripts.values())
+    script = "\n;\n".join([script] * (size // len(script) + 1))
+    budget = Budget(max_seconds=max_seconds)
+    started = time.perf_counter()
+    sig = sicilian.sign_script(script, budget=budget, parser="tree-sitter")
+    elapsed = time.perf_counter() - started
+    # time left to the next check of the clock and to hash the rest
+    ok = elapsed < max_seconds + 0.5 and sig.startswith(sicilian.DEGRADED_PREFIX)
+    out = f"  tree-sitter {len(script) / 1e6:.1f} MB in {max_seconds}s budget..."
+    out += "stopped" if ok else "NOT STOPPED"
+    print(f"{out} ({elapsed:.2f}s, {budget.statements} statements)")
+    return ok
@@ -0,0 +1,396 @@
+"""Persistent Sicilian signature server.
+
+Requests are JSON objects `{"id": ..., "script": "...", "timeout": 5.0}` and
+responses are `{"id": ..., "sig": "...", "error": null}`, framed either as
+JSON lines or as a 4-byte big-endian length followed by the JSON payload.
+Responses may arrive out of order; clients match them by `id`.
+
+Requests may also carry the `url` of the script. Its previous version is
+then kept and the next one re-signed incrementally (see
+sicilian_incremental), and the response reports the fraction of top-level
+statements reused as `reuse`. Requests for a URL go to the same worker
+when it is idle.
+
+With a budget (--max-nodes, --max-seconds, --max-memory), scripts that
+exceed it get a degraded signature (see sig_budget) and the response
+reports `degraded`: the budget exceeded and the statements signed.
+
+With a known library database (--known-libs, see sig_libdb), responses
+for scripts whose signature is in it list the releases as `known`.
+
+With --profile, responses carry the metrics of the phases of signing the
+script as `profile` (see sig_profile).
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import stat
+import struct
+import sys
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+import sicilian
+import sicilian_incremental
+import sicilian_parse
+
+# scripts are sent whole on one line, so the default 64 KiB limit is far too small
+MAX_REQUEST_SIZE = 256 * 1024 * 1024
+LEN_PREFIX = struct.Struct(">I")
+DEFAULT_MAX_WORKERS = 4
+
+
+def _worker_main(conn, parent_conn, cache_path, version, budget, parser, profile):
+    """Signs scripts received over `conn` until the parent closes it.
+
+    Args:
+        conn (multiprocessing.connection.Connection): pipe to the server
+        parent_conn (multiprocessing.connection.Connection): the server's end,
+            inherited through fork and closed so that EOF is seen when the server dies
+        cache_path (str): signature cache database, or None
+        version (str): signature version, see sicilian.HASH_SCHEMES
+        budget (sig_budget.Budget): limits per script, or None
+        parser (str): parser backend, see sicilian_parse.get_backend
+        profile (sig_profile.Profile): filled for every script, or None
+    """
+    parent_conn.close()
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # opened after the fork, SQLite connections must not cross it
+    cache = sicilian.open_cache(cache_path, version)
+    incremental = sicilian_incremental.IncrementalSigner(version, parser=parser)
+    while True:
+        try:
+            script, url = conn.recv()
+        except EOFError:
+            if cache is not None:
+                cache.close()
+            return
+        incremental.last = None
+        try:
+            sig = sicilian.sign_script(
+                script, cache, version, incremental, url, budget, parser, profile
+            )
+            extra = {}
+            if url is not None:
+                last = incremental.last
+                extra["reuse"] = last["reuse_ratio"] if last is not None else None
+            if budget is not None and budget.exceeded is not None:
+                extra["degraded"] = dict(budget=budget.exceeded, statements=budget.statements)
+            if profile is not None:
+                extra["profile"] = profile.as_dict()
+            conn.send((sig, None, extra))
+        except Exception as exc:
+            conn.send((None, f"{type(exc).__name__}: {exc}", {}))
+
+
+class Worker:
+    """A signing subprocess that can be replaced when a request times out."""
+
+    def __init__(
+        self,
+        cache_path=None,
+        version=sicilian.SIG_VERSION,
+        budget=None,
+        parser=sicilian_parse.DEFAULT_BACKEND,
+        profile=None,
+    ):
+        self.cache_path = cache_path
+        self.version = version
+        self.budget = budget
+        self.parser = parser
+        self.profile = profile
+        self.proc = None
+        self.conn = None
+        self.start()
+
+    def start(self):
+        parent_conn, child_conn = multiprocessing.Pipe()
+        self.proc = multiprocessing.Process(
+            target=_worker_main,
+            args=(
+                child_conn,
+                parent_conn,
+                self.cache_path,
+                self.version,
+                self.budget,
+                self.parser,
+                self.profile,
+            ),
+            daemon=True,
+        )
+        self.proc.start()
+        child_conn.close()
+        self.conn = parent_conn
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+    def stop(self, grace=0.0):
+        self.conn.close()
+        # an idle worker exits on EOF, give it a moment to flush its cache counters
+        self.proc.join(grace)
+        if self.proc.is_alive():
+            self.proc.kill()
+        self.proc.join()
+
+    def sign(self, script, timeout, url=None):
+        """Blocking call, run from the waiter thread pool.
+
+        Returns:
+            tuple: (signature or None, error message or None, dict of extra response fields)
+        """
+        try:
+            self.conn.send((script, url))
+            if not self.conn.poll(timeout):
+                self.restart()
+                return None, f"timeout after {timeout}s", {}
+            return self.conn.recv()
+        except (EOFError, OSError) as exc:
+            # worker died (e.g. OOM killed), replace it
+            self.restart()
+            return None, f"worker died: {exc}", {}
+
+
+class WorkerPool:
+    """Bounded pool of signing subprocesses.
+
+    Args:
+        num_workers (int): number of subprocesses
+        timeout (float): default per-request timeout in seconds
+        cache_path (str, optional): signature cache shared by the workers. Defaults to None.
+        version (str, optional): signature version. Defaults to sicilian.SIG_VERSION.
+        budget (sig_budget.Budget, optional): limits per script. Defaults to None.
+        parser (str, optional): parser backend. Defaults to sicilian_parse.DEFAULT_BACKEND.
+        profile (sig_profile.Profile, optional): profile of every script,
+            returned with the response. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        num_workers,
+        timeout,
+        cache_path=None,
+        version=sicilian.SIG_VERSION,
+        budget=None,
+        parser=sicilian_parse.DEFAULT_BACKEND,
+        profile=None,
+    ):
+        self.num_workers = num_workers
+        self.timeout = timeout
+        self.workers = [
+            Worker(cache_path, version, budget, parser, profile) for _ in range(num_workers)
+        ]
+        self.idle = list(self.workers)
+        self.available = asyncio.Condition()
+        self.waiter = ThreadPoolExecutor(max_workers=num_workers)
+
+    async def _acquire(self, url):
+        async with self.available:
+            await self.available.wait_for(lambda: len(self.idle) > 0)
+            # the worker holding the previous version of the script, if idle
+            if url is not None:
+                preferred = self.workers[zlib.crc32(url.encode()) % self.num_workers]
+                if preferred in self.idle:
+                    self.idle.remove(preferred)
+                    return preferred
+            return self.idle.pop()
+
+    async def _release(self, worker):
+        async with self.available:
+            self.idle.append(worker)
+            self.available.notify()
+
+    async def sign(self, script, timeout=None, url=None):
+        timeout = self.timeout if timeout is None else timeout
+        worker = await self._acquire(url)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.waiter, worker.sign, script, timeout, url)
+        finally:
+            await self._release(worker)
+
+    def close(self):
+        for worker in self.workers:
+            worker.stop(grace=1.0)
+        self.waiter.shutdown(wait=False)
+
+
+async def read_request(reader, framing):
+    """Reads one framed request.
+
+    Returns:
+        bytes: the JSON payload, or None at EOF
+    """
+    try:
+        if framing == "length":
+            header = await reader.readexactly(LEN_PREFIX.size)
+            (size,) = LEN_PREFIX.unpack(header)
+            return await reader.readexactly(size)
+        while True:
+            line = await reader.readline()
+            if len(line) == 0:
+                return None
+            if line.strip():
+                return line
+    except asyncio.IncompleteReadError:
+        return None
+
+
+def encode_response(resp, framing):
+    payload = json.dumps(resp).encode()
+    if framing == "length":
+        return LEN_PREFIX.pack(len(payload)) + payload
+    return payload + b"\n"
+
+
+async def handle_request(payload, pool, send, libs=None):
+    req_id = None
+    started = time.monotonic()
+    try:
+        req = json.loads(payload)
+        req_id = req.get("id")
+        sig, error, extra = await pool.sign(req["script"], req.get("timeout"), req.get("url"))
+    except (ValueError, KeyError, TypeError, AttributeError) as exc:
+        sig, error, extra = None, f"bad request: {exc}", {}
+    resp = dict(
+        id=req_id,
+        sig=sig if sig is not None else "",
+        error=error,
+        elapsed=round(time.monotonic() - started, 4),
+    )
+    resp.update(extra)
+    if libs is not None and sig:
+        known = libs.lookup(sig)
+        if known:
+            resp["known"] = known
+    await send(resp)
+
+
+async def serve_stream(reader, writer, pool, pending, framing, libs=None):
+    """Serves requests from one connection until EOF.
+
+    `pending` bounds the number of requests in flight across all
+    connections; once it is exhausted we stop reading, which pushes
+    back on the clients through the socket/pipe buffers.
+    """
+    write_lock = asyncio.Lock()
+    tasks = set()
+
+    async def send(resp):
+        async with write_lock:
+            writer.write(encode_response(resp, framing))
+            await writer.drain()
+
+    async def run(payload):
+        try:
+            await handle_request(payload, pool, send, libs)
+        finally:
+            pending.release()
+
+    while True:
+        await pending.acquire()
+        payload = await read_request(reader, framing)
+        if payload is None:
+            pending.release()
+            break
+        task = asyncio.create_task(run(payload))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class _StdoutWriter:
+    """Minimal StreamWriter stand-in for a stdout that is not a pipe."""
+
+    def write(self, data):
+        sys.stdout.buffer.write(data)
+        sys.stdout.buffer.flush()
+
+    async def drain(self):
+        pass
+
+
+def _is_pipe(f):
+    mode = os.fstat(f.fileno()).st_mode
+    return stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode)
+
+
+async def _open_stdio():
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=MAX_REQUEST_SIZE)
+    if _is_pipe(sys.stdin):
+        # the pipe transport pauses reading when the buffer fills,
+        # which is what propagates backpressure to the client
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    else:
+        # regular file or tty, nothing to push back on
+        reader.feed_data(await loop.run_in_executor(None, sys.stdin.buffer.read))
+        reader.feed_eof()
+    if not _is_pipe(sys.stdout):
+        return reader, _StdoutWriter()
+    w_transport, w_protocol = await loop.connect_write_pipe(
+        asyncio.streams.FlowControlMixin, sys.stdout
+    )
+    writer = asyncio.StreamWriter(w_transport, w_protocol, reader, loop)
+    return reader, writer
+
+
+async def _serve(args):
+    num_workers = args.workers or min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+    budget = sicilian.budget_from_args(args)
+    libs = None
+    if args.known_libs:
+        import sig_libdb
+
+        libs = sig_libdb.LibraryDB(args.known_libs)
+        if libs.version != args.hash:
+            sys.exit(f"{args.known_libs} holds {libs.version} signatures, not {args.hash}")
+    profile = sicilian.profile_from_args(args)
+    pool = WorkerPool(
+        num_workers, args.timeout, args.cache, args.hash, budget, args.parser, profile
+    )
+    pending = asyncio.Semaphore(max(1, args.max_pending))
+    where = args.socket if args.socket else "stdin"
+    print(
+        f"sicilian server on {where} framing={args.framing} workers={num_workers} "
+        f"timeout={args.timeout}s max_pending={args.max_pending} hash={args.hash} "
+        f"parser={sicilian_parse.get_backend(args.parser).name}",
+        file=sys.stderr,
+    )
+    try:
+        if args.socket is None:
+            reader, writer = await _open_stdio()
+            await serve_stream(reader, writer, pool, pending, args.framing, libs)
+            return
+
+        async def on_connect(reader, writer):
+            try:
+                await serve_stream(reader, writer, pool, pending, args.framing, libs)
+            finally:
+                writer.close()
+
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+        server = await asyncio.start_unix_server(
+            on_connect, path=args.socket, limit=MAX_REQUEST_SIZE
+        )
+        async with server:
+            await server.serve_forever()
+    finally:
+        pool.close()
+        if libs is not None:
+            libs.close()
+
+
+def serve(args):
+    """Runs the server with the options parsed by `sicilian.parse_args`."""
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
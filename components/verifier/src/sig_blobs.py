@@ -0,0 +1,276 @@
+"""Content-addressed store of the response bodies of HAR files.
+
+The proxy (SaveHAR, har_blobs option) can write every response body once
+into a store shared by all its HAR files, instead of into each of them:
+the content of an entry then only carries the SHA-256 of the body,
+
+  "content": {"size": 1234, "mimeType": "...", "_blob": "<hex digest>"}
+
+and the third-party scripts every site loads are stored once per crawl
+(and across crawls) rather than once per site.
+
+Blobs are files named after their digest, sharded in two levels of
+directories (ab/cd/abcd...) so that no directory grows too large, and
+written once: aside, fsynced, then linked into place, so that a blob
+either exists whole or not at all and concurrent writers of the same
+body do not clash. Bodies are stored as they are, decoded of their
+Content-Encoding.
+
+Readers resolve references lazily: entries read with sig_har carry the
+digests only, a body is read from the store when `content_body` is
+asked for it. Blobs no HAR file refers to any more are removed by `gc`.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+import time
+
+import sig_har
+
+# blobs younger than this are kept by gc, as the HAR files of flows still
+# being recorded refer to them before they are written
+GC_GRACE = 3600.0
+_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+
+
+def content_ref(content):
+    """Digest an entry content refers to, or None."""
+    return content.get("_blob")
+
+
+def iter_refs(path):
+    """Yields the digests the entries of a HAR file refer to."""
+    for entry in sig_har.iter_entries(path):
+        digest = content_ref(entry.get("response", {}).get("content", {}))
+        if digest:
+            yield digest
+
+
+def content_body(content, store=None):
+    """Body of an entry content, inline or read from the store it refers to.
+
+    Args:
+        content (dict): content of the response of a HAR entry
+        store (BlobStore, optional): store of the referenced bodies. Defaults to None.
+
+    Returns:
+        bytes: the body, None for a content without one (or a reference without a store)
+
+    Raises:
+        KeyError: the referenced blob is not in the store
+    """
+    digest = content_ref(content)
+    if digest:
+        return None if store is None else store.get(digest)
+    if "text" not in content:
+        return None
+    if content.get("encoding") == "base64":
+        return base64.b64decode(content["text"])
+    return content["text"].encode("utf-8", "surrogatepass")
+
+
+def content_text(content, store=None):
+    """Body of an entry content as text, see content_body."""
+    data = content_body(content, store)
+    return None if data is None else data.decode("utf-8", errors="replace")
+
+
+class BlobStore:
+    """Write-once blobs keyed by their SHA-256, under a directory.
+
+    Args:
+        root (str): directory of the store, created if missing
+    """
+
+    def __init__(self, root):
+        self.root = str(root)
+        os.makedirs(self.root, exist_ok=True)
+
+    def path(self, digest):
+        """Path of the blob of a hex digest."""
+        if not _DIGEST.match(digest):
+            raise ValueError(f"not a blob digest: {digest!r}")
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def put(self, data):
+        """Stores data unless already there.
+
+        A blob already stored has its modification time renewed, so that
+        gc keeps it while the HAR files referring to it are written.
+
+        Returns:
+            str: hex digest of data
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        try:
+            os.utime(path)
+            return digest
+        except FileNotFoundError:
+            pass
+        shard = os.path.dirname(path)
+        os.makedirs(shard, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=shard, prefix=".", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            # unlike a rename, fails rather than replacing a blob another writer stored
+            os.link(tmp_path, path)
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(tmp_path)
+        return digest
+
+    def get(self, digest):
+        """Bytes of a blob, KeyError if it is not stored."""
+        try:
+            with open(self.path(digest), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            raise KeyError(digest) from None
+
+    def __contains__(self, digest):
+        return os.path.exists(self.path(digest))
+
+    def __iter__(self):
+        """Yields the digests of the blobs stored."""
+        for root, dirs, files in os.walk(self.root):
+            dirs.sort()
+            for name in sorted(files):
+                if _DIGEST.match(name):
+                    yield name
+
+    def stats(self):
+        """Returns the number of blobs and their total size in bytes."""
+        blobs = size = 0
+        for digest in self:
+            blobs += 1
+            size += os.path.getsize(self.path(digest))
+        return dict(blobs=blobs, bytes=size)
+
+    def gc(self, har_paths, grace=GC_GRACE, dry_run=False):
+        """Removes the blobs none of the HAR files refers to.
+
+        Args:
+            har_paths (iterable): every HAR file whose blobs are kept
+            grace (float, optional): seconds since their last write (or
+                reference, see put) during which blobs are kept anyway.
+                Defaults to GC_GRACE.
+            dry_run (bool, optional): only count what would be removed. Defaults to False.
+
+        Returns:
+            dict: blobs kept and removed, bytes freed, and references to
+                blobs missing from the store
+        """
+        referenced = set()
+        for har_path in har_paths:
+            referenced.update(iter_refs(har_path))
+        cutoff = time.time() - grace
+        kept = removed = freed = 0
+        for digest in self:
+            if digest in referenced:
+                kept += 1
+                continue
+            path = self.path(digest)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if st.st_mtime > cutoff:
+                kept += 1
+                continue
+            if not dry_run:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    continue
+            removed += 1
+            freed += st.st_size
+        missing = sum(1 for digest in referenced if digest not in self)
+        return dict(kept=kept, removed=removed, bytes_freed=freed, missing=missing)
+
+
+def _test_blobs():
+    """Checks storing, resolving and collecting the bodies of HAR files.
+
+    Returns:
+        bool: whether every body read back and gc removed only the unreferenced blobs
+    """
+    print(f"CHECKING BLOB STORE...")
+    bodies = [b"var a = 1;", b"var b = 2;", b"\x00\xff binary"]
+    with tempfile.TemporaryDirectory() as tmp:
+        store = BlobStore(os.path.join(tmp, "blobs"))
+        digests = [store.put(body) for body in bodies]
+        once = store.put(bodies[0]) == digests[0] and len(list(store)) == len(bodies)
+        print(f"  write once...{'matched' if once else 'MISMATCHED'}")
+        # the last body is not referenced by any HAR file
+        entries = [
+            dict(request=dict(url=f"https://example.com/{i}.js"), response=dict(content=dict(_blob=d)))
+            for i, d in enumerate(digests[:2])
+        ]
+        entries.append(
+            dict(request=dict(url="https://example.com/x"), response=dict(content=dict(text="x")))
+        )
+        har = dict(log=dict(version="1.2", creator=dict(name="test"), pages=[], entries=entries))
+        har_path = os.path.join(tmp, "0-example.com.zhar")
+        sig_har.write_har(har_path, sig_har.encode_har(har, "ndjson"), "zlib")
+        read = [content_body(e["response"]["content"], store) for e in sig_har.iter_entries(har_path)]
+        resolved = read == bodies[:2] + [b"x"]
+        print(f"  lazy references...{'matched' if resolved else 'MISMATCHED'}")
+        young = store.gc([har_path])
+        result = store.gc([har_path], grace=0)
+        collected = (
+            young["removed"] == 0
+            and (result["kept"], result["removed"], result["missing"]) == (2, 1, 0)
+            and digests[2] not in store
+            and digests[0] in store
+        )
+        print(f"  garbage collection...{'matched' if collected else 'MISMATCHED'}")
+    return once and resolved and collected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or collect a blob store of HAR bodies.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    gc_parser = sub.add_parser("gc", help="remove the blobs no HAR file refers to")
+    gc_parser.add_argument("store", help="blob store directory")
+    gc_parser.add_argument(
+        "hars", nargs="+", help="HAR files or directories of them, every one referring to the store"
+    )
+    gc_parser.add_argument(
+        "--grace",
+        type=float,
+        default=GC_GRACE,
+        help=f"keep blobs written or referenced in the last seconds (default: {GC_GRACE:.0f})",
+    )
+    gc_parser.add_argument(
+        "--dry-run", action="store_true", help="only report what would be removed"
+    )
+    stats_parser = sub.add_parser("stats", help="print the number and size of the blobs")
+    stats_parser.add_argument("store", help="blob store directory")
+    cat_parser = sub.add_parser("cat", help="write a blob to stdout")
+    cat_parser.add_argument("store", help="blob store directory")
+    cat_parser.add_argument("digest", help="hex digest")
+    args = parser.parse_args()
+    store = BlobStore(args.store)
+    if args.command == "gc":
+        har_paths = [p for path in args.hars for p in sig_har.iter_har_files(path)]
+        result = store.gc(har_paths, args.grace, args.dry_run)
+        print(json.dumps(dict(har_files=len(har_paths), dry_run=args.dry_run, **result)))
+    elif args.command == "stats":
+        print(json.dumps(store.stats()))
+    else:
+        sys.stdout.buffer.write(store.get(args.digest))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Limits on the work spent signing a script.
+
+Budgets are charged by the parser delegate (one unit per AST node), or
+per statement rebuilt by the tree-sitter backend, and ticked by the
+tree-sitter rebuilder and the flattening loop. The clock and the resident
+set are only read every CHECK_EVERY nodes, so a budget costs a counter
+decrement per node, and between the chunks of source tree-sitter parses.
+"""
+
+import os
+import time
+
+
+class BudgetExceeded(Exception):
+    def __init__(self, reason):
+        super().__init__(f"{reason} budget exceeded")
+        self.reason = reason
+
+
+def _rss():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        # peak rather than current, in KiB on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class Budget:
+    """Limits on the work spent signing one script.
+
+    When a limit is reached the script is signed as far as it got: the
+    signature covers the top-level statements processed so far and a hash
+    of the remaining source, and starts with sicilian.DEGRADED_PREFIX. After a call,
+    `exceeded` holds the limit that was reached (or None) and `statements`
+    the number of statements covered.
+
+    Args:
+        max_nodes (int, optional): AST nodes parsed. Defaults to None.
+        max_seconds (float, optional): wall time. Defaults to None.
+        max_memory (int, optional): growth of the resident set, in bytes. Defaults to None.
+    """
+
+    # nodes between two checks of the clock and the resident set
+    CHECK_EVERY = 1024
+
+    def __init__(self, max_nodes=None, max_seconds=None, max_memory=None):
+        self.max_nodes = max_nodes
+        self.max_seconds = max_seconds
+        self.max_memory = max_memory
+        self.start()
+
+    def start(self):
+        self.nodes = 0
+        self.exceeded = None
+        self.statements = None
+        self._countdown = self.CHECK_EVERY
+        self.deadline = None
+        if self.max_seconds is not None:
+            self.deadline = time.monotonic() + self.max_seconds
+        self.rss_limit = None
+        if self.max_memory is not None:
+            self.rss_limit = _rss() + self.max_memory
+
+    def _exceed(self, reason):
+        self.exceeded = reason
+        raise BudgetExceeded(reason)
+
+    def charge(self, num=1):
+        """Accounts for parsed nodes."""
+        self.nodes += num
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            self._exceed("nodes")
+        self.tick()
+
+    def check(self, pending):
+        """Ticks, counting `pending` nodes parsed but not charged yet
+        against the node limit."""
+        if self.max_nodes is not None and self.nodes + pending > self.max_nodes:
+            self._exceed("nodes")
+        self.tick()
+
+    def tick(self):
+        self._countdown -= 1
+        if self._countdown > 0:
+            return
+        self._countdown = self.CHECK_EVERY
+        self.poll()
+
+    def poll(self):
+        """Checks the clock and the resident set now."""
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            self._exceed("time")
+        if self.rss_limit is not None and _rss() > self.rss_limit:
+            self._exceed("memory")
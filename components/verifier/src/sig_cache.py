@@ -0,0 +1,241 @@
+"""Content-addressed on-disk cache of structural signatures.
+
+Entries are keyed by a hash of the script bytes and the version of the
+algorithm that produced the signatures, so a repeated script costs one
+hash and one lookup instead of a parse and a tree walk. The cache is a
+SQLite database in WAL mode, which gives concurrent readers and
+serialized writers across processes. Eviction is LRU over an
+approximate byte budget.
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import time
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+# accounted per entry on top of the stored strings (row, index and page overhead)
+ENTRY_OVERHEAD = 96
+# last_access is only rewritten when older than this, so hot entries do not
+# turn every hit into a write transaction
+TOUCH_INTERVAL = 60.0
+# eviction frees down to this fraction of max_bytes
+LOW_WATER = 0.9
+BUSY_TIMEOUT_MS = 5000
+COUNTERS = ("hits", "misses", "puts", "evictions")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sigs (
+    key TEXT PRIMARY KEY,
+    sicilian_sig TEXT,
+    sicilian_sig_noliteral TEXT,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sigs_last_access ON sigs (last_access);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (name, value) VALUES ('bytes', 0);
+"""
+
+
+def script_bytes(script):
+    if isinstance(script, bytes):
+        return script
+    return script.encode("utf-8", "surrogatepass")
+
+
+class SigCache:
+    """Persistent signature cache.
+
+    Errors from the database (e.g. a writer holding the lock past the busy
+    timeout) are swallowed: lookups count as misses and stores are skipped,
+    the cache never fails the signing it sits in front of.
+
+    Args:
+        path (str): path of the SQLite database
+        version (str): algorithm version, part of every key
+        max_bytes (int, optional): approximate size budget. Defaults to DEFAULT_MAX_BYTES.
+        check_same_thread (bool, optional): only allow the creating thread to
+            use the cache, as sqlite3.connect does. Callers sharing it
+            between threads serialize their calls. Defaults to True.
+    """
+
+    def __init__(self, path, version, max_bytes=DEFAULT_MAX_BYTES, check_same_thread=True):
+        self.path = str(path)
+        self.version = version
+        self.max_bytes = max_bytes
+        self.counts = {name: 0 for name in COUNTERS}
+        self._flushed = {name: 0 for name in COUNTERS}
+        self.conn = sqlite3.connect(
+            self.path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            isolation_level=None,
+            check_same_thread=check_same_thread,
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def key(self, script):
+        """Returns the cache key of a script (str or bytes)."""
+        m = hashlib.sha256()
+        m.update(self.version.encode())
+        m.update(b"\0")
+        m.update(script_bytes(script))
+        return m.hexdigest()
+
+    def get(self, key):
+        """Looks up a key returned by `key`.
+
+        Returns:
+            dict: sicilian_sig and sicilian_sig_noliteral (either may be None), or None on a miss
+        """
+        try:
+            row = self.conn.execute(
+                "SELECT sicilian_sig, sicilian_sig_noliteral, last_access FROM sigs WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.counts["misses"] += 1
+                return None
+            now = time.time()
+            if now - row[2] > TOUCH_INTERVAL:
+                self.conn.execute("UPDATE sigs SET last_access = ? WHERE key = ?", (now, key))
+        except sqlite3.Error:
+            self.counts["misses"] += 1
+            return None
+        self.counts["hits"] += 1
+        return dict(sicilian_sig=row[0], sicilian_sig_noliteral=row[1])
+
+    def put(self, key, sicilian_sig=None, sicilian_sig_noliteral=None):
+        """Stores signatures for a key. Fields left as None keep any stored value."""
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._put(key, sicilian_sig, sicilian_sig_noliteral)
+                self._evict()
+                self._flush_counts()
+                self.conn.execute("COMMIT")
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            pass
+
+    def _put(self, key, sicilian_sig, sicilian_sig_noliteral):
+        old_size = 0
+        row = self.conn.execute(
+            "SELECT sicilian_sig, sicilian_sig_noliteral, size FROM sigs WHERE key = ?", (key,)
+        ).fetchone()
+        if row is not None:
+            sicilian_sig = sicilian_sig if sicilian_sig is not None else row[0]
+            if sicilian_sig_noliteral is None:
+                sicilian_sig_noliteral = row[1]
+            old_size = row[2]
+        size = ENTRY_OVERHEAD + len(key) + len(sicilian_sig or "") + len(sicilian_sig_noliteral or "")
+        self.conn.execute(
+            "INSERT OR REPLACE INTO sigs VALUES (?, ?, ?, ?, ?)",
+            (key, sicilian_sig, sicilian_sig_noliteral, size, time.time()),
+        )
+        self._add_bytes(size - old_size)
+        self.counts["puts"] += 1
+
+    def _add_bytes(self, delta):
+        self.conn.execute("UPDATE meta SET value = value + ? WHERE name = 'bytes'", (delta,))
+
+    def _total_bytes(self):
+        return self.conn.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0]
+
+    def _evict(self):
+        # runs inside the write transaction of `put`
+        total = self._total_bytes()
+        if total <= self.max_bytes:
+            return
+        target = total - int(self.max_bytes * LOW_WATER)
+        freed = 0
+        victims = []
+        for key, size in self.conn.execute("SELECT key, size FROM sigs ORDER BY last_access"):
+            victims.append((key,))
+            freed += size
+            if freed >= target:
+                break
+        self.conn.executemany("DELETE FROM sigs WHERE key = ?", victims)
+        self._add_bytes(-freed)
+        self.counts["evictions"] += len(victims)
+
+    def _flush_counts(self):
+        for name in COUNTERS:
+            delta = self.counts[name] - self._flushed[name]
+            if delta == 0:
+                continue
+            self.conn.execute(
+                """
+                INSERT INTO counters (name, value) VALUES (?, ?)
+                ON CONFLICT (name) DO UPDATE SET value = value + excluded.value
+                """,
+                (name, delta),
+            )
+            self._flushed[name] = self.counts[name]
+
+    def stats(self, persistent=False):
+        """Returns hit/miss statistics.
+
+        Args:
+            persistent (bool, optional): report the counters accumulated in the
+                database by every process instead of this instance's. Defaults to False.
+
+        Returns:
+            dict: counters, hit_rate, entries and bytes
+        """
+        counts = dict(self.counts)
+        if persistent:
+            self.flush()
+            counts = {name: 0 for name in COUNTERS}
+            counts.update(self.conn.execute("SELECT name, value FROM counters").fetchall())
+        lookups = counts["hits"] + counts["misses"]
+        entries = self.conn.execute("SELECT COUNT(*) FROM sigs").fetchone()[0]
+        return dict(
+            counts,
+            hit_rate=counts["hits"] / lookups if lookups else 0.0,
+            entries=entries,
+            bytes=self._total_bytes(),
+        )
+
+    def flush(self):
+        """Adds this instance's counters to the persistent ones."""
+        try:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self._flush_counts()
+            self.conn.execute("COMMIT")
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect a signature cache.")
+    parser.add_argument("path", help="cache database")
+    parser.add_argument("command", choices=["stats", "clear"])
+    args = parser.parse_args()
+    cache = SigCache(args.path, version="")
+    if args.command == "clear":
+        cache.conn.execute("DELETE FROM sigs")
+        cache.conn.execute("DELETE FROM counters")
+        cache.conn.execute("UPDATE meta SET value = 0 WHERE name = 'bytes'")
+    print(json.dumps(cache.stats(persistent=True), indent=4))
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
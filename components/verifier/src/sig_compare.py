@@ -0,0 +1,290 @@
+"""Bulk comparison of the script signatures of two crawls, with NumPy.
+
+A crawl is a directory of HAR files written by the proxy (SaveHAR), one
+per site, whose script responses carry `script_attrs.sicilian_sig`. The
+site of a file is its name without the worker prefix and the extension,
+so that `3-example.com.har` of one crawl is compared with
+`7-example.com.har` of the next.
+
+Signatures are loaded as 32-byte void values, keyed by site, and every
+comparison is a handful of sorts and set operations over whole crawls:
+
+  set difference, intersection and Jaccard similarity of the signatures
+  of each site, per site and in total;
+  changed scripts: URLs of a site served with another signature.
+
+Requires numpy.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+
+import numpy as np
+
+import sig_har
+
+SIG_LEN = 32
+SITE = np.dtype(">u4")
+# site, then signature: sorting keys groups them by site
+KEY = np.dtype((np.void, SITE.itemsize + SIG_LEN))
+# site, then hash of the URL
+URL_LEN = 8
+URL_KEY = np.dtype((np.void, SITE.itemsize + URL_LEN))
+_WORKER_PREFIX = re.compile(r"^[0-9]{1,2}-")
+
+
+def site_of(path):
+    """Site a HAR file of a crawl is about, from its name."""
+    name = os.path.basename(path)
+    for ext in (".zhar", ".har"):
+        if name.endswith(ext):
+            name = name[: -len(ext)]
+    return _WORKER_PREFIX.sub("", name)
+
+
+def _iter_script_sigs(path):
+    for entry in sig_har.iter_entries(path):
+        attrs = entry.get("response", {}).get("content", {}).get("script_attrs")
+        if attrs:
+            yield entry["request"]["url"], attrs.get("sicilian_sig")
+
+
+def _pack(sites, blobs, dtype):
+    # sites big-endian first, so that byte order is (site, blob) order
+    width = blobs.dtype.itemsize
+    buf = np.empty((len(sites), SITE.itemsize + width), dtype=np.uint8)
+    buf[:, : SITE.itemsize] = np.asarray(sites, dtype=SITE).view(np.uint8).reshape(-1, SITE.itemsize)
+    buf[:, SITE.itemsize :] = np.ascontiguousarray(blobs).view(np.uint8).reshape(-1, width)
+    return buf.reshape(-1).view(dtype)
+
+
+class Crawl:
+    """Script signatures of a crawl, as flat arrays.
+
+    Rows are scripts: `sites[i]` is the index in `site_names` of the site
+    that loaded the script, `sigs[i]` its raw signature and `urls[i]` its
+    URL. Scripts without a usable signature (not signed, degraded) are
+    only counted in `unsigned`.
+
+    Args:
+        site_names (list): names of the sites
+        sites (numpy.ndarray): site of each script
+        sigs (numpy.ndarray): signature of each script, 32-byte voids
+        urls (list): URL of each script
+        unsigned (int, optional): scripts without signature. Defaults to 0.
+    """
+
+    def __init__(self, site_names, sites, sigs, urls, unsigned=0):
+        self.site_names = site_names
+        self.sites = sites
+        self.sigs = sigs
+        self.urls = urls
+        self.unsigned = unsigned
+
+    @classmethod
+    def load(cls, path):
+        """Loads the signatures of the HAR files of a crawl directory (or of one file)."""
+        site_index = {}
+        sites, sigs, urls = [], [], []
+        unsigned = 0
+        for har_path in sig_har.iter_har_files(path):
+            site = site_index.setdefault(site_of(har_path), len(site_index))
+            for url, sig in _iter_script_sigs(har_path):
+                if not isinstance(sig, str) or len(sig) != 2 * SIG_LEN:
+                    unsigned += 1
+                    continue
+                try:
+                    sigs.append(bytes.fromhex(sig))
+                except ValueError:
+                    unsigned += 1
+                    continue
+                sites.append(site)
+                urls.append(url)
+        raw = np.frombuffer(b"".join(sigs), dtype=(np.void, SIG_LEN))
+        return cls(list(site_index), np.asarray(sites, dtype=SITE), raw, urls, unsigned)
+
+    def __len__(self):
+        return len(self.sigs)
+
+    def keys(self, site_ids=None):
+        """Distinct (site, signature) keys, sorted.
+
+        Args:
+            site_ids (numpy.ndarray, optional): id of each site of this crawl
+                to key by instead of its index. Defaults to None.
+        """
+        sites = self.sites if site_ids is None else site_ids[self.sites]
+        return np.unique(_pack(sites, self.sigs, KEY))
+
+    def url_keys(self, site_ids=None):
+        """(site, URL hash) key of every script, in row order."""
+        sites = self.sites if site_ids is None else site_ids[self.sites]
+        hashes = b"".join(
+            hashlib.blake2b(url.encode(), digest_size=URL_LEN).digest() for url in self.urls
+        )
+        return _pack(sites, np.frombuffer(hashes, dtype=(np.void, URL_LEN)), URL_KEY)
+
+
+def _key_sites(keys):
+    raw = keys.view(np.uint8).reshape(-1, KEY.itemsize)[:, : SITE.itemsize]
+    return np.ascontiguousarray(raw).view(SITE).reshape(-1)
+
+
+def _hex(sig):
+    return bytes(sig).hex()
+
+
+def align_sites(old, new):
+    """Gives the sites of two crawls common ids.
+
+    Returns:
+        tuple: site names, ids of the sites of old, ids of the sites of new
+    """
+    names = sorted(set(old.site_names) | set(new.site_names))
+    index = {name: i for i, name in enumerate(names)}
+    old_ids = np.asarray([index[name] for name in old.site_names], dtype=SITE)
+    new_ids = np.asarray([index[name] for name in new.site_names], dtype=SITE)
+    return names, old_ids, new_ids
+
+
+def compare_sets(old, new):
+    """Compares the sets of signatures of every site between two crawls.
+
+    Returns:
+        dict: site names, and per site arrays of the number of distinct
+            signatures `old`, `new`, `common`, `removed` and `added`, and
+            their Jaccard similarity (1.0 for two empty sets)
+    """
+    names, old_ids, new_ids = align_sites(old, new)
+    old_keys = old.keys(old_ids)
+    new_keys = new.keys(new_ids)
+    common = np.intersect1d(old_keys, new_keys, assume_unique=True)
+    num_sites = len(names)
+    counts = {}
+    for name, keys in (("old", old_keys), ("new", new_keys), ("common", common)):
+        counts[name] = np.bincount(_key_sites(keys), minlength=num_sites)
+    union = counts["old"] + counts["new"] - counts["common"]
+    jaccard = np.where(union > 0, counts["common"] / np.maximum(union, 1), 1.0)
+    return dict(
+        sites=names,
+        old=counts["old"],
+        new=counts["new"],
+        common=counts["common"],
+        removed=counts["old"] - counts["common"],
+        added=counts["new"] - counts["common"],
+        jaccard=jaccard,
+    )
+
+
+def changed_scripts(old, new):
+    """Finds the scripts served at the same URL of a site with another signature.
+
+    A URL loaded several times by a site counts with its first signature.
+
+    Returns:
+        list: (site, url, old hex signature, new hex signature) tuples
+    """
+    names, old_ids, new_ids = align_sites(old, new)
+    old_keys, old_rows = np.unique(old.url_keys(old_ids), return_index=True)
+    new_keys, new_rows = np.unique(new.url_keys(new_ids), return_index=True)
+    _, old_common, new_common = np.intersect1d(
+        old_keys, new_keys, assume_unique=True, return_indices=True
+    )
+    old_rows = old_rows[old_common]
+    new_rows = new_rows[new_common]
+    differs = old.sigs[old_rows] != new.sigs[new_rows]
+    return [
+        (names[new_ids[new.sites[j]]], new.urls[j], _hex(old.sigs[i]), _hex(new.sigs[j]))
+        for i, j in zip(old_rows[differs], new_rows[differs])
+    ]
+
+
+def report(old, new, changed=True):
+    """Yields one dict per site comparing two crawls, see compare_sets.
+
+    Args:
+        old (Crawl): earlier crawl
+        new (Crawl): later crawl
+        changed (bool, optional): list the changed scripts of every site. Defaults to True.
+    """
+    sets = compare_sets(old, new)
+    by_site = {}
+    if changed:
+        for site, url, old_sig, new_sig in changed_scripts(old, new):
+            by_site.setdefault(site, []).append(dict(url=url, old=old_sig, new=new_sig))
+    for i, site in enumerate(sets["sites"]):
+        rec = dict(site=site)
+        for name in ("old", "new", "common", "removed", "added"):
+            rec[name] = int(sets[name][i])
+        rec["jaccard"] = round(float(sets["jaccard"][i]), 6)
+        if changed:
+            rec["changed"] = by_site.get(site, [])
+        yield rec
+
+
+def _test_compare():
+    """Checks the comparisons on two small synthetic crawls.
+
+    Returns:
+        bool: whether every count matched
+    """
+    print(f"CHECKING CRAWL COMPARISON...")
+
+    def sig(n):
+        return hashlib.sha256(str(n).encode()).digest()
+
+    def crawl(rows):
+        names = sorted({site for site, _, _ in rows})
+        sites = np.asarray([names.index(site) for site, _, _ in rows], dtype=SITE)
+        sigs = np.frombuffer(b"".join(sig(n) for _, _, n in rows), dtype=(np.void, SIG_LEN))
+        return Crawl(names, sites, sigs, [url for _, url, _ in rows])
+
+    old = crawl([("a", "/1.js", 1), ("a", "/2.js", 2), ("b", "/1.js", 1), ("c", "/x.js", 9)])
+    new = crawl([("a", "/1.js", 1), ("a", "/2.js", 3), ("b", "/1.js", 1), ("b", "/3.js", 4)])
+    recs = {rec["site"]: rec for rec in report(old, new)}
+    ok = (
+        (recs["a"]["common"], recs["a"]["removed"], recs["a"]["added"]) == (1, 1, 1)
+        and recs["a"]["jaccard"] == round(1 / 3, 6)
+        and recs["b"]["jaccard"] == 0.5
+        and (recs["c"]["old"], recs["c"]["new"], recs["c"]["jaccard"]) == (1, 0, 0.0)
+        and [c["url"] for c in recs["a"]["changed"]] == ["/2.js"]
+        and recs["b"]["changed"] == []
+    )
+    print(f"  synthetic crawls...{'matched' if ok else 'MISMATCHED'}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the script signatures of two crawls (directories of HAR files)."
+    )
+    parser.add_argument("old", help="earlier crawl, a directory of .har/.zhar files")
+    parser.add_argument("new", help="later crawl")
+    parser.add_argument(
+        "--no-changed", action="store_true", help="do not list the changed scripts of every site"
+    )
+    args = parser.parse_args()
+    old = Crawl.load(args.old)
+    new = Crawl.load(args.new)
+    totals = dict(sites=0, old=0, new=0, common=0, removed=0, added=0, changed=0)
+    for rec in report(old, new, changed=not args.no_changed):
+        sys.stdout.write(json.dumps(rec) + "\n")
+        totals["sites"] += 1
+        for name in ("old", "new", "common", "removed", "added"):
+            totals[name] += rec[name]
+        if not args.no_changed:
+            totals["changed"] += len(rec["changed"])
+    if args.no_changed:
+        totals["changed"] = None
+    totals["unsigned"] = old.unsigned + new.unsigned
+    union = totals["old"] + totals["new"] - totals["common"]
+    totals["jaccard"] = round(totals["common"] / union, 6) if union else 1.0
+    print(json.dumps(totals), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,617 @@
+"""HAR files as the proxy writes them, and reading them back.
+
+Formats:
+
+  pretty   JSON indented by 4 spaces, as mitmproxy writes HAR files
+  compact  JSON on a single line
+  ndjson   the log without its entries on the first line, then one
+           entry per line
+
+Compressions are zlib, gzip and lzma (xz). Large outputs are split in
+BLOCK_SIZE blocks compressed in parallel on a thread pool (the three
+libraries release the GIL while compressing) and concatenated into one
+valid stream: gzip members and xz streams can be concatenated as they
+are, zlib blocks are raw deflate ended by a sync flush, each primed with
+the last 32 KiB of the block before it, between one zlib header and
+trailer (the way pigz does). A compressed file decompresses with the
+plain zlib.decompress, gzip.decompress or lzma.decompress.
+
+Readers detect the compression from the first bytes and the format from
+the first line, so the name of a file does not matter.
+
+A HAR file can be written with a sidecar index (INDEX_SUFFIX), a JSON
+document giving the byte span of every entry in the uncompressed stream
+with its URL, MIME type and script signature, and for compressed files
+where each block starts in the file. Blocks of indexed zlib files are not
+primed with the block before, so that any of them inflates on its own.
+HarReader memory-maps an indexed file and decodes only the entries asked
+for, decompressing the blocks they are in.
+"""
+
+import gzip
+import json
+import lzma
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+FORMATS = ("pretty", "compact", "ndjson")
+COMPRESSIONS = ("none", "zlib", "gzip", "lzma")
+# used where no level is given, zlib at 9 as the proxy always compressed
+DEFAULT_LEVELS = {"zlib": 9, "gzip": 9, "lzma": 6}
+BLOCK_SIZE = 4 * 1024 * 1024
+# deflate window, the dictionary of a zlib block
+WINDOW_SIZE = 32 * 1024
+GZIP_MAGIC = b"\x1f\x8b"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+# stands for the entries when encoding the rest of a document
+_ENTRIES = "\x00entries"
+
+
+def compression_for(path, compression="auto"):
+    """Compression of a HAR file: `compression`, or for "auto" zlib for .zhar paths."""
+    if compression == "auto":
+        return "zlib" if str(path).endswith(".zhar") else "none"
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"unknown compression {compression}")
+    return compression
+
+
+def encode_har(har, fmt="pretty", index=None):
+    """Yields the encoded chunks of a HAR document, one per entry.
+
+    The chunks joined are what json.dumps gives for the whole document.
+
+    Args:
+        har (dict): HAR document, {"log": {..., "entries": [...]}}
+        fmt (str, optional): one of FORMATS. Defaults to "pretty".
+        index (HarIndex, optional): index to add the span of every entry to.
+            Defaults to None.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"unknown format {fmt}")
+    entries = har["log"]["entries"]
+    offset = 0
+    if fmt == "ndjson":
+        log = dict(har["log"])
+        del log["entries"]
+        header = ndjson_header(log)
+        yield header
+        offset += len(header)
+        for entry in entries:
+            line = ndjson_line(entry)
+            if index is not None:
+                index.add(offset, len(line), entry)
+            offset += len(line)
+            yield line
+        return
+    if not entries:
+        yield encode_json(har, fmt)
+        return
+    prefix, indent, suffix = har_frame(har, fmt)
+    yield prefix
+    offset += len(prefix)
+    for num, entry in enumerate(entries):
+        if num:
+            yield b"," + indent
+            offset += 1 + len(indent)
+        data = encode_entry(entry, fmt, indent)
+        if index is not None:
+            index.add(offset, len(data), entry)
+        offset += len(data)
+        yield data
+    yield suffix
+
+
+def har_frame(har, fmt="pretty"):
+    """Returns what surrounds the entries of a pretty or compact HAR document.
+
+    Returns:
+        tuple: (bytes before the first entry, indentation of the entries,
+            bytes after the last one), the entries being separated by a
+            comma and the indentation, see encode_entry
+    """
+    doc = encode_json(dict(har, log=dict(har["log"], entries=[_ENTRIES])), fmt)
+    prefix, _, suffix = doc.partition(json.dumps(_ENTRIES).encode())
+    # what comes between the entries, e.g. the indentation of the list
+    indent = prefix[prefix.rfind(b"[") + 1 :]
+    return prefix, indent, suffix
+
+
+def encode_entry(entry, fmt, indent):
+    """Encodes an entry as in the list of entries of a HAR document, see har_frame."""
+    data = encode_json(entry, fmt)
+    if indent:
+        data = data.replace(b"\n", indent)
+    return data
+
+
+def encode_json(obj, fmt="pretty"):
+    """Encodes any JSON value as in a pretty or compact HAR file."""
+    if fmt == "pretty":
+        return json.dumps(obj, indent=4).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def ndjson_header(log):
+    """First line of an NDJSON HAR, for a log without its entries."""
+    return json.dumps(dict(log=dict(log, entries=[])), separators=(",", ":")).encode() + b"\n"
+
+
+def ndjson_line(entry):
+    return json.dumps(entry, separators=(",", ":")).encode() + b"\n"
+
+
+def _blocks(chunks, block_size):
+    # regroups chunks of any size in blocks of block_size (the last one shorter)
+    buf = bytearray()
+    for chunk in chunks:
+        buf += chunk
+        while len(buf) >= block_size:
+            yield bytes(buf[:block_size])
+            del buf[:block_size]
+    if buf:
+        yield bytes(buf)
+
+
+def _deflate_block(block, zdict, last, level):
+    if zdict:
+        c = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=zdict)
+    else:
+        c = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return c.compress(block) + c.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+class BlockCompressor:
+    """Compresses a stream in blocks compressed in parallel.
+
+    Args:
+        compression (str): one of COMPRESSIONS
+        level (int, optional): compression level (lzma preset), None for
+            DEFAULT_LEVELS. Defaults to None.
+        threads (int, optional): compressing threads, None for the number
+            of CPUs. Defaults to None.
+        block_size (int, optional): uncompressed bytes per block. Defaults to BLOCK_SIZE.
+        independent (bool, optional): do not prime zlib blocks with the one
+            before, so that each inflates on its own. Defaults to False.
+    """
+
+    def __init__(
+        self, compression, level=None, threads=None, block_size=BLOCK_SIZE, independent=False
+    ):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"unknown compression {compression}")
+        self.compression = compression
+        self.level = DEFAULT_LEVELS.get(compression) if level is None else level
+        self.threads = threads or os.cpu_count() or 1
+        self.block_size = block_size
+        self.independent = independent
+        # (offset, length) in the compressed stream of every block, see compress
+        self.blocks = []
+
+    def _compress_block(self, block, zdict, last):
+        if self.compression == "zlib":
+            return _deflate_block(block, zdict, last, self.level)
+        if self.compression == "gzip":
+            return gzip.compress(block, self.level, mtime=0)
+        return lzma.compress(block, preset=self.level)
+
+    def compress(self, chunks):
+        """Yields the compressed stream of chunks of bytes, in order.
+
+        At most twice as many blocks as threads are held at a time. Where
+        every block starts and ends in the stream is left in `blocks`.
+        """
+        self.blocks = []
+        if self.compression == "none":
+            yield from chunks
+            return
+        blocks = _blocks(chunks, self.block_size)
+        adler = zlib.adler32(b"")
+        offset = 0
+        if self.compression == "zlib":
+            # the header of a stream at this level
+            header = zlib.compress(b"", self.level)[:2]
+            offset += len(header)
+            yield header
+        in_flight = []
+        zdict = b""
+
+        def compressed(data):
+            nonlocal offset
+            self.blocks.append((offset, len(data)))
+            offset += len(data)
+            return data
+
+        with ThreadPoolExecutor(max_workers=self.threads) as pool:
+            block = next(blocks, None)
+            if block is None:
+                # still a valid stream
+                yield compressed(self._compress_block(b"", b"", True))
+            while block is not None:
+                following = next(blocks, None)
+                in_flight.append(
+                    pool.submit(self._compress_block, block, zdict, following is None)
+                )
+                if self.compression == "zlib":
+                    adler = zlib.adler32(block, adler)
+                    if not self.independent:
+                        zdict = block[-WINDOW_SIZE:]
+                block = following
+                if len(in_flight) >= 2 * self.threads:
+                    yield compressed(in_flight.pop(0).result())
+            for future in in_flight:
+                yield compressed(future.result())
+        if self.compression == "zlib":
+            yield struct.pack(">I", adler)
+
+    def write(self, f, chunks):
+        """Writes the compressed stream of chunks to a binary file.
+
+        Returns:
+            tuple: bytes read, bytes written
+        """
+        read = 0
+        written = 0
+
+        def counted(chunks):
+            nonlocal read
+            for chunk in chunks:
+                read += len(chunk)
+                yield chunk
+
+        for data in self.compress(counted(chunks)):
+            f.write(data)
+            written += len(data)
+        return read, written
+
+
+def fsync_dir(path):
+    """Makes the entries of the directory of path durable, e.g. a rename to path."""
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_durably(path, write):
+    # written aside, fsynced, then renamed, so that the file is whole once it
+    # exists; aside under a unique name, writers of the same path do not meet
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(path)),
+        prefix=f".{os.path.basename(path)}-",
+        suffix=".part",
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            result = write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    # the rename survives a crash once the directory is on disk too
+    fsync_dir(path)
+    return result
+
+
+def write_har(
+    path, chunks, compression="none", level=None, threads=None, index=None, block_size=BLOCK_SIZE
+):
+    """Writes encoded chunks to path durably: aside, fsynced, then renamed.
+
+    Args:
+        index (HarIndex, optional): index of the entries of the chunks (see
+            encode_har), saved next to the file once it is written. Defaults to None.
+
+    Returns:
+        dict: bytes (written), raw_bytes (before compression), compression
+            and seconds taken
+    """
+    started = time.monotonic()
+    compressor = BlockCompressor(
+        compression, level, threads, block_size, independent=index is not None
+    )
+    raw_bytes, written = _write_durably(path, lambda f: compressor.write(f, chunks))
+    if index is not None:
+        index.save(path, written, compression, block_size, compressor.blocks)
+    return dict(
+        bytes=written,
+        raw_bytes=raw_bytes,
+        compression=compression,
+        seconds=round(time.monotonic() - started, 4),
+    )
+
+
+def index_path(path):
+    """Path of the sidecar index of a HAR file."""
+    return f"{path}{INDEX_SUFFIX}"
+
+
+class HarIndex:
+    """Index of the entries of a HAR file, built while it is encoded.
+
+    Every entry is a row (offset, length, url, mimeType, script,
+    sicilian_sig) where the span is in the uncompressed stream, `script`
+    whether the response carries script attributes and the signature is
+    None where there is none.
+
+    Args:
+        fmt (str): format of the HAR file, one of FORMATS
+    """
+
+    def __init__(self, fmt):
+        self.fmt = fmt
+        self.entries = []
+
+    def add(self, offset, length, entry):
+        content = entry.get("response", {}).get("content", {})
+        attrs = content.get("script_attrs")
+        sig = attrs.get("sicilian_sig") if isinstance(attrs, dict) else None
+        url = entry.get("request", {}).get("url", "")
+        self.entries.append((offset, length, url, content.get("mimeType", ""), bool(attrs), sig))
+
+    def save(self, path, size, compression, block_size, blocks):
+        """Writes the index of the HAR file at path, durably.
+
+        Args:
+            path (str): HAR file
+            size (int): its size in bytes, to tell a stale index
+            compression (str): its compression
+            block_size (int): uncompressed bytes per block
+            blocks (list): (offset, length) of every compressed block
+        """
+        doc = dict(
+            version=INDEX_VERSION,
+            format=self.fmt,
+            compression=compression,
+            bytes=size,
+            block_size=block_size,
+            blocks=blocks,
+            entries=self.entries,
+        )
+        data = json.dumps(doc, separators=(",", ":")).encode()
+        _write_durably(index_path(path), lambda f: f.write(data))
+
+
+def decompress(data):
+    """Decompresses a HAR file of any compression, by its first bytes."""
+    if data.startswith(GZIP_MAGIC):
+        return gzip.decompress(data)
+    if data.startswith(XZ_MAGIC):
+        return lzma.decompress(data)
+    # zlib header: deflate method, check bits
+    if len(data) >= 2 and data[0] & 0x0F == 8 and (data[0] << 8 | data[1]) % 31 == 0:
+        return zlib.decompress(data)
+    return data
+
+
+def load_har(path):
+    """Reads a HAR file of any format and compression.
+
+    Returns:
+        dict: the HAR document, with all its entries
+    """
+    with open(path, "rb") as f:
+        data = decompress(f.read())
+    first, sep, rest = data.partition(b"\n")
+    if rest.strip():
+        try:
+            header = json.loads(first)
+        except ValueError:
+            # indented JSON, its first line is not a document
+            return json.loads(data)
+        har = dict(log=dict(header["log"], entries=[]))
+        entries = har["log"]["entries"]
+        for line in rest.splitlines():
+            if line.strip():
+                entries.append(json.loads(line))
+        return har
+    return json.loads(data)
+
+
+def iter_entries(path):
+    """Yields the entries of a HAR file of any format and compression."""
+    yield from load_har(path)["log"]["entries"]
+
+
+class HarReader:
+    """Entries of an indexed HAR file, decoded only when asked for.
+
+    The file is memory-mapped; an entry of a compressed file costs the
+    decompression of the blocks it spans (the last block read is kept, as
+    neighbouring entries are often read together).
+
+    Args:
+        path (str): HAR file written with an index, see write_har
+
+    Raises:
+        FileNotFoundError: the file has no index
+        ValueError: the index does not match the file
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        with open(index_path(self.path), "rb") as f:
+            index = json.loads(f.read())
+        if index.get("version") != INDEX_VERSION:
+            raise ValueError(f"unsupported index version {index.get('version')}")
+        self.compression = index["compression"]
+        self.format = index["format"]
+        self.block_size = index["block_size"]
+        self.blocks = index["blocks"]
+        self.rows = index["entries"]
+        self._file = open(self.path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size != index["bytes"]:
+            self._file.close()
+            raise ValueError(f"stale index for {self.path}: {index['bytes']} bytes, not {size}")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._block = (None, b"")
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _read_block(self, num):
+        if self._block[0] == num:
+            return self._block[1]
+        offset, length = self.blocks[num]
+        data = self._map[offset : offset + length]
+        if self.compression == "zlib":
+            # raw deflate, ended by a sync flush (or the final block)
+            data = zlib.decompressobj(-zlib.MAX_WBITS).decompress(data)
+        elif self.compression == "gzip":
+            data = gzip.decompress(data)
+        else:
+            data = lzma.decompress(data)
+        self._block = (num, data)
+        return data
+
+    def _read(self, offset, length):
+        if self.compression == "none":
+            return self._map[offset : offset + length]
+        first = offset // self.block_size
+        last = (offset + length - 1) // self.block_size
+        data = b"".join(self._read_block(num) for num in range(first, last + 1))
+        start = offset - first * self.block_size
+        return data[start : start + length]
+
+    def entry(self, num):
+        """Decodes the entry at position num."""
+        offset, length = self.rows[num][:2]
+        return json.loads(self._read(offset, length))
+
+    def find(self, url=None, mime=None, sig=None, scripts=False):
+        """Positions of the entries matching every criterion given.
+
+        Args:
+            url (str, optional): URL of the request
+            mime (str, optional): substring of the MIME type of the response
+            sig (str, optional): hex sicilian_sig of the script
+            scripts (bool, optional): only entries with script attributes. Defaults to False.
+        """
+        return [
+            num
+            for num, (_, _, row_url, row_mime, script, row_sig) in enumerate(self.rows)
+            if (url is None or row_url == url)
+            and (mime is None or mime in row_mime)
+            and (sig is None or row_sig == sig)
+            and (script or not scripts)
+        ]
+
+    def entries(self, nums=None):
+        """Yields the entries at the positions given, or all of them, in order."""
+        for num in range(len(self.rows)) if nums is None else nums:
+            yield self.entry(num)
+
+
+def iter_har_files(path):
+    """Yields the .har/.zhar files under a directory, in order, or path if it is a file."""
+    if os.path.isfile(path):
+        yield path
+        return
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        for name in sorted(files):
+            if name.endswith((".har", ".zhar")):
+                yield os.path.join(root, name)
+
+
+def _test_har():
+    """Checks that every format and compression reads back as written.
+
+    Returns:
+        bool: whether every HAR file read back equal
+    """
+    import tempfile
+
+    print(f"CHECKING HAR FILES...")
+    entries = [
+        dict(
+            request=dict(url=f"https://example.com/{i}.js"),
+            response=dict(content=dict(size=i, script_attrs=dict(sicilian_sig=f"{i % 7:064x}"))),
+        )
+        for i in range(2000)
+    ]
+    har = dict(log=dict(version="1.2", creator=dict(name="test"), pages=[], entries=entries))
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt in FORMATS:
+            for compression in COMPRESSIONS:
+                path = os.path.join(tmp, f"{fmt}.{compression}.har")
+                compressor = BlockCompressor(compression, threads=2, block_size=16 * 1024)
+                with open(path, "wb") as f:
+                    compressor.write(f, encode_har(har, fmt))
+                matched = load_har(path) == har
+                # and with an index, entries spanning blocks read one by one
+                index = HarIndex(fmt)
+                indexed_path = os.path.join(tmp, f"{fmt}.{compression}.indexed.har")
+                write_har(
+                    indexed_path,
+                    encode_har(har, fmt, index),
+                    compression,
+                    threads=2,
+                    index=index,
+                    block_size=16 * 1024,
+                )
+                with HarReader(indexed_path) as reader:
+                    indexed = (
+                        load_har(indexed_path) == har
+                        and list(reader.entries()) == entries
+                        and reader.find(sig=f"{3:064x}")[:2] == [3, 10]
+                        and reader.entry(reader.find(url=entries[-1]["request"]["url"])[0])
+                        == entries[-1]
+                    )
+                ok = ok and matched and indexed
+                print(
+                    f"  {fmt} {compression}...{'matched' if matched else 'MISMATCHED'}, "
+                    f"indexed...{'matched' if indexed else 'MISMATCHED'}"
+                )
+        # a second save of the same path while the first is half written
+        path = os.path.join(tmp, "same.har")
+        other = dict(log=dict(har["log"], creator=dict(name="retry"), entries=entries[:10]))
+        halfway = threading.Event()
+        resume = threading.Event()
+
+        def paused(chunks):
+            for num, chunk in enumerate(chunks):
+                # past what the file buffers
+                if num == 500:
+                    halfway.set()
+                    resume.wait()
+                yield chunk
+
+        first = threading.Thread(
+            target=write_har, args=(path, paused(encode_har(har, "compact")))
+        )
+        first.start()
+        halfway.wait()
+        write_har(path, encode_har(other, "compact"))
+        concurrent = load_har(path) == other
+        resume.set()
+        first.join()
+        concurrent = concurrent and load_har(path) == har and os.listdir(tmp).count("same.har") == 1
+        concurrent = concurrent and not [name for name in os.listdir(tmp) if name.endswith(".part")]
+        ok = ok and concurrent
+        print(f"  concurrent writers...{'matched' if concurrent else 'MISMATCHED'}")
+    return ok
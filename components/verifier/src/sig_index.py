@@ -0,0 +1,419 @@
+"""Near-duplicate index of scripts over their subtree signatures.
+
+Two scripts are compared by the Jaccard similarity of the sets of
+signatures of their subtrees (sicilian.subtree_signatures), which stays
+high when a script is edited, extended or bundled with others, where the
+signature of the whole script changes. Each set is summarized by a
+MinHash sketch of NUM_HASHES values, and sketches are split into BANDS
+bands whose hashes are indexed (locality sensitive hashing): a query only
+compares its sketch with those of the scripts it shares a band with,
+which are the ones likely to be similar, instead of with every script.
+
+Subtree signatures are already uniform hashes, so the sketch is a one
+permutation MinHash: each element falls in one of NUM_HASHES bins by its
+value and each bin keeps its minimum, with empty bins filled from the
+next non-empty one. This costs one pass over the set instead of one per
+hash function.
+
+The index is a SQLite database, like sig_cache, and can be shared by
+processes and reopened; ":memory:" gives a throwaway one.
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import sqlite3
+import sys
+from array import array
+from collections import Counter
+
+import sicilian
+import sicilian_parse
+
+NUM_HASHES = 128
+BANDS = 32
+# candidates compared with the query, the ones sharing the most bands
+MAX_CANDIDATES = 2000
+DEFAULT_TOP_K = 10
+BUSY_TIMEOUT_MS = 5000
+# bound on SQLite host parameters per statement
+_MAX_PARAMS = 900
+_EMPTY = 0xFFFFFFFF
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scripts (
+    id INTEGER PRIMARY KEY,
+    name TEXT UNIQUE NOT NULL,
+    sig TEXT,
+    subtrees INTEGER NOT NULL,
+    sketch BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS buckets (
+    bucket INTEGER NOT NULL,
+    script INTEGER NOT NULL,
+    PRIMARY KEY (bucket, script)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS buckets_script ON buckets (script);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _element(digest):
+    # digests are hex strings in the hex schemes, raw bytes otherwise
+    if len(digest) == 64:
+        return int(digest[:16], 16)
+    return int.from_bytes(digest[:8], "big")
+
+
+def sketch(digests, num_hashes=NUM_HASHES):
+    """MinHash sketch of a set of subtree signatures.
+
+    Args:
+        digests (iterable): subtree digests, as given by sicilian.subtree_signatures
+        num_hashes (int, optional): sketch length. Defaults to NUM_HASHES.
+
+    Returns:
+        array: num_hashes 32-bit values, all _EMPTY for an empty set
+    """
+    mins = [None] * num_hashes
+    for digest in digests:
+        value, bin_ = divmod(_element(digest), num_hashes)
+        if mins[bin_] is None or value < mins[bin_]:
+            mins[bin_] = value
+    filled = [i for i, value in enumerate(mins) if value is not None]
+    if not filled:
+        return array("I", [_EMPTY] * num_hashes)
+    # rotation densification: an empty bin borrows the next non-empty one,
+    # offset by the distance so that borrowed values do not collide
+    out = array("I", bytes(4 * num_hashes))
+    nxt = filled[0] + num_hashes
+    for i in range(num_hashes - 1, -1, -1):
+        if mins[i] is not None:
+            nxt = i
+            out[i] = mins[i] & 0x7FFFFFFF
+        else:
+            distance = nxt - i
+            out[i] = 0x80000000 | (distance << 24) | (mins[nxt % num_hashes] & 0xFFFFFF)
+    return out
+
+
+def similarity(sketch_a, sketch_b):
+    """Estimated Jaccard similarity of the sets of two sketches."""
+    same = sum(a == b for a, b in zip(sketch_a, sketch_b))
+    return same / len(sketch_a)
+
+
+def _buckets(sk, bands=BANDS):
+    rows = len(sk) // bands
+    keys = []
+    for band in range(bands):
+        m = hashlib.blake2b(sk[band * rows : (band + 1) * rows].tobytes(), digest_size=8)
+        m.update(band.to_bytes(2, "big"))
+        keys.append(int.from_bytes(m.digest(), "big", signed=True))
+    return keys
+
+
+def _chunks(items, size=_MAX_PARAMS):
+    items = list(items)
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class SimilarityIndex:
+    """Persistent MinHash/LSH index of script subtree signatures.
+
+    With the default 32 bands of 4 hashes, scripts of similarity 0.5 share
+    a band with probability 0.87, of similarity 0.3 with probability 0.23.
+
+    Args:
+        path (str): path of the SQLite database, or ":memory:"
+        version (str, optional): signature version, fixed when the index is
+            created, None for the one of an existing index. Defaults to sicilian.SIG_VERSION.
+        parser (str, optional): parser backend for add_script and query_script.
+            Defaults to sicilian_parse.DEFAULT_BACKEND.
+
+    Raises:
+        ValueError: if the index was created for another version or sketch shape
+    """
+
+    def __init__(
+        self, path, version=sicilian.SIG_VERSION, parser=sicilian_parse.DEFAULT_BACKEND
+    ):
+        self.path = str(path)
+        self.parser = parser
+        self.conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_MS / 1000, isolation_level=None)
+        if self.path != ":memory:":
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        expected = dict(
+            version=version or sicilian.SIG_VERSION, num_hashes=str(NUM_HASHES), bands=str(BANDS)
+        )
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO meta (name, value) VALUES (?, ?)", expected.items()
+        )
+        meta = dict(self.conn.execute("SELECT name, value FROM meta"))
+        for name, value in expected.items():
+            if meta[name] != value and (name != "version" or version is not None):
+                raise ValueError(f"index built with {name} {meta[name]}, not {value}")
+        self.version = meta["version"]
+
+    def _signatures(self, script):
+        ast = sicilian_parse.get_backend(self.parser).parse(script)
+        return sicilian.subtree_signatures(ast, self.version)
+
+    def add(self, name, digests, sig=None):
+        """Indexes a script, replacing any script of the same name.
+
+        Args:
+            name (str): name of the script, e.g. its URL
+            digests (set): its subtree signatures
+            sig (str, optional): its structural signature, returned by queries. Defaults to None.
+        """
+        self.add_many([(name, digests, sig)])
+
+    def add_many(self, entries):
+        """Indexes (name, digests, sig) entries in one transaction."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            for name, digests, sig in entries:
+                self._add(name, digests, sig)
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def _add(self, name, digests, sig):
+        self._remove(name)
+        sk = sketch(digests)
+        cur = self.conn.execute(
+            "INSERT INTO scripts (name, sig, subtrees, sketch) VALUES (?, ?, ?, ?)",
+            (name, sig, len(digests), sk.tobytes()),
+        )
+        script_id = cur.lastrowid
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO buckets (bucket, script) VALUES (?, ?)",
+            [(bucket, script_id) for bucket in _buckets(sk)],
+        )
+
+    def add_script(self, name, script):
+        """Signs and indexes a script.
+
+        Returns:
+            str: its structural signature
+        """
+        sig, digests = self._signatures(script)
+        self.add(name, digests, sig)
+        return sig
+
+    def _remove(self, name):
+        row = self.conn.execute("SELECT id FROM scripts WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return False
+        self.conn.execute("DELETE FROM buckets WHERE script = ?", row)
+        self.conn.execute("DELETE FROM scripts WHERE id = ?", row)
+        return True
+
+    def remove(self, name):
+        """Removes a script from the index, returns whether it was there."""
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            removed = self._remove(name)
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return removed
+
+    def _sketches(self, script_ids):
+        rows = []
+        for chunk in _chunks(script_ids):
+            rows.extend(
+                self.conn.execute(
+                    f"SELECT id, name, sig, sketch FROM scripts WHERE id IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+        return {row[0]: (row[1], row[2], array("I", row[3])) for row in rows}
+
+    def query(self, digests, k=DEFAULT_TOP_K, min_similarity=0.0):
+        """Finds the indexed scripts closest to a set of subtree signatures.
+
+        Only scripts sharing a band with the query are considered, so a
+        script below the LSH threshold may be missed.
+
+        Args:
+            digests (set): subtree signatures of the script looked up
+            k (int, optional): number of results. Defaults to DEFAULT_TOP_K.
+            min_similarity (float, optional): lowest similarity returned. Defaults to 0.0.
+
+        Returns:
+            list: (similarity, name, sig) tuples, most similar first
+        """
+        sk = sketch(digests)
+        buckets = _buckets(sk)
+        hits = Counter(
+            script_id
+            for (script_id,) in self.conn.execute(
+                f"SELECT script FROM buckets WHERE bucket IN ({','.join('?' * len(buckets))})",
+                buckets,
+            )
+        )
+        candidates = [script_id for script_id, _ in hits.most_common(MAX_CANDIDATES)]
+        results = []
+        for name, sig, other in self._sketches(candidates).values():
+            sim = similarity(sk, other)
+            if sim >= min_similarity:
+                results.append((sim, name, sig))
+        return heapq.nlargest(k, results, key=lambda r: (r[0], r[1]))
+
+    def query_script(self, script, k=DEFAULT_TOP_K, min_similarity=0.0):
+        """Signs a script and finds the indexed scripts closest to it, see query."""
+        _, digests = self._signatures(script)
+        return self.query(digests, k, min_similarity)
+
+    def pairs(self, min_similarity=0.5):
+        """Yields the pairs of indexed scripts at least min_similarity similar.
+
+        Pairs are found through the shared bands, as for query.
+
+        Yields:
+            tuple: (similarity, name, name)
+        """
+        seen = set()
+        cur = self.conn.execute(
+            """
+            SELECT a.script, b.script FROM buckets a
+            JOIN buckets b ON a.bucket = b.bucket AND a.script < b.script
+            ORDER BY a.script
+            """
+        )
+        batch = []
+        for pair in cur:
+            if pair in seen:
+                continue
+            seen.add(pair)
+            batch.append(pair)
+            if len(batch) >= _MAX_PARAMS // 2:
+                yield from self._verify(batch, min_similarity)
+                batch = []
+        yield from self._verify(batch, min_similarity)
+
+    def _verify(self, pairs, min_similarity):
+        sketches = self._sketches({script_id for pair in pairs for script_id in pair})
+        for a, b in pairs:
+            sim = similarity(sketches[a][2], sketches[b][2])
+            if sim >= min_similarity:
+                yield sim, sketches[a][0], sketches[b][0]
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM scripts").fetchone()[0]
+
+    def stats(self):
+        buckets = self.conn.execute("SELECT COUNT(DISTINCT bucket) FROM buckets").fetchone()[0]
+        return dict(
+            version=self.version,
+            scripts=len(self),
+            buckets=buckets,
+            num_hashes=NUM_HASHES,
+            bands=BANDS,
+        )
+
+    def close(self):
+        self.conn.close()
+
+
+def _test_index(scripts):
+    """Checks that every script is found as its own nearest neighbour, and
+    still found once edited.
+
+    Args:
+        scripts (dict): associates names to sources
+
+    Returns:
+        bool: whether every lookup found the script
+    """
+    print(f"CHECKING SIMILARITY INDEX...")
+    index = SimilarityIndex(":memory:")
+    for name, script in scripts.items():
+        index.add_script(name, script)
+    ok = True
+    for name, script in scripts.items():
+        out = f"  {name}..."
+        exact = index.query_script(script, k=1)
+        # an appended function leaves most subtrees in place
+        edited = index.query_script(script + "\nfunction __z(a) { return [a, a + 1]; }\n", k=1)
+        if exact and exact[0][:2] == (1.0, name) and edited and edited[0][1] == name:
+            out += f"found (edited {edited[0][0]:.2f})"
+        else:
+            out += f"NOT FOUND {exact[:1]} {edited[:1]}"
+            ok = False
+        print(out)
+    index.close()
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query a near-duplicate script index.")
+    parser.add_argument("path", help="index database")
+    sub = parser.add_subparsers(dest="command", required=True)
+    add = sub.add_parser("add", help="index scripts")
+    add.add_argument(
+        "source",
+        help='NDJSON file of {"id", "script"} records ("-" for stdin), '
+        "a directory of .js files or a .har/.zhar file",
+    )
+    query = sub.add_parser("query", help="find the scripts closest to a script file")
+    query.add_argument("script", help='script file, "-" for stdin')
+    query.add_argument("-k", type=int, default=DEFAULT_TOP_K, help="number of results")
+    query.add_argument("--min-similarity", type=float, default=0.0)
+    pairs = sub.add_parser("pairs", help="list the pairs of similar indexed scripts")
+    pairs.add_argument("--min-similarity", type=float, default=0.5)
+    sub.add_parser("stats", help="print the size of the index")
+    parser.add_argument(
+        "--hash",
+        default=None,
+        help="signature version of a new index (default: the existing one, or the current one)",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=["auto"] + sorted(sicilian_parse.BACKENDS),
+        default=sicilian_parse.DEFAULT_BACKEND,
+        help="parser backend",
+    )
+    args = parser.parse_args()
+    index = SimilarityIndex(args.path, args.hash, args.parser)
+    if args.command == "add":
+        import sicilian_batch
+
+        num_added = num_errors = 0
+        for item_id, script, path in sicilian_batch.iter_items(args.source):
+            try:
+                if path is not None:
+                    with open(path, encoding="utf-8", errors="surrogateescape") as f:
+                        script = f.read()
+                if isinstance(script, ValueError):
+                    raise script
+                index.add_script(str(item_id), script)
+                num_added += 1
+            except Exception as exc:
+                num_errors += 1
+                print(f"{item_id}: {type(exc).__name__}: {exc}", file=sys.stderr)
+        print(f"indexed {num_added} scripts ({num_errors} errors)", file=sys.stderr)
+    elif args.command == "query":
+        script = sys.stdin.read() if args.script == "-" else open(args.script).read()
+        for sim, name, sig in index.query_script(script, args.k, args.min_similarity):
+            print(json.dumps(dict(similarity=sim, name=name, sig=sig)))
+    elif args.command == "pairs":
+        for sim, a, b in index.pairs(args.min_similarity):
+            print(json.dumps(dict(similarity=sim, a=a, b=b)))
+    print(json.dumps(index.stats()), file=sys.stderr)
+    index.close()
+
+
+if __name__ == "__main__":
+    main()
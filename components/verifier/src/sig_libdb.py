@@ -0,0 +1,312 @@
+"""Database of the signatures of known library releases.
+
+The database is a single file of fixed-width records sorted by signature,
+searched by bisection through a read-only memory map: opening it reads
+only the header, a lookup touches a few pages, and processes mapping the
+same file share them in the page cache. It is built once from a
+catalogue of releases and replaced atomically when rebuilt.
+
+Layout (big-endian):
+
+  header   magic, signature version (32 bytes, NUL padded),
+           number of records, offset of the labels
+  records  32-byte raw signature, 4-byte label index, sorted
+  labels   JSON list of [library, version, file]
+
+Signatures of other versions, and degraded ones, are never found.
+"""
+
+import argparse
+import bisect
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+
+import sig_har
+
+MAGIC = b"SIGLIB\x00\x01"
+VERSION_LEN = 32
+HEADER = struct.Struct(f">8s{VERSION_LEN}sQQ8x")
+RECORD = struct.Struct(">32sI")
+SIG_LEN = 32
+
+
+class _Digests:
+    """Sequence view of the signatures of the records, for bisect."""
+
+    def __init__(self, mm, num_records):
+        self.mm = mm
+        self.num_records = num_records
+
+    def __len__(self):
+        return self.num_records
+
+    def __getitem__(self, i):
+        offset = HEADER.size + i * RECORD.size
+        return self.mm[offset : offset + SIG_LEN]
+
+
+def _digest(sig):
+    if not isinstance(sig, str) or len(sig) != 2 * SIG_LEN:
+        return None
+    try:
+        return bytes.fromhex(sig)
+    except ValueError:
+        return None
+
+
+class LibraryDB:
+    """Read-only view of a library signature database.
+
+    Args:
+        path (str): database file
+
+    Raises:
+        ValueError: if the file is not a library database
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        with open(self.path, "rb") as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.mm) < HEADER.size:
+            self.mm.close()
+            raise ValueError(f"{self.path} is not a library database")
+        magic, version, num_records, labels_offset = HEADER.unpack_from(self.mm)
+        if magic != MAGIC or labels_offset != HEADER.size + num_records * RECORD.size:
+            self.mm.close()
+            raise ValueError(f"{self.path} is not a library database")
+        self.version = version.rstrip(b"\0").decode()
+        self.num_records = num_records
+        self._labels_offset = labels_offset
+        self._labels = None
+        self._digests = _Digests(self.mm, num_records)
+
+    def labels(self):
+        """Returns the [library, version, file] list the records point into."""
+        if self._labels is None:
+            self._labels = json.loads(self.mm[self._labels_offset :])
+        return self._labels
+
+    def _find(self, sig):
+        digest = _digest(sig)
+        if digest is None:
+            return
+        i = bisect.bisect_left(self._digests, digest)
+        while i < self.num_records:
+            record_sig, label = RECORD.unpack_from(self.mm, HEADER.size + i * RECORD.size)
+            if record_sig != digest:
+                return
+            yield label
+            i += 1
+
+    def __contains__(self, sig):
+        return next(self._find(sig), None) is not None
+
+    def lookup(self, sig):
+        """Returns the releases a hex signature belongs to.
+
+        Returns:
+            list: dicts with library, version and file, empty if unknown
+        """
+        found = list(self._find(sig))
+        if not found:
+            return []
+        labels = self.labels()
+        return [
+            dict(library=library, version=version, file=file)
+            for library, version, file in (labels[label] for label in found)
+        ]
+
+    def __len__(self):
+        return self.num_records
+
+    def close(self):
+        self.mm.close()
+
+
+def write_db(path, entries, version):
+    """Writes a database, replacing any file at path atomically and durably.
+
+    Args:
+        path (str): database file
+        entries (iterable): (hex signature, (library, version, file)) tuples
+        version (str): signature version of the signatures
+
+    Raises:
+        ValueError: if the version does not fit in the header
+
+    Returns:
+        int: number of records written
+    """
+    label_index = {}
+    records = set()
+    for sig, label in entries:
+        digest = _digest(sig)
+        if digest is None:
+            continue
+        label = tuple(label)
+        records.add((digest, label_index.setdefault(label, len(label_index))))
+    records = sorted(records)
+    labels = json.dumps([list(label) for label in label_index]).encode()
+    encoded_version = version.encode()
+    if len(encoded_version) > VERSION_LEN:
+        # struct would truncate it
+        raise ValueError(f"signature version {version!r} is longer than {VERSION_LEN} bytes")
+
+    def write(f):
+        f.write(
+            HEADER.pack(
+                MAGIC,
+                encoded_version,
+                len(records),
+                HEADER.size + len(records) * RECORD.size,
+            )
+        )
+        for digest, label in records:
+            f.write(RECORD.pack(digest, label))
+        f.write(labels)
+
+    # readers keep the old file mapped until they reopen
+    sig_har._write_durably(path, write)
+    return len(records)
+
+
+def iter_catalogue(source):
+    """Yields ((library, version, file), script, path) for a catalogue.
+
+    The catalogue is either a directory laid out as LIBRARY/VERSION/...
+    holding `.js` files, or an NDJSON file of
+    {"library", "version", "file", "script"} records.
+    """
+    if os.path.isdir(source):
+        for library in sorted(os.listdir(source)):
+            for release in sorted(os.listdir(os.path.join(source, library))):
+                root = os.path.join(source, library, release)
+                if not os.path.isdir(root):
+                    continue
+                for dirpath, dirs, files in os.walk(root):
+                    dirs.sort()
+                    for name in sorted(files):
+                        if name.endswith(".js"):
+                            full = os.path.join(dirpath, name)
+                            yield (library, release, os.path.relpath(full, root)), None, full
+        return
+    with open(source, encoding="utf-8") as f:
+        for num, line in enumerate(f):
+            if not line.strip():
+                continue
+            try:
+                rec = json.loads(line)
+                label = (rec["library"], rec["version"], rec.get("file", ""))
+                yield label, rec["script"], None
+            except (ValueError, KeyError, TypeError) as exc:
+                print(f"skipping line {num + 1}: {exc}", file=sys.stderr)
+
+
+def _test_libdb(sigs, version):
+    """Checks that a database built from signatures finds every one of them.
+
+    Args:
+        sigs (dict): hex signatures by name
+        version (str): their signature version
+
+    Returns:
+        bool: whether every lookup found what was written
+    """
+    import tempfile
+
+    print(f"CHECKING LIBRARY DATABASE...")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "libs.bin")
+        write_db(path, [(sig, (name, "1.0", name)) for name, sig in sigs.items()], version)
+        db = LibraryDB(path)
+        ok = db.version == version
+        for name, sig in sigs.items():
+            ok = ok and dict(library=name, version="1.0", file=name) in db.lookup(sig)
+        ok = ok and db.lookup("0" * 2 * SIG_LEN) == [] and "degraded:0" not in db
+        db.close()
+    print(f"  {len(sigs)} signatures...{'found' if ok else 'NOT FOUND'}")
+    return ok
+
+
+def build(args):
+    import sicilian
+    import sicilian_batch
+
+    labels = []
+
+    def items():
+        for label, script, path in iter_catalogue(args.catalogue):
+            labels.append(label)
+            yield len(labels) - 1, script, path
+
+    version = args.hash or sicilian.SIG_VERSION
+    num_workers = args.workers or os.cpu_count() or 1
+    signer = sicilian_batch.BatchSigner(num_workers, version=version, parser=args.parser)
+    entries = []
+    num_errors = 0
+    started = time.monotonic()
+    try:
+        for result in sicilian_batch.sign_batch(items(), signer):
+            if result["error"] is not None or result["sig"].startswith(sicilian.DEGRADED_PREFIX):
+                num_errors += 1
+                print(f"{'/'.join(labels[result['id']])}: {result['error']}", file=sys.stderr)
+                continue
+            entries.append((result["sig"], labels[result["id"]]))
+    finally:
+        signer.close()
+    num_records = write_db(args.db, entries, version)
+    print(
+        f"wrote {num_records} records for {len(labels)} files ({num_errors} errors) "
+        f"in {time.monotonic() - started:.2f}s",
+        file=sys.stderr,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or query a known library database.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build_parser = sub.add_parser("build", help="sign a catalogue of library releases")
+    build_parser.add_argument("db", help="database file to write")
+    build_parser.add_argument(
+        "catalogue",
+        help="directory laid out as LIBRARY/VERSION/... or NDJSON file of "
+        '{"library", "version", "file", "script"} records',
+    )
+    build_parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    # the proxy copies this module without the engine, which is only needed to build
+    try:
+        import sicilian
+    except ImportError:
+        sicilian = None
+    build_parser.add_argument(
+        "--hash",
+        default=None,
+        choices=sorted(sicilian.HASH_SCHEMES) if sicilian is not None else None,
+        help="signature version (default: the current one)",
+    )
+    build_parser.add_argument("--parser", default="auto", help="parser backend")
+    lookup_parser = sub.add_parser("lookup", help="look up hex signatures")
+    lookup_parser.add_argument("db", help="database file")
+    lookup_parser.add_argument("sigs", nargs="+", help="hex signatures")
+    stats_parser = sub.add_parser("stats", help="print the size of a database")
+    stats_parser.add_argument("db", help="database file")
+    args = parser.parse_args()
+    if args.command == "build":
+        build(args)
+        return
+    db = LibraryDB(args.db)
+    if args.command == "lookup":
+        for sig in args.sigs:
+            print(json.dumps(dict(sig=sig, known=db.lookup(sig))))
+    else:
+        print(json.dumps(dict(version=db.version, records=len(db), releases=len(db.labels()))))
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Opt-in metrics of the phases of signing a script.
+
+A Profile passed to sicilian.sign_script records, for each phase of the
+engine it goes through:
+
+  seconds      wall time
+  nodes        nodes the phase produced or went through: the flattened
+               tree for preprocess, the nodes ordered for traverse and
+               the distinct subtrees hashed for hash
+  max_depth    depth of the flattened tree (preprocess)
+  hash_calls   digests computed (hash)
+  peak_memory  peak of the Python allocations over those at the start
+               of the phase, in bytes, when tracing memory
+
+Metrics a phase does not have are None. The phases of a whole script are
+parse, preprocess (annotation, injection and flattening, done in one pass
+by flatten_ast), traverse (postorder and node ids) and hash. Scripts
+signed statement by statement (with a URL or a budget, see
+sicilian_incremental) have no parse phase: their preprocess phase parses
+and flattens the statements it does not reuse, and their traverse phase
+includes stitching the statements into one tree. A lookup in the
+signature cache is a `cache` phase, the only one on a hit.
+
+Tracing allocations with tracemalloc slows signing down several times, so
+that peak memory is only measured when asked for; times measured at the
+same time are inflated accordingly.
+"""
+
+import contextlib
+import json
+import sys
+import time
+import tracemalloc
+
+METRICS = ("seconds", "nodes", "max_depth", "hash_calls", "peak_memory")
+
+
+class Profile:
+    """Metrics of the phases of signing one script.
+
+    After a call, `phases` holds a dict of METRICS per phase, in the order
+    they ran. The same profile can be reused, `start` clears it.
+
+    Args:
+        trace_memory (bool, optional): measure the peak memory of every
+            phase with tracemalloc. Defaults to False.
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.start()
+
+    def start(self):
+        self.phases = {}
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Times a phase. Yields its record, for the phase to fill in its counts."""
+        record = dict.fromkeys(METRICS)
+        self.phases[name] = record
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            tracemalloc.reset_peak()
+            base_memory = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = round(time.perf_counter() - started, 6)
+            if self.trace_memory:
+                record["peak_memory"] = max(0, tracemalloc.get_traced_memory()[1] - base_memory)
+                if started_tracing:
+                    tracemalloc.stop()
+
+    def as_dict(self):
+        """Returns the phases and their total time."""
+        total = sum(record["seconds"] or 0 for record in self.phases.values())
+        return dict(seconds=round(total, 6), phases=self.phases)
+
+    def log(self, out=sys.stderr, **fields):
+        """Writes the profile as one JSON line, with `fields` (e.g. the signature) added."""
+        rec = dict(event="sicilian_profile")
+        rec.update(fields)
+        rec.update(self.as_dict())
+        out.write(json.dumps(rec) + "\n")
+        out.flush()
+
+
+def _test_profile(scripts, sigs):
+    """Checks that profiling a script, whole or statement by statement,
+    leaves its signature unchanged.
+
+    Args:
+        scripts (dict): scripts by name
+        sigs (dict): their expected hex signatures
+
+    Returns:
+        bool: whether every signature matched and every phase was recorded
+    """
+    import sicilian
+    from sig_budget import Budget
+
+    print(f"CHECKING PROFILE...")
+    profile = Profile()
+    ok = True
+    for name, script in scripts.items():
+        sig = sicilian.sign_script(script, parser="esprima", profile=profile)
+        phases = profile.phases
+        matched = (
+            sig == sigs[name]
+            and list(phases) == ["parse", "preprocess", "traverse", "hash"]
+            and phases["hash"]["hash_calls"] >= phases["hash"]["nodes"] > 0
+        )
+        preprocess = dict(phases["preprocess"])
+        # statement by statement, as with a budget
+        budget = Budget(max_seconds=3600)
+        sig = sicilian.sign_script(script, budget=budget, parser="esprima", profile=profile)
+        matched = (
+            matched
+            and sig == sigs[name]
+            and list(profile.phases) == ["preprocess", "traverse", "hash"]
+            and profile.phases["hash"]["nodes"] == phases["hash"]["nodes"]
+        )
+        ok = ok and matched
+        print(
+            f"  {name}...{'matched' if matched else 'MISMATCHED'} "
+            f"({preprocess['nodes']} nodes, depth {preprocess['max_depth']})"
+        )
+    return ok